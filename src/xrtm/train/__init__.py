@@ -25,6 +25,7 @@ from xrtm.train.simulation.benchmark_artifacts import (
     ExternalBenchmarkLaneSpec,
     ExternalBenchmarkSourceSpec,
 )
+from xrtm.train.simulation.journal import ResultJournal
 from xrtm.train.simulation.replayer import TraceReplayer
 from xrtm.train.simulation.runner import BacktestRunner
 
@@ -40,5 +41,6 @@ __all__ = [
     "ExternalBenchmarkSourceSpec",
     "ExternalBenchmarkLaneSpec",
     "ExternalBenchmarkLaneResult",
+    "ResultJournal",
     "TraceReplayer",
 ]
@@ -0,0 +1,486 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Single-pass, mergeable aggregation of evaluation results into reports.
+
+Building a report after a run used to take one pass for the mean, another for
+calibration bins and another for tag slices. ``ReportAggregator`` folds each
+result into running moments, per-bin sums and per-tag child aggregators as it
+arrives, so interim reports can be produced during a run and the final report
+needs no further pass over the results. Results scored by several evaluators
+(``metadata["scores"]``) also get running moments per metric. Aggregators from
+separate shards can be combined with ``merge``. Per-node latencies
+(``metadata["node_latencies"]``) are folded into mergeable ``LatencySketch``
+histograms and summarized in ``BacktestReport.latency``. Results drawn by
+``StratifiedSampler`` carry ``metadata["sample_weight"]``; once any result is
+weighted, ``mean_score`` and the per-metric means are weighted means and, for
+stratified samples, ``summary_statistics["mean_score_se"]`` is the stratified
+standard error of the primary mean.
+Calibration bins always count items unweighted. ``ReportAggregator.state``
+gives a serializable ``AggregateState``, which reports can carry so that
+``merge_reports`` can combine shard reports produced on different machines.
+"""
+
+import math
+from collections.abc import Iterable, Mapping
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field, PrivateAttr, SerializationInfo, SerializerFunctionWrapHandler, model_serializer
+
+# From xrtm-eval
+from xrtm.eval.core.eval.definitions import EvaluationReport, EvaluationResult, ReliabilityBin
+
+from xrtm.train.simulation.artifacts import normalize_binary_outcome
+from xrtm.train.simulation.columnar import ColumnarResults
+from xrtm.train.simulation.moments import RunningMoments
+from xrtm.train.simulation.sketch import LatencySketch, SketchState
+
+__all__ = ["AggregateState", "BacktestReport", "ReportAggregator", "calibration_point", "merge_reports"]
+
+Moments = tuple[int, float, float]
+
+
+class AggregateState(BaseModel):
+    """Serializable, mergeable contents of a ``ReportAggregator``.
+
+    Moments are stored as ``(count, mean, m2)``. ``result_indices`` lists the
+    dataset positions of the aggregated results in ascending order; the
+    results themselves travel in the report.
+    """
+
+    metric_name: str
+    num_bins: int
+    slice_by_tags: bool = True
+    columnar: bool = False
+    keep_results: bool = True
+    moments: Moments = (0, 0.0, 0.0)
+    metric_moments: dict[str, Moments] = Field(default_factory=dict)
+    metric_weights: dict[str, tuple[float, float]] = Field(default_factory=dict)
+    latency: dict[str, SketchState] = Field(default_factory=dict)
+    error_count: int = 0
+    weighted: bool = False
+    weight_total: float = 0.0
+    weighted_score: float = 0.0
+    stratum_moments: dict[str, Moments] = Field(default_factory=dict)
+    stratum_weights: dict[str, float] = Field(default_factory=dict)
+    bin_counts: list[int] = Field(default_factory=list)
+    bin_predictions: list[float] = Field(default_factory=list)
+    bin_outcomes: list[float] = Field(default_factory=list)
+    result_indices: list[int] = Field(default_factory=list)
+    slices: dict[str, "AggregateState"] = Field(default_factory=dict)
+
+
+class BacktestReport(EvaluationReport):
+    """An ``EvaluationReport`` with run-level metadata such as early-stopping flags.
+
+    Reports built from a columnar aggregator leave ``results`` empty and expose
+    the per-item results through ``columns`` instead. Serializing such a report
+    writes the columns out as ``results``, so a report that travels as JSON
+    (e.g. a shard report on its way to ``merge_reports``) keeps its results.
+    """
+
+    metadata: dict[str, Any] = Field(default_factory=dict)
+    metric_reports: dict[str, EvaluationReport] = Field(
+        default_factory=dict, description="Per-metric aggregates for results scored by several evaluators"
+    )
+    latency: dict[str, dict[str, float]] = Field(
+        default_factory=dict, description="Per-node latency distribution (count, mean, p50, p90, p99, max) in seconds"
+    )
+    aggregate: Optional[AggregateState] = Field(
+        default=None, description="Mergeable aggregates for combining shard reports with merge_reports"
+    )
+    _columns: Optional[ColumnarResults] = PrivateAttr(default=None)
+
+    @model_serializer(mode="wrap")
+    def _serialize_columns(self, handler: SerializerFunctionWrapHandler, info: SerializationInfo) -> Any:
+        data = handler(self)
+        if self._columns is not None and isinstance(data, dict) and "results" in data and not data["results"]:
+            data["results"] = [result.model_dump(mode=info.mode) for result in self._columns]
+        return data
+
+    @property
+    def columns(self) -> Optional[ColumnarResults]:
+        r"""Columnar per-item results, when the report was built with ``columnar=True``."""
+        return self._columns
+
+
+def calibration_point(result: EvaluationResult) -> Optional[tuple[float, float]]:
+    r"""Return ``(clamped probability, binary outcome)`` or ``None`` if the result cannot be binned."""
+    try:
+        probability = float(result.prediction)
+        outcome = normalize_binary_outcome(result.ground_truth)
+    except (ValueError, TypeError):
+        return None
+    if not math.isfinite(probability) or outcome not in (0.0, 1.0):
+        return None
+    return min(max(probability, 0.0), 1.0), outcome
+
+
+class ReportAggregator:
+    r"""Incrementally aggregates results into a ``BacktestReport``.
+
+    Args:
+        metric_name: Metric name reported in the built reports.
+        num_bins: Number of equal-width reliability bins.
+        slice_by_tags: Whether to keep a child aggregator per ``metadata["tags"]`` entry.
+        columnar: Store results in a ``ColumnarResults`` container instead of
+            keeping the ``EvaluationResult`` objects; reports then carry them
+            in ``BacktestReport.columns``.
+        keep_results: Whether to retain the individual results at all. Tag
+            slices of a columnar aggregator only keep statistics.
+    """
+
+    def __init__(
+        self,
+        metric_name: str = "Brier Score",
+        num_bins: int = 10,
+        slice_by_tags: bool = True,
+        columnar: bool = False,
+        keep_results: bool = True,
+    ):
+        if num_bins < 1:
+            raise ValueError("num_bins must be >= 1")
+        self.metric_name = metric_name
+        self.num_bins = num_bins
+        self.slice_by_tags = slice_by_tags
+        self.columnar = columnar
+        self.keep_results = keep_results
+        self.moments = RunningMoments()
+        self.metric_moments: dict[str, RunningMoments] = {}
+        # Per metric: (total sample weight, weighted score sum).
+        self.metric_weights: dict[str, tuple[float, float]] = {}
+        self.latency_sketches: dict[str, LatencySketch] = {}
+        self.error_count = 0
+        self.weighted = False
+        self.weight_total = 0.0
+        self.weighted_score = 0.0
+        self.stratum_moments: dict[str, RunningMoments] = {}
+        self.stratum_weights: dict[str, float] = {}
+        self.slices: dict[str, "ReportAggregator"] = {}
+        self._bin_counts = [0] * num_bins
+        self._bin_predictions = [0.0] * num_bins
+        self._bin_outcomes = [0.0] * num_bins
+        self._results: dict[int, EvaluationResult] = {}
+        self._columns = ColumnarResults() if columnar else None
+        self._column_indices: list[int] = []
+
+    def update(self, result: EvaluationResult, index: Optional[int] = None) -> None:
+        r"""Fold one result into the aggregates.
+
+        Args:
+            result: The scored result.
+            index: Position of the result in the dataset; reports list results in
+                index order. Defaults to arrival order.
+        """
+        if index is None:
+            index = self.moments.count
+        if self._columns is not None:
+            self._columns.append(result)
+            self._column_indices.append(index)
+        elif self.keep_results:
+            self._results[index] = result
+        self.moments.update(result.score)
+        weight = result.metadata.get("sample_weight")
+        if weight is not None:
+            self.weighted = True
+        weight = float(weight) if weight is not None else 1.0
+        for metric, score in (result.metadata.get("scores") or {}).items():
+            self.metric_moments.setdefault(metric, RunningMoments()).update(score)
+            total, weighted_score = self.metric_weights.get(metric, (0.0, 0.0))
+            self.metric_weights[metric] = (total + weight, weighted_score + weight * score)
+        # Cached and deduplicated results replay another run's latencies; skip them.
+        if "prediction_cache_hit" not in result.metadata and "deduplicated" not in result.metadata:
+            for node, latency in (result.metadata.get("node_latencies") or {}).items():
+                self.latency_sketches.setdefault(node, LatencySketch()).update(latency)
+        if "error" in result.metadata:
+            self.error_count += 1
+        self.weight_total += weight
+        self.weighted_score += weight * result.score
+        stratum = result.metadata.get("sample_stratum")
+        if stratum is not None:
+            self.stratum_moments.setdefault(stratum, RunningMoments()).update(result.score)
+            self.stratum_weights[stratum] = self.stratum_weights.get(stratum, 0.0) + weight
+        point = calibration_point(result)
+        if point is not None:
+            probability, outcome = point
+            # Same binning as ``ExpectedCalibrationErrorEvaluator``: the epsilon
+            # keeps exact bin edges such as 0.3 out of the bin below.
+            idx = min(max(int(probability * self.num_bins + 1e-9), 0), self.num_bins - 1)
+            self._bin_counts[idx] += 1
+            self._bin_predictions[idx] += probability
+            self._bin_outcomes[idx] += outcome
+        if self.slice_by_tags:
+            for tag in result.metadata.get("tags") or ():
+                child = self.slices.get(tag)
+                if child is None:
+                    child = self.slices[tag] = self._child()
+                child.update(result, index)
+
+    def merge(self, other: "ReportAggregator") -> None:
+        r"""Combine the aggregates of another shard into this one.
+
+        Result indices must not overlap between the merged aggregators.
+        """
+        if other.num_bins != self.num_bins:
+            raise ValueError("cannot merge aggregators with different num_bins")
+        if self._columns is not None:
+            if other._columns is None:
+                self._columns.extend(other._results.values())
+                self._column_indices.extend(other._results)
+            else:
+                self._columns.extend_columns(other._columns)
+                self._column_indices.extend(other._column_indices)
+        elif not self.keep_results:
+            pass
+        elif other._columns is not None:
+            self._results.update(zip(other._column_indices, other._columns))
+        else:
+            self._results.update(other._results)
+        self.moments.merge(other.moments)
+        for metric, moments in other.metric_moments.items():
+            self.metric_moments.setdefault(metric, RunningMoments()).merge(moments)
+        for metric, (other_total, other_score) in other.metric_weights.items():
+            total, weighted_score = self.metric_weights.get(metric, (0.0, 0.0))
+            self.metric_weights[metric] = (total + other_total, weighted_score + other_score)
+        for node, sketch in other.latency_sketches.items():
+            self.latency_sketches.setdefault(node, LatencySketch()).merge(sketch)
+        self.error_count += other.error_count
+        self.weighted = self.weighted or other.weighted
+        self.weight_total += other.weight_total
+        self.weighted_score += other.weighted_score
+        for stratum, moments in other.stratum_moments.items():
+            self.stratum_moments.setdefault(stratum, RunningMoments()).merge(moments)
+            self.stratum_weights[stratum] = self.stratum_weights.get(stratum, 0.0) + other.stratum_weights[stratum]
+        for idx in range(self.num_bins):
+            self._bin_counts[idx] += other._bin_counts[idx]
+            self._bin_predictions[idx] += other._bin_predictions[idx]
+            self._bin_outcomes[idx] += other._bin_outcomes[idx]
+        for tag, child in other.slices.items():
+            if tag in self.slices:
+                self.slices[tag].merge(child)
+            elif self.slice_by_tags:
+                merged = self.slices[tag] = self._child()
+                merged.merge(child)
+
+    def _child(self) -> "ReportAggregator":
+        return ReportAggregator(self.metric_name, self.num_bins, slice_by_tags=False, keep_results=not self.columnar)
+
+    def calibration(self) -> tuple[float, list[ReliabilityBin]]:
+        r"""Return the expected calibration error and reliability bins."""
+        valid_count = sum(self._bin_counts)
+        ece = 0.0
+        bins = []
+        for idx, count in enumerate(self._bin_counts):
+            center = (idx + 0.5) / self.num_bins
+            if count == 0:
+                bins.append(ReliabilityBin(bin_center=center, mean_prediction=0.0, mean_ground_truth=0.0, count=0))
+                continue
+            mean_prediction = self._bin_predictions[idx] / count
+            mean_outcome = self._bin_outcomes[idx] / count
+            ece += (count / valid_count) * abs(mean_outcome - mean_prediction)
+            bins.append(
+                ReliabilityBin(
+                    bin_center=center, mean_prediction=mean_prediction, mean_ground_truth=mean_outcome, count=count
+                )
+            )
+        return ece, bins
+
+    def mean_score(self) -> float:
+        r"""Return the mean score, weighted by ``sample_weight`` once any result carries one."""
+        if self.weighted:
+            return self.weighted_score / self.weight_total if self.weight_total else 0.0
+        return self.moments.mean if self.moments.count else 0.0
+
+    def stratified_std_error(self) -> Optional[float]:
+        r"""Return the standard error of the weighted mean over sampled strata, or ``None`` without strata."""
+        population = sum(self.stratum_weights.values())
+        if not population:
+            return None
+        variance = 0.0
+        for stratum, moments in self.stratum_moments.items():
+            size = self.stratum_weights[stratum]
+            correction = max(1.0 - moments.count / size, 0.0)
+            variance += (size / population) ** 2 * moments.variance / moments.count * correction
+        return math.sqrt(variance)
+
+    def _metric_report(
+        self, metric: str, moments: RunningMoments, ece: float, bins: list[ReliabilityBin]
+    ) -> EvaluationReport:
+        summary = {"ece": ece, "score_std": math.sqrt(moments.variance)}
+        mean = moments.mean
+        if self.weighted:
+            total, weighted_score = self.metric_weights.get(metric, (0.0, 0.0))
+            summary["unweighted_mean_score"] = mean
+            summary["weight_total"] = total
+            mean = weighted_score / total if total else 0.0
+        return EvaluationReport(
+            metric_name=metric,
+            mean_score=mean,
+            total_evaluations=moments.count,
+            reliability_bins=bins,
+            summary_statistics=summary,
+        )
+
+    def state(self) -> AggregateState:
+        r"""Return the aggregates, including those of the tag slices, in serializable form."""
+        if self._columns is not None:
+            indices = sorted(self._column_indices)
+        else:
+            indices = sorted(self._results)
+        return AggregateState(
+            metric_name=self.metric_name,
+            num_bins=self.num_bins,
+            slice_by_tags=self.slice_by_tags,
+            columnar=self.columnar,
+            keep_results=self.keep_results,
+            moments=_moments(self.moments),
+            metric_moments={metric: _moments(moments) for metric, moments in self.metric_moments.items()},
+            metric_weights=dict(self.metric_weights),
+            latency={node: sketch.state() for node, sketch in self.latency_sketches.items()},
+            error_count=self.error_count,
+            weighted=self.weighted,
+            weight_total=self.weight_total,
+            weighted_score=self.weighted_score,
+            stratum_moments={stratum: _moments(moments) for stratum, moments in self.stratum_moments.items()},
+            stratum_weights=dict(self.stratum_weights),
+            bin_counts=list(self._bin_counts),
+            bin_predictions=list(self._bin_predictions),
+            bin_outcomes=list(self._bin_outcomes),
+            result_indices=indices,
+            slices={tag: child.state() for tag, child in self.slices.items()},
+        )
+
+    @classmethod
+    def from_state(
+        cls, state: AggregateState, results: Optional[Mapping[int, EvaluationResult]] = None
+    ) -> "ReportAggregator":
+        r"""Rebuild an aggregator from ``state()``.
+
+        Args:
+            state: The aggregates to restore.
+            results: Results by dataset position; those listed in
+                ``state.result_indices`` are restored. Without them the
+                aggregator only holds statistics.
+        """
+        aggregator = cls(state.metric_name, state.num_bins, state.slice_by_tags, state.columnar, state.keep_results)
+        aggregator.moments = RunningMoments(*state.moments)
+        aggregator.metric_moments = {
+            metric: RunningMoments(*moments) for metric, moments in state.metric_moments.items()
+        }
+        aggregator.metric_weights = dict(state.metric_weights)
+        aggregator.latency_sketches = {node: LatencySketch.from_state(sketch) for node, sketch in state.latency.items()}
+        aggregator.error_count = state.error_count
+        aggregator.weighted = state.weighted
+        aggregator.weight_total = state.weight_total
+        aggregator.weighted_score = state.weighted_score
+        aggregator.stratum_moments = {
+            stratum: RunningMoments(*moments) for stratum, moments in state.stratum_moments.items()
+        }
+        aggregator.stratum_weights = dict(state.stratum_weights)
+        aggregator._bin_counts = list(state.bin_counts)
+        aggregator._bin_predictions = list(state.bin_predictions)
+        aggregator._bin_outcomes = list(state.bin_outcomes)
+        if results is not None:
+            restored = {idx: results[idx] for idx in state.result_indices if idx in results}
+            if aggregator._columns is not None:
+                aggregator._columns.extend(restored.values())
+                aggregator._column_indices.extend(restored)
+            elif aggregator.keep_results:
+                aggregator._results = restored
+        aggregator.slices = {tag: cls.from_state(child, results) for tag, child in state.slices.items()}
+        return aggregator
+
+    def report(self, include_state: bool = False) -> BacktestReport:
+        r"""Build a report from the current aggregates; may be called at any time during a run.
+
+        Args:
+            include_state: Attach ``state()`` as ``BacktestReport.aggregate`` so
+                the report can later be combined with ``merge_reports``.
+        """
+        ece, bins = self.calibration()
+        slices: Optional[dict[str, EvaluationReport]] = None
+        if self.slice_by_tags:
+            slices = {tag: child.report() for tag, child in sorted(self.slices.items())}
+        summary = {"ece": ece, "score_std": math.sqrt(self.moments.variance)}
+        if self.weighted:
+            summary["unweighted_mean_score"] = self.moments.mean if self.moments.count else 0.0
+            summary["weight_total"] = self.weight_total
+            std_error = self.stratified_std_error()
+            if std_error is not None:
+                summary["mean_score_se"] = std_error
+        report = BacktestReport(
+            metric_name=self.metric_name,
+            mean_score=self.mean_score(),
+            total_evaluations=self.moments.count,
+            results=[self._results[idx] for idx in sorted(self._results)],
+            reliability_bins=bins,
+            summary_statistics=summary,
+            slices=slices,
+            metric_reports={
+                metric: self._metric_report(metric, moments, ece, bins)
+                for metric, moments in self.metric_moments.items()
+            },
+            latency={node: sketch.summary() for node, sketch in sorted(self.latency_sketches.items())},
+            aggregate=self.state() if include_state else None,
+        )
+        if self._columns is not None:
+            order = sorted(range(len(self._column_indices)), key=self._column_indices.__getitem__)
+            report._columns = self._columns.take(order)
+        return report
+
+
+def merge_reports(reports: Iterable[BacktestReport]) -> BacktestReport:
+    r"""Combine reports of disjoint shards into the report of the whole dataset.
+
+    Each report must carry its ``aggregate`` state (``BacktestRunner(shard=...)``
+    attaches it). Means, reliability bins, ECE, per-metric reports, latency
+    summaries and tag slices are merged from the aggregates, and results are
+    listed by their position in the full dataset. Run-level extras such as
+    bootstrap intervals and budget counters are not carried over.
+
+    Raises:
+        ValueError: If no reports are given, a report has no aggregate state or
+            two reports contain the same dataset position.
+    """
+    merged: Optional[ReportAggregator] = None
+    seen: set[int] = set()
+    shards: list[str] = []
+    for report in reports:
+        state = report.aggregate
+        if state is None:
+            raise ValueError("report has no aggregate state; build it with include_state=True or shard=")
+        results = list(report.columns) if report.columns is not None else report.results
+        if len(results) != len(state.result_indices):
+            raise ValueError("report results do not match its aggregate state")
+        if seen.intersection(state.result_indices):
+            raise ValueError("cannot merge reports with overlapping results")
+        seen.update(state.result_indices)
+        aggregator = ReportAggregator.from_state(state, dict(zip(state.result_indices, results)))
+        if merged is None:
+            merged = aggregator
+        else:
+            merged.merge(aggregator)
+        if "shard" in report.metadata:
+            shards.append(report.metadata["shard"])
+    if merged is None:
+        raise ValueError("no reports to merge")
+    report = merged.report(include_state=True)
+    if shards:
+        report.metadata["shards"] = sorted(shards)
+    return report
+
+
+def _moments(moments: RunningMoments) -> Moments:
+    return moments.count, moments.mean, moments.m2
@@ -23,7 +23,9 @@ Ensures temporal isolation to prevent look-ahead bias.
 
 import asyncio
 import logging
-from typing import List, Tuple
+import time
+from collections.abc import AsyncIterable, Iterable, Mapping, Sized
+from typing import Any, Optional, Tuple, Union
 
 # From xrtm-data
 from xrtm.data.core.schemas import ForecastQuestion
@@ -38,11 +40,22 @@ from xrtm.forecast.kit.agents.base import Agent
 from xrtm.train.simulation.artifacts import (
     prediction_value_and_payload,
     resolution_payload,
+    serialize_payload,
     validate_resolution_for_question,
 )
+from xrtm.train.simulation.cache import PredictionCache
+from xrtm.train.simulation.concurrency import AdaptiveConcurrency
+from xrtm.train.simulation.execution import BoundedExecutor
+from xrtm.train.simulation.journal import ResultJournal, item_fingerprint
+from xrtm.train.simulation.payloads import PayloadStore
+from xrtm.train.simulation.progress import ProgressMonitor
+from xrtm.train.simulation.retry import RetryPolicy
+from xrtm.train.simulation.tracing import Tracer
 
 logger = logging.getLogger(__name__)
 
+BacktestPair = Tuple[ForecastQuestion, ForecastResolution]
+
 
 class Backtester:
     r"""Orchestrates backtesting for a given agent and evaluator.
@@ -50,78 +63,213 @@ class Backtester:
     Args:
         agent: The forecasting agent to evaluate.
         evaluator: Scoring backend implementing the ``Evaluator`` protocol.
+        concurrency: Maximum number of questions evaluated concurrently.
+        queue_size: Maximum number of pairs buffered ahead of the workers.
+            Defaults to ``2 * concurrency``.
+        journal: Optional ``ResultJournal``; completed results are appended to it
+            and questions already journaled are skipped on restart.
+        prediction_cache: Optional ``PredictionCache`` consulted before calling
+            the agent. Hits are tagged ``prediction_cache_hit`` in the result
+            metadata and are not fed to ``adaptive_concurrency``.
+        cache_fingerprint: Fingerprint of the agent configuration (model,
+            prompts, parameters) used to key cached predictions. Required with
+            ``prediction_cache``.
+        adaptive_concurrency: Optional AIMD controller that replaces the fixed
+            ``concurrency`` and adapts it to observed latency and error rate.
+        item_timeout: Optional per-question limit in seconds on ``agent.run``;
+            timed-out questions are scored as failures.
+        retry_policy: Optional ``RetryPolicy`` applied to transient agent
+            failures; results then record ``attempts`` in their metadata.
+        tracer: Optional ``Tracer`` recording a span per question and per stage
+            (cache I/O, agent run, resolution validation, payload
+            serialization, scoring, journal writes). The caller closes it.
+        progress: Optional ``ProgressMonitor`` reporting completed and
+            in-flight questions, queue depth, throughput, error rate and ETA
+            at a fixed interval during ``run``.
+        payload_store: Optional ``PayloadStore``; resolution and prediction
+            payloads are spilled to it as results complete and replaced by
+            ``metadata["payload_ref"]``. The caller closes it.
     """
 
-    def __init__(self, agent: Agent, evaluator: Evaluator, concurrency: int = 5):
+    def __init__(
+        self,
+        agent: Agent,
+        evaluator: Evaluator,
+        concurrency: int = 5,
+        queue_size: Optional[int] = None,
+        journal: Optional[ResultJournal] = None,
+        prediction_cache: Optional[PredictionCache] = None,
+        cache_fingerprint: Optional[str] = None,
+        adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
+        item_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        tracer: Optional[Tracer] = None,
+        progress: Optional[ProgressMonitor] = None,
+        payload_store: Optional[PayloadStore] = None,
+    ):
         if concurrency < 1:
             raise ValueError("concurrency must be >= 1")
+        if item_timeout is not None and item_timeout <= 0:
+            raise ValueError("item_timeout must be > 0")
+        if prediction_cache is not None and not cache_fingerprint:
+            raise ValueError("prediction_cache requires a cache_fingerprint describing the agent configuration")
         self.agent = agent
         self.evaluator = evaluator
         self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.journal = journal
+        self.prediction_cache = prediction_cache
+        self.cache_fingerprint = cache_fingerprint or ""
+        self.adaptive_concurrency = adaptive_concurrency
+        self.item_timeout = item_timeout
+        self.retry_policy = retry_policy
+        self.tracer = tracer or Tracer()
+        self.progress = progress
+        self.payload_store = payload_store
 
-    async def run(self, dataset: List[Tuple[ForecastQuestion, ForecastResolution]]) -> EvaluationReport:
-        r"""Run the full backtest and return an evaluation report.
+    async def process_question(self, question: ForecastQuestion, resolution: ForecastResolution) -> EvaluationResult:
+        r"""Run the agent on one question and score it against its resolution."""
+        attempts = 0
 
-        Args:
-            dataset: List of (question, resolution) pairs.
+        async def predict() -> tuple[Any, bool]:
+            nonlocal attempts
+            attempts += 1
+            return await self._predict(question)
 
-        Returns:
-            An ``EvaluationReport`` containing per-question results and aggregate score.
-        """
-        async def process_question(question: ForecastQuestion, resolution: ForecastResolution) -> EvaluationResult:
-            try:
-                logger.info("Backtesting question: %s", question.id)
-                prediction = await self.agent.run(question)
+        try:
+            logger.debug("Backtesting question: %s", question.id)
+            if self.retry_policy is None:
+                prediction, cache_hit = await predict()
+            else:
+                prediction, cache_hit = await self.retry_policy.call(predict)
+            with self.tracer.span("validate_resolution"):
                 validated_resolution = validate_resolution_for_question(resolution, question.id)
+            with self.tracer.span("serialize_payloads"):
                 prediction_value, prediction_payload = prediction_value_and_payload(prediction)
+                validated_payload = resolution_payload(validated_resolution)
+            with self.tracer.span("score"):
                 result = self.evaluator.evaluate(
                     prediction=prediction_value, ground_truth=validated_resolution.outcome, subject_id=question.id
                 )
-                result.metadata["resolution_payload"] = resolution_payload(validated_resolution)
-                if prediction_payload is not None:
-                    result.metadata["prediction_payload"] = prediction_payload
-                return result
-            except Exception as e:
-                logger.error("Failed to evaluate question %s: %s", question.id, e)
-                return EvaluationResult(
-                    subject_id=question.id,
-                    score=1.0,
-                    ground_truth=None,
-                    prediction=0.5,
-                    metadata={"error": str(e), "resolution_payload": resolution_payload(resolution)},
-                )
+            result.metadata["resolution_payload"] = validated_payload
+            if prediction_payload is not None:
+                result.metadata["prediction_payload"] = prediction_payload
+            if cache_hit:
+                result.metadata["prediction_cache_hit"] = True
+            if self.retry_policy is not None:
+                result.metadata["attempts"] = attempts
+            return result
+        except Exception as e:
+            logger.error("Failed to evaluate question %s: %s", question.id, e)
+            metadata: dict[str, Any] = {"error": str(e), "resolution_payload": resolution_payload(resolution)}
+            if self.retry_policy is not None:
+                metadata["attempts"] = attempts
+                metadata["retryable"] = self.retry_policy.is_retryable(e)
+            return EvaluationResult(
+                subject_id=question.id,
+                score=1.0,
+                ground_truth=None,
+                prediction=0.5,
+                metadata=metadata,
+            )
+
+    async def _predict(self, question: ForecastQuestion) -> tuple[Any, bool]:
+        r"""Return the prediction for a question and whether it came from the cache."""
+        cache = self.prediction_cache
+        if cache is None:
+            return await self._run_agent(question), False
+        with self.tracer.span("cache_lookup") as span:
+            cached = await asyncio.to_thread(cache.get, self.cache_fingerprint, question.id)
+            if span is not None:
+                span.attributes["hit"] = cached is not None
+        if cached is not None:
+            return cached["prediction"], True
+        prediction = await self._run_agent(question)
+        payload = serialize_payload(prediction)
+        if payload is None and isinstance(prediction, (int, float)):
+            payload = prediction
+        if payload is not None:
+            with self.tracer.span("cache_store"):
+                await asyncio.to_thread(cache.put, self.cache_fingerprint, question.id, {"prediction": payload})
+        return prediction, False
+
+    async def _run_agent(self, question: ForecastQuestion) -> Any:
+        with self.tracer.span("agent_run"):
+            try:
+                return await asyncio.wait_for(self.agent.run(question), timeout=self.item_timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"agent run exceeded item_timeout of {self.item_timeout}s") from None
+
+    async def _process_controlled(self, question: ForecastQuestion, resolution: ForecastResolution) -> EvaluationResult:
+        controller = self.adaptive_concurrency
+        if controller is None:
+            return await self.process_question(question, resolution)
+        async with controller.slot():
+            started = time.perf_counter()
+            result = await self.process_question(question, resolution)
+            if "prediction_cache_hit" not in result.metadata:
+                controller.observe(time.perf_counter() - started, error="error" in result.metadata)
+        return result
+
+    async def _process_pair(self, pair: BacktestPair, journaled: Mapping[str, EvaluationResult]) -> EvaluationResult:
+        question, resolution = pair
+        with self.tracer.span("item", question.id):
+            key = ResultJournal.key(question.id, content=item_fingerprint(question, resolution))
+            if key in journaled:
+                return self._spill(journaled[key])
+            result = self._spill(await self._process_controlled(question, resolution))
+            if self.journal is not None:
+                with self.tracer.span("journal_write"):
+                    self.journal.append(key, result)
+            return result
+
+    def _spill(self, result: EvaluationResult) -> EvaluationResult:
+        if self.payload_store is None:
+            return result
+        with self.tracer.span("spill_payloads"):
+            return self.payload_store.spill(result)
+
+    async def run(self, dataset: Union[Iterable[BacktestPair], AsyncIterable[BacktestPair]]) -> EvaluationReport:
+        r"""Run the full backtest and return an evaluation report.
+
+        Args:
+            dataset: (question, resolution) pairs as a list or any sync/async
+                iterable. Lazy sources are consumed through a bounded queue.
+
+        Returns:
+            An ``EvaluationReport`` containing per-question results and aggregate score.
+        """
+        journaled = self.journal.load() if self.journal is not None else {}
+
+        async def process_pair(pair: BacktestPair) -> EvaluationResult:
+            return await self._process_pair(pair, journaled)
+
+        worker_count = self.adaptive_concurrency.max_concurrency if self.adaptive_concurrency else self.concurrency
+        executor: BoundedExecutor[BacktestPair, EvaluationResult] = BoundedExecutor(worker_count, self.queue_size)
+        results_by_index: dict[int, EvaluationResult] = {}
+        if self.progress is not None:
+            self.progress.start(executor, len(dataset) if isinstance(dataset, Sized) else None)
+        try:
+            async for idx, result in executor.map(dataset, process_pair):
+                results_by_index[idx] = result
+                if self.progress is not None:
+                    self.progress.update(error="error" in result.metadata)
+        finally:
+            if self.progress is not None:
+                await self.progress.stop()
 
-        queue: asyncio.Queue[tuple[int, ForecastQuestion, ForecastResolution]] = asyncio.Queue()
-        processed_results: list[EvaluationResult | None] = [None] * len(dataset)
-        for idx, (question, resolution) in enumerate(dataset):
-            queue.put_nowait((idx, question, resolution))
-
-        async def worker() -> None:
-            while True:
-                try:
-                    idx, question, resolution = queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    return
-                try:
-                    processed_results[idx] = await process_question(question, resolution)
-                finally:
-                    queue.task_done()
-
-        if dataset:
-            worker_count = min(self.concurrency, len(dataset))
-            workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
-            await queue.join()
-            await asyncio.gather(*workers)
-
-        results = [res for res in processed_results if res is not None]
+        results = [results_by_index[idx] for idx in sorted(results_by_index)]
 
         count = len(results)
         total_score = sum(res.score for res in results)
         mean_score = total_score / count if count > 0 else 0.0
 
-        return EvaluationReport(
+        report = EvaluationReport(
             metric_name="Brier Score", mean_score=mean_score, total_evaluations=count, results=results
         )
+        if self.adaptive_concurrency is not None:
+            report.summary_statistics.update(self.adaptive_concurrency.metrics())
+        return report
 
 
-__all__ = ["Backtester"]
+__all__ = ["Backtester", "BacktestPair"]
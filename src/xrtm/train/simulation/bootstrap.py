@@ -0,0 +1,173 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Vectorized bootstrap confidence intervals for report statistics.
+
+Each resample draws item indices with replacement. Statistics are computed over
+blocks of resamples at once with NumPy: the mean score is a row mean over the
+gathered scores, and the ECE comes from one weighted ``bincount`` of
+(outcome - prediction) per (resample, bin). When results carry
+``metadata["sample_weight"]`` the resampled mean is the weighted mean, matching
+the report's ``mean_score``; like the calibration bins, the ECE stays
+unweighted. Blocks are kept small enough to
+stay cache-friendly and to never hold the full resamples-by-items index matrix.
+"""
+
+from collections.abc import Sequence
+from typing import Optional
+
+import numpy as np
+
+# From xrtm-eval
+from xrtm.eval.core.eval.definitions import EvaluationReport, EvaluationResult
+
+from xrtm.train.simulation.aggregation import calibration_point
+
+__all__ = ["Bootstrap"]
+
+
+class Bootstrap:
+    r"""Percentile bootstrap intervals for the mean score and ECE of a report and its slices.
+
+    Args:
+        resamples: Number of bootstrap resamples.
+        confidence: Two-sided confidence level of the intervals.
+        seed: Seed of the resampling generator, for reproducible intervals.
+        num_bins: Reliability bins used for the ECE (matching the report's bins).
+        max_block_elements: Upper bound on resampled indices held in memory at once.
+    """
+
+    def __init__(
+        self,
+        resamples: int = 1000,
+        confidence: float = 0.95,
+        seed: int = 0,
+        num_bins: int = 10,
+        max_block_elements: int = 1 << 20,
+    ):
+        if resamples < 1:
+            raise ValueError("resamples must be >= 1")
+        if not 0.0 < confidence < 1.0:
+            raise ValueError("confidence must be in (0, 1)")
+        self.resamples = resamples
+        self.confidence = confidence
+        self.seed = seed
+        self.num_bins = num_bins
+        self.max_block_elements = max_block_elements
+
+    def resample(
+        self,
+        scores: np.ndarray,
+        probabilities: np.ndarray,
+        outcomes: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        r"""Return the bootstrap distributions of the mean score and the ECE.
+
+        ``probabilities`` and ``outcomes`` are ``NaN`` for items that cannot be
+        binned; those still count towards the mean score but not the ECE. With
+        ``weights``, each resample's mean score is weighted by them.
+        """
+        count = len(scores)
+        rng = np.random.default_rng(self.seed)
+        valid = ~(np.isnan(probabilities) | np.isnan(outcomes))
+        bins = np.where(
+            valid,
+            np.clip((np.nan_to_num(probabilities) * self.num_bins + 1e-9).astype(np.intp), 0, self.num_bins - 1),
+            self.num_bins,
+        ).astype(np.intp)
+        gaps = np.where(valid, outcomes - probabilities, 0.0)
+        width = self.num_bins + 1
+
+        means = np.empty(self.resamples)
+        eces = np.empty(self.resamples)
+        block = max(1, self.max_block_elements // max(count, 1))
+        for start in range(0, self.resamples, block):
+            rows = min(block, self.resamples - start)
+            idx = rng.integers(0, count, size=(rows, count))
+            if weights is None:
+                means[start : start + rows] = scores[idx].mean(axis=1)
+            else:
+                gathered = weights[idx]
+                means[start : start + rows] = (scores[idx] * gathered).sum(axis=1) / gathered.sum(axis=1)
+            # Offset each resample's bins so one bincount yields all (resample, bin) sums.
+            keys = bins[idx]
+            keys += (np.arange(rows) * width)[:, None]
+            sums = np.bincount(keys.ravel(), weights=gaps[idx].ravel(), minlength=rows * width).reshape(rows, width)
+            valid_counts = np.count_nonzero(valid[idx], axis=1)
+            eces[start : start + rows] = np.abs(sums[:, : self.num_bins]).sum(axis=1) / np.maximum(valid_counts, 1)
+        return means, eces
+
+    def intervals(self, results: Sequence[EvaluationResult]) -> dict[str, float]:
+        r"""Return ``{mean_score,ece}_ci_{lower,upper}`` for a set of results (empty when there are none)."""
+        scores, probabilities, outcomes, weights, _ = _arrays(results)
+        return self._summarize(scores, probabilities, outcomes, weights)
+
+    def _summarize(
+        self, scores: np.ndarray, probabilities: np.ndarray, outcomes: np.ndarray, weights: Optional[np.ndarray]
+    ) -> dict[str, float]:
+        if len(scores) == 0:
+            return {}
+        means, eces = self.resample(scores, probabilities, outcomes, weights)
+        alpha = (1.0 - self.confidence) / 2.0
+        mean_lower, mean_upper = np.quantile(means, [alpha, 1.0 - alpha])
+        ece_lower, ece_upper = np.quantile(eces, [alpha, 1.0 - alpha])
+        return {
+            "mean_score_ci_lower": float(mean_lower),
+            "mean_score_ci_upper": float(mean_upper),
+            "ece_ci_lower": float(ece_lower),
+            "ece_ci_upper": float(ece_upper),
+        }
+
+    def apply(self, report: EvaluationReport, results: Optional[Sequence[EvaluationResult]] = None) -> None:
+        r"""Add interval statistics to ``report`` and to each of its tag slices.
+
+        Args:
+            report: The report to annotate in place.
+            results: The report's per-item results, when they are not in
+                ``report.results`` (e.g. a columnar ``BacktestReport.columns``).
+        """
+        scores, probabilities, outcomes, weights, rows_by_tag = _arrays(report.results if results is None else results)
+        report.summary_statistics.update(self._summarize(scores, probabilities, outcomes, weights))
+        for tag, slice_report in (report.slices or {}).items():
+            rows = np.asarray(rows_by_tag.get(tag, []), dtype=np.int64)
+            slice_weights = weights[rows] if weights is not None else None
+            slice_report.summary_statistics.update(
+                self._summarize(scores[rows], probabilities[rows], outcomes[rows], slice_weights)
+            )
+
+
+def _arrays(
+    results: Sequence[EvaluationResult],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray], dict[str, list[int]]]:
+    r"""Collect scores, calibration points, sample weights (``None`` when unweighted) and per-tag rows in one pass."""
+    scores = np.empty(len(results))
+    probabilities = np.full(len(results), np.nan)
+    outcomes = np.full(len(results), np.nan)
+    weights = np.ones(len(results))
+    weighted = False
+    rows_by_tag: dict[str, list[int]] = {}
+    for row, result in enumerate(results):
+        scores[row] = result.score
+        weight = result.metadata.get("sample_weight")
+        if weight is not None:
+            weights[row] = weight
+            weighted = True
+        point = calibration_point(result)
+        if point is not None:
+            probabilities[row], outcomes[row] = point
+        for tag in result.metadata.get("tags") or ():
+            rows_by_tag.setdefault(tag, []).append(row)
+    return scores, probabilities, outcomes, weights if weighted else None, rows_by_tag
@@ -0,0 +1,118 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Wall-clock and cost budgets for backtest runs.
+
+Nightly jobs have a hard time window and a spending limit. A ``RunBudget``
+bounds a run by a time limit or absolute deadline, by the number of
+orchestrator calls, and by the tokens those calls report in ``state.usage``.
+Call and token limits are checked before each orchestrator call. Once one is
+used up, the call raises ``BudgetExhausted`` instead of starting. The runner
+then stops dispatching, lets the calls already started finish (the deadline
+cancels them instead) and returns a partial report over the completed items.
+"""
+
+import time
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from typing import Optional
+
+__all__ = ["BudgetExhausted", "RunBudget"]
+
+
+class BudgetExhausted(Exception):
+    r"""Raised when a run's budget does not allow another orchestrator call."""
+
+    def __init__(self, reason: str):
+        super().__init__(f"run budget exhausted: {reason}")
+        self.reason = reason
+
+
+class RunBudget:
+    r"""Time, call and token limits for one run at a time.
+
+    Args:
+        time_limit: Seconds allowed from the start of the run.
+        deadline: Absolute, timezone-aware wall-clock deadline.
+        max_calls: Maximum number of orchestrator calls started. Prediction
+            cache hits and deduplicated items do not count.
+        max_tokens: Maximum ``total_tokens`` summed over completed calls. The
+            limit is checked before each call, so in-flight calls can overshoot
+            it by their own usage.
+
+    Attributes:
+        calls: Orchestrator calls started in the current run.
+        tokens: Tokens reported by completed calls in the current run.
+    """
+
+    def __init__(
+        self,
+        time_limit: Optional[float] = None,
+        deadline: Optional[datetime] = None,
+        max_calls: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+    ):
+        if time_limit is None and deadline is None and max_calls is None and max_tokens is None:
+            raise ValueError("RunBudget requires a time_limit, deadline, max_calls or max_tokens")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("time_limit must be > 0")
+        if deadline is not None and deadline.tzinfo is None:
+            raise ValueError("deadline must be timezone-aware")
+        if max_calls is not None and max_calls < 0:
+            raise ValueError("max_calls must be >= 0")
+        if max_tokens is not None and max_tokens < 0:
+            raise ValueError("max_tokens must be >= 0")
+        self.time_limit = time_limit
+        self.deadline = deadline
+        self.max_calls = max_calls
+        self.max_tokens = max_tokens
+        self.calls = 0
+        self.tokens = 0
+        self._expires_at: Optional[float] = None
+
+    def start(self) -> None:
+        r"""Reset the counters and start the clock for a new run."""
+        self.calls = 0
+        self.tokens = 0
+        limits = []
+        if self.time_limit is not None:
+            limits.append(self.time_limit)
+        if self.deadline is not None:
+            limits.append((self.deadline - datetime.now(timezone.utc)).total_seconds())
+        self._expires_at = time.monotonic() + min(limits) if limits else None
+
+    def remaining_time(self) -> Optional[float]:
+        r"""Seconds left before the deadline (never negative), or ``None`` without a time limit."""
+        if self._expires_at is None:
+            return None
+        return max(self._expires_at - time.monotonic(), 0.0)
+
+    def reserve_call(self) -> None:
+        r"""Count one orchestrator call, or raise ``BudgetExhausted`` if none is left."""
+        if self.max_calls is not None and self.calls >= self.max_calls:
+            raise BudgetExhausted("max_calls")
+        if self.max_tokens is not None and self.tokens >= self.max_tokens:
+            raise BudgetExhausted("max_tokens")
+        if self._expires_at is not None and time.monotonic() >= self._expires_at:
+            raise BudgetExhausted("deadline")
+        self.calls += 1
+
+    def charge(self, usage: Mapping[str, int]) -> None:
+        r"""Add the token usage of a completed call."""
+        self.tokens += int(usage.get("total_tokens", 0) or 0)
+
+    def metrics(self) -> dict[str, float]:
+        r"""Return the calls and tokens used so far in the current run."""
+        return {"budget_calls": float(self.calls), "budget_tokens": float(self.tokens)}
@@ -0,0 +1,166 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Content-addressed cache of agent and orchestrator outputs across backtest runs.
+
+Entries are keyed by question id, reference time, and a fingerprint of the
+agent/orchestrator configuration, so re-running an arm or changing only the
+evaluator reuses earlier inference. Entries are grouped on disk by fingerprint,
+which makes invalidating a configuration a single directory removal, and the
+cache evicts least-recently-used entries once it exceeds ``max_bytes``. Eviction
+frees space down to a low-water mark, so the directory is scanned once per
+batch of evictions rather than on every write.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+
+__all__ = ["PredictionCache", "config_fingerprint"]
+logger = logging.getLogger(__name__)
+
+
+def config_fingerprint(*parts: Any) -> str:
+    r"""Return a short stable fingerprint for a configuration description."""
+    encoded = json.dumps(parts, sort_keys=True, default=repr)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+class PredictionCache:
+    r"""Persistent on-disk cache of prediction outputs.
+
+    Args:
+        directory: Root directory of the cache.
+        max_bytes: Optional size limit; the least recently used entries are
+            evicted once the cache grows beyond it.
+        low_water: Fraction of ``max_bytes`` the cache is shrunk to when it
+            evicts.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: Optional[int] = None, low_water: float = 0.8):
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        if not 0.0 < low_water <= 1.0:
+            raise ValueError("low_water must be in (0, 1]")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self._size_bytes: Optional[int] = None
+        # Runners call ``get``/``put`` from worker threads.
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def key(subject_id: str, reference_time: Optional[datetime] = None) -> str:
+        r"""Return the content address of a subject at a reference time."""
+        raw = subject_id if reference_time is None else f"{subject_id}@{reference_time.isoformat()}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, fingerprint: str, subject_id: str, reference_time: Optional[datetime]) -> Path:
+        return self.directory / fingerprint / f"{self.key(subject_id, reference_time)}.json"
+
+    def get(self, fingerprint: str, subject_id: str, reference_time: Optional[datetime] = None) -> Optional[Any]:
+        r"""Return the cached value, or ``None`` on a miss."""
+        path = self._entry_path(fingerprint, subject_id, reference_time)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            logger.warning("Discarding unreadable cache entry %s: %s", path, e)
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted by another thread after the read; the value is still good.
+            pass
+        return value
+
+    def put(self, fingerprint: str, subject_id: str, value: Any, reference_time: Optional[datetime] = None) -> None:
+        r"""Store a JSON-serializable value and evict old entries if over the size limit."""
+        path = self._entry_path(fingerprint, subject_id, reference_time)
+        data = json.dumps(value).encode("utf-8")
+        # Writers and eviction share the lock so the entry being replaced cannot
+        # disappear between measuring it and replacing it.
+        with self._lock:
+            size = self.size_bytes()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                previous = path.stat().st_size
+            except FileNotFoundError:
+                previous = 0
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._size_bytes = size + len(data) - previous
+            if self.max_bytes is not None and self._size_bytes > self.max_bytes:
+                self._evict()
+
+    def invalidate(self, fingerprint: str) -> int:
+        r"""Remove every entry stored under a configuration fingerprint.
+
+        Returns:
+            The number of entries removed.
+        """
+        directory = self.directory / fingerprint
+        if not directory.is_dir():
+            return 0
+        removed = sum(1 for _ in directory.glob("*.json"))
+        with self._lock:
+            shutil.rmtree(directory)
+            self._size_bytes = None
+        return removed
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Caches are passed to worker processes; each copy gets its own lock.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def size_bytes(self) -> int:
+        r"""Return the total size of cached entries in bytes."""
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(path.stat().st_size for path in self.directory.glob("*/*.json"))
+            return self._size_bytes
+
+    def _evict(self) -> None:
+        if self.max_bytes is None:
+            return
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * self.low_water
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._size_bytes = total
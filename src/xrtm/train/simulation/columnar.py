@@ -0,0 +1,225 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Memory-compact, columnar storage of evaluation results.
+
+A list of ``EvaluationResult`` models costs several kilobytes per item once the
+metadata dicts with resolution and prediction payloads are counted, which puts
+million-item reports in the gigabytes. ``ColumnarResults`` keeps scores,
+predictions, ground truth and latencies in contiguous float arrays, and subject
+ids and the remaining metadata as compact JSON in shared byte buffers
+referenced by offset. ``EvaluationResult`` objects are only built when a row is
+accessed.
+"""
+
+import math
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Optional, Union, overload
+
+import numpy as np
+import pydantic_core
+
+# From xrtm-eval
+from xrtm.eval.core.eval.definitions import EvaluationResult
+
+__all__ = ["ColumnarResults"]
+
+_INITIAL_CAPACITY = 1024
+
+
+class _BlobColumn:
+    r"""Variable-length byte strings packed into one buffer and addressed by offsets."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.offsets = np.zeros(_INITIAL_CAPACITY + 1, dtype=np.int64)
+        self.size = 0
+
+    def append(self, value: bytes) -> None:
+        if self.size + 1 >= len(self.offsets):
+            self.offsets = np.resize(self.offsets, 2 * len(self.offsets))
+        self.buffer += value
+        self.size += 1
+        self.offsets[self.size] = len(self.buffer)
+
+    def extend_from(self, other: "_BlobColumn", rows: np.ndarray) -> None:
+        for row in rows.tolist():
+            self.append(bytes(other.buffer[other.offsets[row] : other.offsets[row + 1]]))
+
+    def get(self, row: int) -> bytes:
+        return bytes(self.buffer[self.offsets[row] : self.offsets[row + 1]])
+
+    def nbytes(self) -> int:
+        return len(self.buffer) + self.offsets.nbytes
+
+
+def _exact_float(value: Any) -> Optional[float]:
+    r"""Return ``value`` when it round-trips exactly through a float column."""
+    return value if type(value) is float else None
+
+
+class ColumnarResults(Sequence[EvaluationResult]):
+    r"""Append-only columnar container that materializes ``EvaluationResult`` rows lazily.
+
+    Float-valued predictions, ground truths and ``total_latency`` metadata live
+    in NumPy columns (``NaN`` where a row holds something else). Everything
+    else a result carries is kept as compact JSON, so materialized rows match
+    the originals after a JSON round trip: non-JSON metadata values such as
+    datetimes come back in their serialized form.
+    """
+
+    def __init__(self, results: Iterable[EvaluationResult] = ()):
+        self._size = 0
+        self._scores = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._predictions = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._ground_truths = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._latencies = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._subject_ids = _BlobColumn()
+        self._extras = _BlobColumn()
+        self.extend(results)
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._scores)
+        self._scores = np.resize(self._scores, capacity)
+        self._predictions = np.resize(self._predictions, capacity)
+        self._ground_truths = np.resize(self._ground_truths, capacity)
+        self._latencies = np.resize(self._latencies, capacity)
+
+    def append(self, result: EvaluationResult) -> None:
+        r"""Store one result."""
+        if self._size == len(self._scores):
+            self._grow()
+        row = self._size
+        extra: dict[str, Any] = {}
+        metadata = dict(result.metadata)
+
+        prediction = _exact_float(result.prediction)
+        if prediction is None:
+            extra["prediction"] = result.prediction
+        ground_truth = _exact_float(result.ground_truth)
+        if ground_truth is None:
+            extra["ground_truth"] = result.ground_truth
+        latency = _exact_float(metadata.get("total_latency"))
+        if latency is not None:
+            del metadata["total_latency"]
+        if metadata:
+            extra["metadata"] = metadata
+
+        self._scores[row] = result.score
+        self._predictions[row] = math.nan if prediction is None else prediction
+        self._ground_truths[row] = math.nan if ground_truth is None else ground_truth
+        self._latencies[row] = math.nan if latency is None else latency
+        self._subject_ids.append(result.subject_id.encode("utf-8"))
+        self._extras.append(pydantic_core.to_json(extra) if extra else b"")
+        self._size += 1
+
+    def extend(self, results: Iterable[EvaluationResult]) -> None:
+        r"""Store several results in order."""
+        for result in results:
+            self.append(result)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _materialize(self, row: int) -> EvaluationResult:
+        raw = self._extras.get(row)
+        extra: dict[str, Any] = pydantic_core.from_json(raw) if raw else {}
+        metadata = extra.get("metadata", {})
+        latency = float(self._latencies[row])
+        if not math.isnan(latency):
+            metadata["total_latency"] = latency
+        return EvaluationResult.model_construct(
+            subject_id=self._subject_ids.get(row).decode("utf-8"),
+            score=float(self._scores[row]),
+            prediction=extra["prediction"] if "prediction" in extra else float(self._predictions[row]),
+            ground_truth=extra["ground_truth"] if "ground_truth" in extra else float(self._ground_truths[row]),
+            metadata=metadata,
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> EvaluationResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[EvaluationResult]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[EvaluationResult, list[EvaluationResult]]:
+        if isinstance(index, slice):
+            return [self._materialize(row) for row in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ColumnarResults index out of range")
+        return self._materialize(index)
+
+    def __iter__(self) -> Iterator[EvaluationResult]:
+        for row in range(self._size):
+            yield self._materialize(row)
+
+    def take(self, rows: Sequence[int]) -> "ColumnarResults":
+        r"""Return a new container holding ``rows`` in the given order, without materializing them."""
+        taken = ColumnarResults()
+        taken.extend_columns(self, rows)
+        return taken
+
+    def extend_columns(self, other: "ColumnarResults", rows: Optional[Sequence[int]] = None) -> None:
+        r"""Append rows (default: all) of another container by copying its columns."""
+        selected = np.arange(len(other)) if rows is None else np.asarray(rows, dtype=np.int64)
+        if selected.size and (selected.min() < 0 or selected.max() >= len(other)):
+            raise IndexError("ColumnarResults index out of range")
+        while self._size + selected.size > len(self._scores):
+            self._grow()
+        end = self._size + selected.size
+        self._scores[self._size : end] = other._scores[selected]
+        self._predictions[self._size : end] = other._predictions[selected]
+        self._ground_truths[self._size : end] = other._ground_truths[selected]
+        self._latencies[self._size : end] = other._latencies[selected]
+        self._subject_ids.extend_from(other._subject_ids, selected)
+        self._extras.extend_from(other._extras, selected)
+        self._size = end
+
+    @property
+    def scores(self) -> np.ndarray:
+        r"""Scores of all rows (a read-only view)."""
+        return self._view(self._scores)
+
+    @property
+    def predictions(self) -> np.ndarray:
+        r"""Float predictions (``NaN`` for rows whose prediction is not a float)."""
+        return self._view(self._predictions)
+
+    @property
+    def ground_truths(self) -> np.ndarray:
+        r"""Float ground truths (``NaN`` for rows whose ground truth is not a float)."""
+        return self._view(self._ground_truths)
+
+    @property
+    def latencies(self) -> np.ndarray:
+        r"""``total_latency`` per row (``NaN`` where it was not recorded)."""
+        return self._view(self._latencies)
+
+    @property
+    def subject_ids(self) -> list[str]:
+        r"""Subject ids of all rows."""
+        return [self._subject_ids.get(row).decode("utf-8") for row in range(self._size)]
+
+    def _view(self, column: np.ndarray) -> np.ndarray:
+        view = column[: self._size]
+        view.flags.writeable = False
+        return view
+
+    def nbytes(self) -> int:
+        r"""Approximate memory held by the columns and buffers, in bytes."""
+        columns = self._scores.nbytes + self._predictions.nbytes + self._ground_truths.nbytes + self._latencies.nbytes
+        return columns + self._subject_ids.nbytes() + self._extras.nbytes()
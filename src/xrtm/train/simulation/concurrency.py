@@ -0,0 +1,179 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Adaptive (AIMD) concurrency control for the simulation runners.
+
+``AdaptiveConcurrency`` grows the number of active workers additively while
+per-item latency and error rate stay healthy, and shrinks it multiplicatively
+when a window of observations shows latency above target (or well above the
+best latency seen so far) or too many errors. Every adjustment is recorded as
+a ``ConcurrencyDecision`` so throughput changes can be explained after the run.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from pydantic import BaseModel
+
+__all__ = ["AdaptiveConcurrency", "ConcurrencyDecision"]
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyDecision(BaseModel):
+    """One adjustment of the active worker limit and the window statistics behind it."""
+
+    timestamp: float
+    previous_limit: int
+    limit: int
+    reason: str
+    window_latency: float
+    window_error_rate: float
+
+
+class AdaptiveConcurrency:
+    r"""Additive-increase / multiplicative-decrease limit on active workers.
+
+    Args:
+        initial: Starting number of active workers.
+        min_concurrency: Lower bound for the limit.
+        max_concurrency: Upper bound for the limit; runners start this many
+            workers and gate them through ``slot()``.
+        target_latency: Optional per-item latency ceiling in seconds. When unset,
+            the limit backs off once window latency exceeds the best observed
+            window latency by ``latency_tolerance``.
+        latency_tolerance: Allowed ratio over the baseline latency.
+        max_error_rate: Error rate within a window that triggers a decrease.
+        window: Number of observations per decision.
+        decrease_factor: Multiplier applied to the limit on a decrease.
+    """
+
+    def __init__(
+        self,
+        initial: int = 5,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        target_latency: Optional[float] = None,
+        latency_tolerance: float = 2.0,
+        max_error_rate: float = 0.1,
+        window: int = 10,
+        decrease_factor: float = 0.5,
+    ):
+        if not 1 <= min_concurrency <= initial <= max_concurrency:
+            raise ValueError("expected 1 <= min_concurrency <= initial <= max_concurrency")
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        if not 0.0 < decrease_factor < 1.0:
+            raise ValueError("decrease_factor must be in (0, 1)")
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self.latency_tolerance = latency_tolerance
+        self.max_error_rate = max_error_rate
+        self.window = window
+        self.decrease_factor = decrease_factor
+        self.decisions: list[ConcurrencyDecision] = []
+        self._limit = initial
+        self._active = 0
+        self._baseline_latency: Optional[float] = None
+        self._latencies: list[float] = []
+        self._errors = 0
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def limit(self) -> int:
+        r"""Current number of workers allowed to run concurrently."""
+        return self._limit
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        r"""Hold one of the currently permitted worker slots."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        condition = self._condition
+        async with condition:
+            await condition.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self._active -= 1
+                condition.notify_all()
+
+    def observe(self, latency: float, error: bool = False) -> Optional[ConcurrencyDecision]:
+        r"""Record one completed item and adjust the limit at the end of each window."""
+        self._latencies.append(latency)
+        self._errors += int(error)
+        if len(self._latencies) < self.window:
+            return None
+
+        window_latency = sum(self._latencies) / len(self._latencies)
+        error_rate = self._errors / len(self._latencies)
+        self._latencies = []
+        self._errors = 0
+        if error_rate == 0.0 and (self._baseline_latency is None or window_latency < self._baseline_latency):
+            self._baseline_latency = window_latency
+
+        previous = self._limit
+        if error_rate > self.max_error_rate:
+            reason = "error_rate"
+        elif self.target_latency is not None and window_latency > self.target_latency:
+            reason = "latency_above_target"
+        elif (
+            self.target_latency is None
+            and self._baseline_latency is not None
+            and window_latency > self._baseline_latency * self.latency_tolerance
+        ):
+            reason = "latency_above_baseline"
+        else:
+            reason = "healthy"
+
+        if reason == "healthy":
+            self._limit = min(self.max_concurrency, self._limit + 1)
+        else:
+            self._limit = max(self.min_concurrency, int(self._limit * self.decrease_factor))
+        if self._limit == previous:
+            return None
+
+        decision = ConcurrencyDecision(
+            timestamp=time.time(),
+            previous_limit=previous,
+            limit=self._limit,
+            reason=reason,
+            window_latency=window_latency,
+            window_error_rate=error_rate,
+        )
+        self.decisions.append(decision)
+        logger.info(
+            "Concurrency %d -> %d (%s; latency=%.3fs, error_rate=%.2f)",
+            previous,
+            self._limit,
+            reason,
+            window_latency,
+            error_rate,
+        )
+        return decision
+
+    def metrics(self) -> dict[str, float]:
+        r"""Return summary metrics describing the controller's decisions."""
+        return {
+            "concurrency_limit": float(self._limit),
+            "concurrency_increases": float(sum(1 for d in self.decisions if d.limit > d.previous_limit)),
+            "concurrency_decreases": float(sum(1 for d in self.decisions if d.limit < d.previous_limit)),
+        }
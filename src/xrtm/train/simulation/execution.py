@@ -0,0 +1,152 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Bounded producer/worker execution shared by the simulation runners.
+
+Items are pulled lazily from a sync or async iterable into a bounded queue and
+processed by a fixed pool of asyncio workers, so large sources flow through in
+constant memory and the first results are available before the source is
+exhausted.
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Sized
+from typing import Any, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def iterate_source(source: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    r"""Iterate a sync or async iterable uniformly."""
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
+
+
+class BoundedExecutor(Generic[T, R]):
+    r"""Runs an async handler over a source with bounded concurrency and buffering.
+
+    ``drained`` is set once the source is exhausted and every item has been
+    handed to a worker, i.e. only in-flight work remains. ``stop()`` ends
+    dispatching early: buffered items are dropped, in-flight items finish.
+    ``in_flight`` and ``queue_depth`` report the current load for progress
+    monitoring.
+
+    Args:
+        concurrency: Number of workers processing items concurrently.
+        queue_size: Maximum number of items buffered ahead of the workers.
+            Defaults to ``2 * concurrency``.
+    """
+
+    def __init__(self, concurrency: int, queue_size: Optional[int] = None):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if queue_size is not None and queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        self.concurrency = concurrency
+        self.queue_size = queue_size or 2 * concurrency
+        self.drained = asyncio.Event()
+        self.stopped = False
+        self.in_flight = 0
+        self._work: Optional[asyncio.Queue[Any]] = None
+
+    @property
+    def queue_depth(self) -> int:
+        r"""Number of items buffered ahead of the workers."""
+        return self._work.qsize() if self._work is not None else 0
+
+    def stop(self) -> None:
+        r"""Stop dispatching new items; items already being processed still complete."""
+        self.stopped = True
+
+    async def map(
+        self, source: Iterable[T] | AsyncIterable[T], handler: Callable[[T], Awaitable[R]]
+    ) -> AsyncIterator[tuple[int, R]]:
+        r"""Yield ``(index, result)`` pairs in completion order.
+
+        ``index`` is the position of the item in ``source``. Exceptions raised by
+        the source or the handler are re-raised to the consumer, and closing the
+        iterator early cancels all outstanding work.
+        """
+        worker_count = self.concurrency
+        if isinstance(source, Sized):
+            worker_count = min(worker_count, len(source))
+        if worker_count == 0:
+            return
+
+        work: asyncio.Queue[Optional[tuple[int, T]]] = asyncio.Queue(maxsize=self.queue_size)
+        self._work = work
+        done: asyncio.Queue[Optional[tuple[int, R | BaseException]]] = asyncio.Queue(maxsize=self.queue_size)
+        source_errors: list[Exception] = []
+
+        async def produce() -> None:
+            try:
+                idx = 0
+                async for item in iterate_source(source):
+                    if self.stopped:
+                        break
+                    await work.put((idx, item))
+                    idx += 1
+            except Exception as e:
+                source_errors.append(e)
+            for _ in range(worker_count):
+                await work.put(None)
+
+        async def worker() -> None:
+            while True:
+                entry = await work.get()
+                if entry is None:
+                    self.drained.set()
+                    break
+                if self.stopped:
+                    continue
+                idx, item = entry
+                outcome: R | BaseException
+                self.in_flight += 1
+                try:
+                    outcome = await handler(item)
+                except Exception as e:
+                    outcome = e
+                finally:
+                    self.in_flight -= 1
+                await done.put((idx, outcome))
+            await done.put(None)
+
+        tasks = [asyncio.create_task(produce())]
+        tasks.extend(asyncio.create_task(worker()) for _ in range(worker_count))
+        try:
+            exited = 0
+            while exited < worker_count:
+                result = await done.get()
+                if result is None:
+                    exited += 1
+                    continue
+                idx, outcome = result
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                yield idx, outcome
+            if source_errors:
+                raise source_errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+__all__ = ["BoundedExecutor", "iterate_source"]
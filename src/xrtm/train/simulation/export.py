@@ -0,0 +1,339 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Parquet and Arrow IPC export/import of backtest results.
+
+``ArrowResultWriter`` appends results to a Parquet or Arrow IPC file in
+row-group chunks while a run is in progress. Metadata is flattened into typed
+columns (``resolution_payload.outcome``, ``total_latency``, ``tags``, ...), so
+the files can be queried directly from dataframe tools. The column schema is
+inferred from the first chunk, and values that do not fit it are kept in a JSON
+``extra`` column, so nothing is lost. ``read_results`` rebuilds a report from
+such a file. It skips the payload columns unless they are requested.
+
+Requires the optional ``pyarrow`` dependency (``pip install xrtm-train[arrow]``).
+"""
+
+import json
+import logging
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional, Union
+
+import pydantic_core
+
+# From xrtm-eval
+from xrtm.eval.core.eval.definitions import EvaluationResult
+
+from xrtm.train.simulation.aggregation import BacktestReport, ReportAggregator
+
+__all__ = ["ArrowResultWriter", "PAYLOAD_FIELDS", "read_results"]
+logger = logging.getLogger(__name__)
+
+PAYLOAD_FIELDS = ("resolution_payload", "prediction_payload")
+_CORE_COLUMNS = ("index", "subject_id", "score", "prediction", "ground_truth", "extra")
+_METRIC_KEY = b"xrtm.metric_name"
+_KIND_KEY = b"xrtm.kind"
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow as pa
+
+        return pa
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for Arrow/Parquet export. Install it with `pip install xrtm-train[arrow]`."
+        ) from None
+
+
+def _format_for(path: Path, format: Optional[str]) -> str:
+    if format is None:
+        format = "parquet" if path.suffix == ".parquet" else "ipc"
+    if format not in ("parquet", "ipc"):
+        raise ValueError(f"format must be 'parquet' or 'ipc'. Got {format!r}")
+    return format
+
+
+def _kind(value: Any) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return "str_list"
+    return "json"
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def _flatten(metadata: dict[str, Any]) -> dict[str, Any]:
+    flat: dict[str, Any] = {}
+    for key, value in metadata.items():
+        if key in PAYLOAD_FIELDS and isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                flat[f"{key}.{sub_key}"] = sub_value
+        else:
+            flat[key] = value
+    return flat
+
+
+class ArrowResultWriter:
+    r"""Streams results into a Parquet or Arrow IPC file in row-group chunks.
+
+    Args:
+        path: Output file. ``.parquet`` selects Parquet; anything else Arrow IPC.
+        format: Explicit ``"parquet"`` or ``"ipc"``, overriding the suffix.
+        row_group_size: Number of buffered results written per chunk.
+        metric_name: Metric name recorded in the file for ``read_results``.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        format: Optional[str] = None,
+        row_group_size: int = 10_000,
+        metric_name: str = "Brier Score",
+    ):
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be >= 1")
+        self._pa = _require_pyarrow()
+        self.path = Path(path)
+        self.format = _format_for(self.path, format)
+        self.row_group_size = row_group_size
+        self.metric_name = metric_name
+        self.rows_written = 0
+        self._rows: list[dict[str, Any]] = []
+        self._kinds: dict[str, str] = {}
+        self._schema: Any = None
+        self._writer: Any = None
+        self._sink: Any = None
+
+    def __enter__(self) -> "ArrowResultWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def write(self, result: EvaluationResult, index: Optional[int] = None) -> None:
+        r"""Buffer one result, flushing a chunk once ``row_group_size`` results are buffered.
+
+        Args:
+            result: The result to export.
+            index: Position of the result in the dataset. Defaults to write order.
+        """
+        extra: dict[str, Any] = {}
+        prediction = _number(result.prediction)
+        if prediction is None and result.prediction is not None:
+            extra["prediction"] = result.prediction
+        ground_truth = _number(result.ground_truth)
+        if ground_truth is None and result.ground_truth is not None:
+            extra["ground_truth"] = result.ground_truth
+        row: dict[str, Any] = {
+            "index": self.rows_written + len(self._rows) if index is None else index,
+            "subject_id": result.subject_id,
+            "score": result.score,
+            "prediction": prediction,
+            "ground_truth": ground_truth,
+            "fields": _flatten(result.metadata),
+            "extra": extra,
+        }
+        self._rows.append(row)
+        if len(self._rows) >= self.row_group_size:
+            self.flush()
+
+    def _build_schema(self) -> Any:
+        pa = self._pa
+        types = {
+            "bool": pa.bool_(),
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "str": pa.string(),
+            "str_list": pa.list_(pa.string()),
+            "json": pa.string(),
+        }
+        for row in self._rows:
+            for name, value in row["fields"].items():
+                if name in self._kinds or name in _CORE_COLUMNS or value is None:
+                    continue
+                if "." in name and name.split(".", 1)[0] not in PAYLOAD_FIELDS:
+                    continue
+                self._kinds[name] = _kind(value)
+        fields = [
+            pa.field("index", pa.int64()),
+            pa.field("subject_id", pa.string()),
+            pa.field("score", pa.float64()),
+            pa.field("prediction", pa.float64()),
+            pa.field("ground_truth", pa.float64()),
+        ]
+        fields += [
+            pa.field(name, types[kind], metadata={_KIND_KEY: kind.encode()}) for name, kind in self._kinds.items()
+        ]
+        fields.append(pa.field("extra", pa.string()))
+        return pa.schema(fields, metadata={_METRIC_KEY: self.metric_name.encode()})
+
+    def _columns(self) -> dict[str, list[Any]]:
+        columns: dict[str, list[Any]] = {
+            name: [] for name in ("index", "subject_id", "score", "prediction", "ground_truth")
+        }
+        columns.update({name: [] for name in self._kinds})
+        extras: list[Optional[str]] = []
+        for row in self._rows:
+            for name in ("index", "subject_id", "score", "prediction", "ground_truth"):
+                columns[name].append(row[name])
+            extra = dict(row["extra"])
+            fields = row["fields"]
+            for name, kind in self._kinds.items():
+                value = fields.get(name)
+                if value is not None and _kind(value) != kind and not (kind == "float" and _kind(value) == "int"):
+                    extra.setdefault("metadata", {})[name] = value
+                    value = None
+                elif value is not None and kind == "json":
+                    value = pydantic_core.to_json(value).decode("utf-8")
+                columns[name].append(value)
+            leftover = {name: value for name, value in fields.items() if name not in self._kinds}
+            if leftover:
+                extra.setdefault("metadata", {}).update(leftover)
+            extras.append(pydantic_core.to_json(extra).decode("utf-8") if extra else None)
+        columns["extra"] = extras
+        return columns
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._schema = self._build_schema()
+        if self.format == "parquet":
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(self.path, self._schema)
+        else:
+            self._sink = self._pa.OSFile(str(self.path), "wb")
+            self._writer = self._pa.ipc.new_file(self._sink, self._schema)
+
+    def flush(self) -> None:
+        r"""Write buffered results as one row group (Parquet) or record batch (IPC)."""
+        if not self._rows:
+            return
+        if self._writer is None:
+            self._open()
+        table = self._pa.Table.from_pydict(self._columns(), schema=self._schema)
+        self._writer.write_table(table)
+        self.rows_written += len(self._rows)
+        self._rows = []
+
+    def close(self) -> None:
+        r"""Flush remaining results and finalize the file."""
+        self.flush()
+        if self._writer is None:
+            self._open()
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+        logger.info("Exported %d results to %s", self.rows_written, self.path)
+
+
+def _row_to_result(row: dict[str, Any], kinds: dict[str, str], include_payloads: bool) -> EvaluationResult:
+    extra = json.loads(row["extra"]) if row.get("extra") else {}
+    metadata: dict[str, Any] = {}
+    for name, kind in kinds.items():
+        value = row.get(name)
+        if value is None:
+            continue
+        if kind == "json":
+            value = json.loads(value)
+        head, _, tail = name.partition(".")
+        if tail and head in PAYLOAD_FIELDS:
+            metadata.setdefault(head, {})[tail] = value
+        else:
+            metadata[name] = value
+    for name, value in extra.get("metadata", {}).items():
+        head, _, tail = name.partition(".")
+        if head in PAYLOAD_FIELDS and not include_payloads:
+            continue
+        if tail and head in PAYLOAD_FIELDS:
+            metadata.setdefault(head, {})[tail] = value
+        else:
+            metadata[name] = value
+    return EvaluationResult.model_construct(
+        subject_id=row["subject_id"],
+        score=row["score"],
+        prediction=extra.get("prediction", row["prediction"]),
+        ground_truth=extra.get("ground_truth", row["ground_truth"]),
+        metadata=metadata,
+    )
+
+
+def read_results(
+    path: Union[str, Path],
+    format: Optional[str] = None,
+    include_payloads: bool = False,
+    columnar: bool = False,
+) -> BacktestReport:
+    r"""Rebuild a report from a file written by ``ArrowResultWriter``.
+
+    Args:
+        path: The Parquet or Arrow IPC file.
+        format: Explicit ``"parquet"`` or ``"ipc"``, overriding the suffix.
+        include_payloads: Also load the flattened ``resolution_payload`` and
+            ``prediction_payload`` columns. They are skipped by default, which
+            avoids reading the widest columns.
+        columnar: Keep results in ``BacktestReport.columns`` (see ``ColumnarResults``).
+
+    Returns:
+        A ``BacktestReport`` with results in dataset-index order.
+    """
+    pa = _require_pyarrow()
+    path = Path(path)
+    if _format_for(path, format) == "parquet":
+        import pyarrow.parquet as pq
+
+        schema = pq.read_schema(path)
+    else:
+        with pa.memory_map(str(path), "r") as source:
+            schema = pa.ipc.open_file(source).schema
+
+    def wanted(name: str) -> bool:
+        return include_payloads or name.partition(".")[0] not in PAYLOAD_FIELDS
+
+    columns = [name for name in schema.names if wanted(name)]
+    if _format_for(path, format) == "parquet":
+        table = pq.read_table(path, columns=columns)
+    else:
+        with pa.memory_map(str(path), "r") as source:
+            table = pa.ipc.open_file(source).read_all().select(columns)
+    kinds = {
+        field.name: field.metadata[_KIND_KEY].decode()
+        for field in table.schema
+        if field.metadata and _KIND_KEY in field.metadata
+    }
+    metric_name = (schema.metadata or {}).get(_METRIC_KEY, b"Brier Score").decode()
+
+    aggregator = ReportAggregator(metric_name=metric_name, columnar=columnar)
+    for batch in table.to_batches():
+        for row in batch.to_pylist():
+            aggregator.update(_row_to_result(row, kinds, include_payloads), row["index"])
+    return aggregator.report()
@@ -0,0 +1,99 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Append-only result journal for checkpointing and resuming long backtests.
+
+Every successfully scored ``EvaluationResult`` is appended to a JSONL file
+keyed by subject id, reference time and a fingerprint of the item's content
+(question, outcome, tags), so duplicate items that differ only in their
+resolution keep separate entries. A restarted run loads the journal,
+skips items that already have a result, and rebuilds the final report from the
+journaled entries. Failed items (results carrying an ``error``) are never
+journaled, so they are retried on resume.
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+
+# From xrtm-data
+from xrtm.data.core.schemas.forecast import ForecastQuestion
+
+# From xrtm-eval
+from xrtm.eval.core.eval.definitions import EvaluationResult
+from xrtm.eval.core.schemas import ForecastResolution
+
+from xrtm.train.simulation.cache import config_fingerprint
+
+__all__ = ["ResultJournal", "item_fingerprint"]
+logger = logging.getLogger(__name__)
+
+
+def item_fingerprint(question: ForecastQuestion, resolution: ForecastResolution, *extra: Any) -> str:
+    r"""Fingerprint the content a journaled result depends on besides subject id and reference time.
+
+    Covers the question content and the resolution outcome plus any ``extra``
+    parts (e.g. tags). Generated question metadata and ``resolved_at`` are
+    excluded, since they change every time an item is constructed.
+    """
+    return config_fingerprint(question.model_dump(mode="json", exclude={"metadata"}), resolution.outcome, *extra)
+
+
+class ResultJournal:
+    r"""JSONL journal of completed evaluation results.
+
+    Args:
+        path: Location of the journal file. Parent directories are created on
+            first write.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    @staticmethod
+    def key(subject_id: str, reference_time: Optional[datetime] = None, content: Optional[str] = None) -> str:
+        r"""Return the journal key for a subject at a reference time, optionally with an ``item_fingerprint``."""
+        key = subject_id if reference_time is None else f"{subject_id}@{reference_time.isoformat()}"
+        return key if content is None else f"{key}#{content}"
+
+    def load(self) -> dict[str, EvaluationResult]:
+        r"""Load journaled results, keeping the last entry for each key.
+
+        A truncated trailing line (e.g. from a crash mid-write) is skipped.
+        """
+        entries: dict[str, EvaluationResult] = {}
+        if not self.path.exists():
+            return entries
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    entries[record["key"]] = EvaluationResult.model_validate(record["result"])
+                except (ValueError, KeyError) as e:
+                    logger.warning("Skipping unreadable journal entry %s:%d: %s", self.path, line_number, e)
+        return entries
+
+    def append(self, key: str, result: EvaluationResult) -> None:
+        r"""Append a completed result; results carrying an ``error`` are not journaled."""
+        if "error" in result.metadata:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({"key": key, "result": result.model_dump(mode="json")})
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
@@ -0,0 +1,131 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Memoization of deterministic orchestrator nodes across arms and runs.
+
+Ingestion and retrieval nodes produce the same output for a (subject, reference
+time) pair no matter which reasoning model runs downstream. ``NodeMemo`` wraps
+the nodes marked as deterministic on an orchestrator. The first run of such a
+node records its output and the ``state.context`` entries it added or changed.
+Later runs for the same subject and reference time restore both without
+calling the node, so only the downstream nodes execute. Graph routing is
+unchanged, because the orchestrator still sees a normal node result.
+
+Memoized outputs and context values must be JSON-serializable. Node outputs are
+returned in their JSON form on the first run as well, so every arm sees the
+same values. Entries live in memory, or in a ``PredictionCache`` when
+one is supplied, so they can be shared across processes and runs.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any, Optional
+
+import pydantic_core
+
+# From xrtm-forecast (Internal)
+from xrtm.forecast.core.orchestrator import Orchestrator
+from xrtm.forecast.core.schemas.graph import BaseGraphState
+
+from xrtm.train.simulation.cache import PredictionCache, config_fingerprint
+
+__all__ = ["NodeMemo", "is_wrapped"]
+
+
+def is_wrapped(func: Any, marker: str, owner: Any = True) -> bool:
+    r"""Return whether ``func`` or any function it wraps (via ``__wrapped__``) carries ``marker`` set to ``owner``."""
+    while func is not None:
+        if getattr(func, marker, None) is owner:
+            return True
+        func = getattr(func, "__wrapped__", None)
+    return False
+
+
+def _encoded(value: Any) -> bytes:
+    return pydantic_core.to_json(value, fallback=repr)
+
+
+class NodeMemo:
+    r"""Caches the outputs and context updates of deterministic orchestrator nodes.
+
+    Args:
+        nodes: Names of the nodes whose results depend only on the subject and
+            reference time.
+        fingerprint: Description of the deterministic nodes' configuration (e.g.
+            retrieval index version); entries from other fingerprints are never
+            reused.
+        cache: Optional persistent store for the entries. Defaults to memory.
+    """
+
+    def __init__(self, nodes: Sequence[str], fingerprint: str = "default", cache: Optional[PredictionCache] = None):
+        self.nodes = list(nodes)
+        self.fingerprint = fingerprint
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[tuple[str, str, str], Any] = {}
+
+    def install(self, orchestrator: Orchestrator) -> None:
+        r"""Wrap the memoized nodes of ``orchestrator`` in place (idempotent)."""
+        for name in self.nodes:
+            func = orchestrator.nodes.get(name)
+            if func is None:
+                raise ValueError(f"Orchestrator has no node named {name!r}")
+            if is_wrapped(func, "__node_memo__", self):
+                continue
+            orchestrator.nodes[name] = self._wrap(name, func)
+
+    def _wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        fingerprint = config_fingerprint(self.fingerprint, name)
+
+        async def memoized(state: BaseGraphState, *args: Any, **kwargs: Any) -> Any:
+            reference_time = state.temporal_context.reference_time if state.temporal_context else None
+            entry = self._get(fingerprint, state, reference_time)
+            if entry is not None:
+                self.hits += 1
+                state.context.update(entry["context"])
+                return entry["output"]
+
+            self.misses += 1
+            before = {key: _encoded(value) for key, value in state.context.items()}
+            output = await func(state, *args, **kwargs)
+            changed = {
+                key: value
+                for key, value in state.context.items()
+                if key not in before or before[key] != _encoded(value)
+            }
+            entry = pydantic_core.to_jsonable_python({"output": output, "context": changed})
+            self._put(fingerprint, state, reference_time, entry)
+            return entry["output"]
+
+        memoized.__node_memo__ = self  # type: ignore[attr-defined]
+        memoized.__wrapped__ = func  # type: ignore[attr-defined]
+        return memoized
+
+    # Cache access stays on the event loop thread: backtest nodes run under
+    # ``freeze_time``, which does not survive handing work to another thread.
+    def _get(self, fingerprint: str, state: BaseGraphState, reference_time: Any) -> Optional[Any]:
+        if self.cache is not None:
+            return self.cache.get(fingerprint, state.subject_id, reference_time)
+        return self._entries.get((fingerprint, state.subject_id, str(reference_time)))
+
+    def _put(self, fingerprint: str, state: BaseGraphState, reference_time: Any, entry: Any) -> None:
+        if self.cache is not None:
+            self.cache.put(fingerprint, state.subject_id, entry, reference_time)
+        else:
+            self._entries[(fingerprint, state.subject_id, str(reference_time))] = entry
+
+    def metrics(self) -> dict[str, float]:
+        r"""Return hit and miss counts of memoized node calls since the memo was created."""
+        return {"node_memo_hits": float(self.hits), "node_memo_misses": float(self.misses)}
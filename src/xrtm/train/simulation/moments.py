@@ -0,0 +1,65 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Numerically stable running moments for streaming score aggregation."""
+
+import math
+
+__all__ = ["RunningMoments"]
+
+
+class RunningMoments:
+    r"""Welford's online mean and variance, mergeable across partitions.
+
+    Attributes:
+        count: Number of observations.
+        mean: Running mean.
+        m2: Sum of squared deviations from the mean.
+    """
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def update(self, value: float) -> None:
+        r"""Fold one observation into the moments."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningMoments") -> None:
+        r"""Combine another partition into this one (Chan et al. parallel update)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    @property
+    def variance(self) -> float:
+        r"""Unbiased sample variance (0 for fewer than two observations)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std_error(self) -> float:
+        r"""Standard error of the mean."""
+        return math.sqrt(self.variance / self.count) if self.count > 1 else math.inf
@@ -0,0 +1,189 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Multi-process sharded execution of backtests.
+
+Asyncio concurrency inside a single process stops scaling once prompt building,
+Pydantic validation and payload serialization saturate a core. The
+``ProcessPoolBacktestRunner`` partitions a ``BacktestDataset`` into contiguous
+shards, runs each shard in a worker process with its own event loop and
+orchestrator instance, and merges the per-shard ``ReportAggregator`` states
+into a single ``EvaluationReport`` whose calibration bins and slices cover the
+union. Options that act on the whole run are applied to the merged report:
+bootstrap intervals are computed over all results, and node memo and adaptive
+concurrency counters are summed across shards, and a ``result_writer`` receives
+the merged results from the parent process. Options whose state would have to be
+shared across processes (``early_stopping``, ``budget``, ``shard``,
+``latency_history``, ``payload_store``, ``tracer``) are rejected.
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional
+
+# From xrtm-eval
+from xrtm.eval.core.eval.definitions import EvaluationReport, Evaluator
+from xrtm.eval.kit.eval.metrics import BrierScoreEvaluator
+
+# From xrtm-forecast (Internal)
+from xrtm.forecast.core.orchestrator import Orchestrator
+
+from xrtm.train.simulation.aggregation import ReportAggregator
+from xrtm.train.simulation.bootstrap import Bootstrap
+from xrtm.train.simulation.export import ArrowResultWriter
+from xrtm.train.simulation.runner import BacktestDataset, BacktestInstance, BacktestRunner
+from xrtm.train.simulation.scoring import evaluator_metric
+
+__all__ = ["ProcessPoolBacktestRunner"]
+logger = logging.getLogger(__name__)
+
+# Options whose state cannot be shared between worker processes: run-level
+# limits, files every worker would write independently, and unpicklable tracers.
+_UNSUPPORTED_OPTIONS = ("early_stopping", "budget", "shard", "latency_history", "payload_store", "tracer")
+
+
+class ProcessPoolBacktestRunner:
+    r"""Runs a backtest across worker processes and merges the shard results.
+
+    Args:
+        orchestrator_factory: Picklable zero-argument callable (e.g. a module-level
+            function) that builds a fresh orchestrator inside each worker process.
+        evaluator: Picklable scoring backend; defaults to the ``BacktestRunner`` default.
+        processes: Number of worker processes. Defaults to ``os.cpu_count()``.
+        chunk_size: Number of instances per shard. Defaults to an even split
+            across ``processes``; smaller chunks balance uneven workloads.
+        mp_context: Optional ``multiprocessing`` context (e.g. ``"spawn"``).
+        **runner_options: Additional picklable ``BacktestRunner`` keyword
+            arguments applied in every worker (``entry_node``, ``concurrency``,
+            ``journal``, ``prediction_cache``, ...). ``bootstrap`` is applied
+            to the merged report and ``result_writer`` is written from the
+            parent process instead.
+
+    Raises:
+        ValueError: If ``runner_options`` contains ``early_stopping``,
+            ``budget``, ``shard``, ``latency_history``, ``payload_store`` or
+            ``tracer``, which only hold within a single process.
+    """
+
+    def __init__(
+        self,
+        orchestrator_factory: Callable[[], Orchestrator],
+        evaluator: Optional[Evaluator] = None,
+        processes: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        mp_context: Optional[str] = None,
+        **runner_options: Any,
+    ):
+        processes = processes or os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError("processes must be >= 1")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        unsupported = [name for name in _UNSUPPORTED_OPTIONS if runner_options.get(name) is not None]
+        if unsupported:
+            raise ValueError(f"ProcessPoolBacktestRunner does not support {', '.join(unsupported)}")
+        self.bootstrap: Optional[Bootstrap] = runner_options.pop("bootstrap", None)
+        self.result_writer: Optional[ArrowResultWriter] = runner_options.pop("result_writer", None)
+        self.orchestrator_factory = orchestrator_factory
+        self.evaluator = evaluator
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self.mp_context = mp_context
+        self.runner_options = runner_options
+
+    def _shards(self, items: List[BacktestInstance]) -> List[tuple[int, List[BacktestInstance]]]:
+        if not items:
+            return []
+        size = self.chunk_size or math.ceil(len(items) / self.processes)
+        return [(start, items[start : start + size]) for start in range(0, len(items), size)]
+
+    async def run(self, dataset: BacktestDataset) -> EvaluationReport:
+        r"""Run every shard in the process pool and return the merged report."""
+        shards = self._shards(dataset.items)
+        aggregator = ReportAggregator(
+            metric_name=evaluator_metric(self.evaluator or BrierScoreEvaluator()),
+            columnar=self.runner_options.get("columnar_results", False),
+        )
+        metrics: dict[str, float] = {}
+        if shards:
+            context = multiprocessing.get_context(self.mp_context) if self.mp_context else None
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=min(self.processes, len(shards)), mp_context=context) as pool:
+                futures = [
+                    loop.run_in_executor(
+                        pool,
+                        _run_shard,
+                        self.orchestrator_factory,
+                        self.evaluator,
+                        self.runner_options,
+                        start,
+                        shard,
+                    )
+                    for start, shard in shards
+                ]
+                for shard_aggregator, shard_metrics in await asyncio.gather(*futures):
+                    aggregator.merge(shard_aggregator)
+                    _merge_metrics(metrics, shard_metrics)
+            logger.info("Merged %d results from %d shards", aggregator.moments.count, len(shards))
+        report = aggregator.report()
+        report.summary_statistics.update(metrics)
+        if self.result_writer is not None:
+            results = report.columns if report.columns is not None else report.results
+            for index, result in enumerate(results):
+                self.result_writer.write(result, index)
+        if self.bootstrap is not None:
+            self.bootstrap.apply(report, report.columns)
+        return report
+
+
+def _run_shard(
+    orchestrator_factory: Callable[[], Orchestrator],
+    evaluator: Optional[Evaluator],
+    runner_options: dict[str, Any],
+    offset: int,
+    items: List[BacktestInstance],
+) -> tuple[ReportAggregator, dict[str, float]]:
+    runner = BacktestRunner(orchestrator=orchestrator_factory(), evaluator=evaluator, **runner_options)
+    return asyncio.run(_aggregate_shard(runner, offset, items))
+
+
+async def _aggregate_shard(
+    runner: BacktestRunner, offset: int, items: List[BacktestInstance]
+) -> tuple[ReportAggregator, dict[str, float]]:
+    r"""Aggregate one shard and return it with the shard's memo and concurrency counters."""
+    aggregator = runner.aggregator()
+    memo_before = runner.node_memo.metrics() if runner.node_memo is not None else {}
+    async for progress in runner.stream(items):
+        aggregator.update(progress.result, offset + progress.index)
+    metrics: dict[str, float] = {}
+    if runner.node_memo is not None:
+        metrics.update({name: value - memo_before[name] for name, value in runner.node_memo.metrics().items()})
+    if runner.adaptive_concurrency is not None:
+        metrics.update(runner.adaptive_concurrency.metrics())
+    return aggregator, metrics
+
+
+def _merge_metrics(merged: dict[str, float], metrics: dict[str, float]) -> None:
+    for name, value in metrics.items():
+        if name == "concurrency_limit":
+            # Every worker ends with its own limit; report the largest.
+            merged[name] = max(merged.get(name, value), value)
+        else:
+            merged[name] = merged.get(name, 0.0) + value
@@ -0,0 +1,115 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Sidecar storage for result payloads in memory-bounded runs.
+
+The ``resolution_payload`` and ``prediction_payload`` attached to each result,
+including reasoning and execution traces, account for most of the memory a
+large backtest retains. ``PayloadStore.spill`` appends them to a sidecar JSONL
+file as results complete and replaces them with a small
+``metadata["payload_ref"]`` (byte offset and length). The in-memory report then
+holds only scalars. ``load`` and ``restore`` read payloads back on demand. The
+file is only ever appended to, so references stay valid across resumed runs
+that share a store.
+"""
+
+import json
+import logging
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional, Union
+
+import pydantic_core
+
+# From xrtm-eval
+from xrtm.eval.core.eval.definitions import EvaluationResult
+
+from xrtm.train.simulation.export import PAYLOAD_FIELDS
+
+__all__ = ["PAYLOAD_REF_KEY", "PayloadStore"]
+logger = logging.getLogger(__name__)
+
+PAYLOAD_REF_KEY = "payload_ref"
+
+
+class PayloadStore:
+    r"""Append-only JSONL store of spilled result payloads.
+
+    Args:
+        path: Sidecar file. Parent directories are created on first write.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.spilled = 0
+        self._file: Any = None
+
+    def __enter__(self) -> "PayloadStore":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def spill(self, result: EvaluationResult) -> EvaluationResult:
+        r"""Move the payloads of ``result`` to the store, in place, and return it.
+
+        Results without payloads (or already spilled) are left unchanged.
+        """
+        payloads = {key: result.metadata.pop(key) for key in PAYLOAD_FIELDS if key in result.metadata}
+        if not payloads:
+            return result
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "ab")
+        offset = self._file.tell()
+        data = pydantic_core.to_json(payloads, fallback=repr) + b"\n"
+        self._file.write(data)
+        result.metadata[PAYLOAD_REF_KEY] = {"offset": offset, "length": len(data)}
+        self.spilled += 1
+        return result
+
+    def load(self, ref: dict[str, int]) -> dict[str, Any]:
+        r"""Return the payloads stored under a ``payload_ref``."""
+        if self._file is not None:
+            self._file.flush()
+        with open(self.path, "rb") as f:
+            f.seek(ref["offset"])
+            return json.loads(f.read(ref["length"]))
+
+    def restore(self, result: EvaluationResult) -> EvaluationResult:
+        r"""Return a copy of ``result`` with its spilled payloads put back into the metadata."""
+        ref = result.metadata.get(PAYLOAD_REF_KEY)
+        if ref is None:
+            return result
+        metadata = {key: value for key, value in result.metadata.items() if key != PAYLOAD_REF_KEY}
+        metadata.update(self.load(ref))
+        return result.model_copy(update={"metadata": metadata})
+
+    def flush(self) -> None:
+        r"""Flush buffered payloads to disk."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        r"""Flush and close the sidecar file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            logger.info("Spilled payloads of %d results to %s", self.spilled, self.path)
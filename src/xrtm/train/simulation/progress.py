@@ -0,0 +1,226 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Live progress and throughput reporting for long backtests.
+
+A ``ProgressMonitor`` counts completed and failed items as a runner yields
+them, and reads the in-flight count and queue depth from the runner's
+``BoundedExecutor``. Every ``interval`` seconds, and once more when the run
+ends, it builds a ``ProgressSnapshot`` (throughput, error rate, ETA) and passes
+it to its sinks. ``StderrProgressReporter`` prints one line per snapshot.
+``PrometheusTextfileSink`` rewrites a metrics file in the Prometheus text
+format, for node_exporter's textfile collector. Any callable that accepts a
+snapshot can be a sink.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any, Optional, TextIO, Union
+
+from pydantic import BaseModel
+
+from xrtm.train.simulation.execution import BoundedExecutor
+
+__all__ = ["PrometheusTextfileSink", "ProgressMonitor", "ProgressSnapshot", "StderrProgressReporter"]
+logger = logging.getLogger(__name__)
+
+ProgressSink = Callable[["ProgressSnapshot"], None]
+
+
+class ProgressSnapshot(BaseModel):
+    """Point-in-time progress and throughput of a run."""
+
+    timestamp: float
+    elapsed: float
+    completed: int
+    total: Optional[int] = None
+    in_flight: int = 0
+    queue_depth: int = 0
+    errors: int = 0
+    items_per_second: float = 0.0
+    error_rate: float = 0.0
+    eta_seconds: Optional[float] = None
+    finished: bool = False
+
+
+class ProgressMonitor:
+    r"""Periodically reports run progress to a set of sinks.
+
+    Args:
+        sinks: Callables receiving each ``ProgressSnapshot``. Defaults to a
+            ``StderrProgressReporter``.
+        interval: Seconds between snapshots while the run is in progress.
+    """
+
+    def __init__(self, sinks: Optional[Sequence[ProgressSink]] = None, interval: float = 10.0):
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.sinks: list[ProgressSink] = list(sinks) if sinks is not None else [StderrProgressReporter()]
+        self.interval = interval
+        self.completed = 0
+        self.errors = 0
+        self.total: Optional[int] = None
+        self._executor: Optional[BoundedExecutor[Any, Any]] = None
+        self._started = 0.0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self, executor: BoundedExecutor[Any, Any], total: Optional[int] = None) -> None:
+        r"""Begin tracking a run and start the periodic reporting task."""
+        self.completed = 0
+        self.errors = 0
+        self.total = total
+        self._executor = executor
+        self._started = time.perf_counter()
+        self._task = asyncio.create_task(self._report_periodically())
+
+    def update(self, error: bool = False) -> None:
+        r"""Count one completed item."""
+        self.completed += 1
+        if error:
+            self.errors += 1
+
+    async def stop(self) -> None:
+        r"""Stop periodic reporting and emit a final snapshot."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.emit(finished=True)
+
+    def snapshot(self, finished: bool = False) -> ProgressSnapshot:
+        r"""Return the current progress without reporting it."""
+        elapsed = time.perf_counter() - self._started if self._started else 0.0
+        rate = self.completed / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.total is not None and rate > 0:
+            eta = max(self.total - self.completed, 0) / rate
+        executor = self._executor
+        return ProgressSnapshot(
+            timestamp=time.time(),
+            elapsed=elapsed,
+            completed=self.completed,
+            total=self.total,
+            in_flight=executor.in_flight if executor is not None else 0,
+            queue_depth=executor.queue_depth if executor is not None else 0,
+            errors=self.errors,
+            items_per_second=rate,
+            error_rate=self.errors / self.completed if self.completed else 0.0,
+            eta_seconds=eta,
+            finished=finished,
+        )
+
+    def emit(self, finished: bool = False) -> ProgressSnapshot:
+        r"""Build a snapshot and pass it to every sink; sink failures are logged, not raised."""
+        snapshot = self.snapshot(finished)
+        for sink in self.sinks:
+            try:
+                sink(snapshot)
+            except Exception as e:
+                logger.warning("Progress sink %r failed: %s", sink, e)
+        return snapshot
+
+    async def _report_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.emit()
+
+
+def _duration(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{secs:02d}"
+
+
+class StderrProgressReporter:
+    r"""Prints one progress line per snapshot.
+
+    Args:
+        stream: Output stream. Defaults to ``sys.stderr`` at the time of each write.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+
+    def __call__(self, snapshot: ProgressSnapshot) -> None:
+        done = f"{snapshot.completed}/{snapshot.total}" if snapshot.total is not None else str(snapshot.completed)
+        eta = _duration(snapshot.eta_seconds) if snapshot.eta_seconds is not None else "?"
+        line = (
+            f"[backtest] {done} done, {snapshot.in_flight} in flight, {snapshot.queue_depth} queued, "
+            f"{snapshot.items_per_second:.2f} items/s, {snapshot.error_rate:.1%} errors, "
+            f"elapsed {_duration(snapshot.elapsed)}, eta {eta}"
+        )
+        if snapshot.finished:
+            line += " (finished)"
+        stream = self.stream or sys.stderr
+        stream.write(line + "\n")
+        stream.flush()
+
+
+class PrometheusTextfileSink:
+    r"""Writes snapshots as Prometheus gauges for node_exporter's textfile collector.
+
+    The file is replaced atomically on each snapshot, so scrapers never read a
+    partial file.
+
+    Args:
+        path: Output file, conventionally ending in ``.prom``.
+        prefix: Metric name prefix.
+        labels: Constant labels added to every metric (e.g. the arm name).
+    """
+
+    def __init__(self, path: Union[str, Path], prefix: str = "xrtm_backtest", labels: Optional[dict[str, str]] = None):
+        self.path = Path(path)
+        self.prefix = prefix
+        self.labels = dict(labels or {})
+
+    def render(self, snapshot: ProgressSnapshot) -> str:
+        r"""Return the metrics text for a snapshot."""
+        label_text = ",".join(f'{key}="{_escape(value)}"' for key, value in sorted(self.labels.items()))
+        suffix = f"{{{label_text}}}" if label_text else ""
+        metrics: list[tuple[str, Optional[float], str]] = [
+            ("items_completed", snapshot.completed, "Items completed so far."),
+            ("items_total", snapshot.total, "Items in the dataset, when known."),
+            ("items_in_flight", snapshot.in_flight, "Items currently being processed."),
+            ("queue_depth", snapshot.queue_depth, "Items buffered ahead of the workers."),
+            ("errors", snapshot.errors, "Items that finished with an error."),
+            ("items_per_second", snapshot.items_per_second, "Average throughput since the run started."),
+            ("error_rate", snapshot.error_rate, "Fraction of completed items that failed."),
+            ("eta_seconds", snapshot.eta_seconds, "Estimated seconds until the run completes."),
+            ("elapsed_seconds", snapshot.elapsed, "Seconds since the run started."),
+            ("finished", float(snapshot.finished), "1 once the run has ended."),
+        ]
+        lines = []
+        for name, value, help_text in metrics:
+            if value is None:
+                continue
+            lines.append(f"# HELP {self.prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {self.prefix}_{name} gauge")
+            lines.append(f"{self.prefix}_{name}{suffix} {float(value)!r}")
+        return "\n".join(lines) + "\n"
+
+    def __call__(self, snapshot: ProgressSnapshot) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(self.render(snapshot), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
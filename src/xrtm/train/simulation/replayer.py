@@ -36,29 +36,41 @@ from xrtm.forecast.core.orchestrator import Orchestrator
 from xrtm.forecast.core.schemas.graph import BaseGraphState
 
 from xrtm.train.simulation.runner import BacktestRunner
+from xrtm.train.simulation.tracing import Tracer
 
 __all__ = ["TraceReplayer"]
 logger = logging.getLogger(__name__)
 
 
 class TraceReplayer:
-    """Utility class for saving, loading, and replaying execution traces."""
+    """Utility class for saving, loading, and replaying execution traces.
+
+    Args:
+        tracer: Optional ``Tracer`` recording spans for trace loading and the
+            scoring stages of each replayed evaluation. The static save methods
+            take their own ``tracer``, since they run without an instance.
+    """
+
+    def __init__(self, tracer: Optional[Tracer] = None):
+        self.tracer = tracer or Tracer()
 
     @staticmethod
-    def save_execution_trace(state: BaseGraphState, path: str) -> None:
-        try:
-            json_str = state.model_dump_json(indent=2)
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(json_str)
-            logger.info("Execution trace saved to %s", path)
-        except Exception as e:
-            logger.error("Failed to save execution trace to %s: %s", path, e)
-            raise
+    def save_execution_trace(state: BaseGraphState, path: str, tracer: Optional[Tracer] = None) -> None:
+        r"""Write ``state`` to ``path`` as JSON, inside a ``save_trace`` span when a ``tracer`` is given."""
+        with (tracer or Tracer()).span("save_trace", state.subject_id, trace_path=path):
+            try:
+                json_str = state.model_dump_json(indent=2)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(json_str)
+                logger.info("Execution trace saved to %s", path)
+            except Exception as e:
+                logger.error("Failed to save execution trace to %s: %s", path, e)
+                raise
 
     @staticmethod
-    async def save_execution_trace_async(state: BaseGraphState, path: str) -> None:
+    async def save_execution_trace_async(state: BaseGraphState, path: str, tracer: Optional[Tracer] = None) -> None:
         r"""Asynchronously save an execution trace without blocking the event loop."""
-        await asyncio.to_thread(TraceReplayer.save_execution_trace, state, path)
+        await asyncio.to_thread(TraceReplayer.save_execution_trace, state, path, tracer)
 
     @staticmethod
     def load_execution_trace(path: str) -> BaseGraphState:
@@ -77,14 +89,14 @@ class TraceReplayer:
         return await asyncio.to_thread(TraceReplayer.load_execution_trace, path)
 
     @staticmethod
-    def save_trace(state: BaseGraphState, path: str) -> None:
+    def save_trace(state: BaseGraphState, path: str, tracer: Optional[Tracer] = None) -> None:
         r"""Backward compatibility wrapper for ``save_execution_trace``."""
-        TraceReplayer.save_execution_trace(state, path)
+        TraceReplayer.save_execution_trace(state, path, tracer)
 
     @staticmethod
-    async def save_trace_async(state: BaseGraphState, path: str) -> None:
+    async def save_trace_async(state: BaseGraphState, path: str, tracer: Optional[Tracer] = None) -> None:
         r"""Backward compatibility wrapper for ``save_execution_trace_async``."""
-        await TraceReplayer.save_execution_trace_async(state, path)
+        await TraceReplayer.save_execution_trace_async(state, path, tracer)
 
     @staticmethod
     def load_trace(path: str) -> BaseGraphState:
@@ -103,8 +115,21 @@ class TraceReplayer:
         evaluator: Optional[Evaluator] = None,
         subject_id_override: Optional[str] = None,
     ) -> EvaluationResult:
-        state = self.load_execution_trace(trace_path)
-        subject_id = subject_id_override or state.subject_id
+        with self.tracer.span("replay", subject_id_override, trace_path=trace_path) as span:
+            with self.tracer.span("load_trace"):
+                state = self.load_execution_trace(trace_path)
+            subject_id = subject_id_override or state.subject_id
+            if span is not None:
+                span.subject_id = subject_id
+            return self._replay_state(state, resolution, evaluator, subject_id)
+
+    def _replay_state(
+        self,
+        state: BaseGraphState,
+        resolution: ForecastResolution | float | str,
+        evaluator: Optional[Evaluator],
+        subject_id: str,
+    ) -> EvaluationResult:
         if not isinstance(resolution, ForecastResolution):
             resolved_at = (
                 state.temporal_context.reference_time
@@ -118,7 +143,7 @@ class TraceReplayer:
                 metadata={"source": "replay_override"},
             )
         dummy_orch: Orchestrator[BaseGraphState] = Orchestrator()
-        runner = BacktestRunner(orchestrator=dummy_orch, evaluator=evaluator)
+        runner = BacktestRunner(orchestrator=dummy_orch, evaluator=evaluator, tracer=self.tracer)
         result = runner.evaluate_state(
             state=state,
             resolution=resolution,
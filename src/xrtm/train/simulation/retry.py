@@ -0,0 +1,106 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Retry with exponential backoff for transient inference failures.
+
+Without retries, a single transient timeout from an inference server is scored
+as a worst-case failure and skews the aggregate score. ``RetryPolicy`` retries
+errors classified as transient with exponentially growing, jittered delays,
+and leaves fatal errors (schema or resolution mismatches) to fail immediately.
+"""
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from typing import Optional, TypeVar
+
+__all__ = ["RetryPolicy", "is_transient_error"]
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TRANSIENT_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+# Client library errors matched by name so the SDKs stay optional.
+TRANSIENT_ERROR_NAMES = {"APITimeoutError", "APIConnectionError", "RateLimitError", "ServerDisconnectedError"}
+
+
+def is_transient_error(error: BaseException) -> bool:
+    r"""Classify timeouts, connection failures and retryable HTTP statuses as transient."""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    if isinstance(status, int):
+        return status in TRANSIENT_STATUS_CODES
+    return type(error).__name__ in TRANSIENT_ERROR_NAMES
+
+
+class RetryPolicy:
+    r"""Exponential backoff with jitter and pluggable error classification.
+
+    Args:
+        max_attempts: Total attempts including the first call.
+        base_delay: Delay in seconds before the first retry.
+        max_delay: Upper bound on a single delay.
+        jitter: Fraction of each delay that is randomized, in ``[0, 1]``.
+        retry_on: Predicate deciding whether an error is retryable. Defaults to
+            ``is_transient_error``.
+        seed: Optional seed for reproducible jitter.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
+        retry_on: Callable[[BaseException], bool] = is_transient_error,
+        seed: Optional[int] = None,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("delays must be >= 0")
+        if not 0.0 <= jitter <= 1.0:
+            raise ValueError("jitter must be in [0, 1]")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_on = retry_on
+        self._random = random.Random(seed)
+
+    def is_retryable(self, error: BaseException) -> bool:
+        r"""Return whether ``error`` is classified as retryable."""
+        return self.retry_on(error)
+
+    def delay(self, attempt: int) -> float:
+        r"""Return the backoff delay after the given (1-based) failed attempt."""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * (1.0 - self.jitter * self._random.random())
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        r"""Call ``func`` until it succeeds, a fatal error occurs, or attempts run out."""
+        attempt = 1
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                if attempt >= self.max_attempts or not self.is_retryable(e):
+                    raise
+                delay = self.delay(attempt)
+                logger.warning("Attempt %d failed (%s); retrying in %.2fs", attempt, e, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
@@ -23,8 +23,21 @@ and tag-based slice analytics.
 
 import asyncio
 import logging
+import time
+from collections import Counter, OrderedDict
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Sized,
+)
 from datetime import datetime
-from typing import List, Optional, Self
+from typing import Any, List, Optional, Self, Union
 
 from pydantic import BaseModel, model_validator
 
@@ -32,31 +45,54 @@ from pydantic import BaseModel, model_validator
 from xrtm.data.core.schemas.forecast import ForecastOutput, ForecastQuestion
 
 # From xrtm-eval
-from xrtm.eval.core.eval.definitions import EvaluationReport, EvaluationResult, Evaluator
+from xrtm.eval.core.eval.definitions import EvaluationResult, Evaluator
 from xrtm.eval.core.schemas import ForecastResolution
-from xrtm.eval.kit.eval.analytics import SliceAnalytics
-from xrtm.eval.kit.eval.metrics import BrierScoreEvaluator, ExpectedCalibrationErrorEvaluator
+from xrtm.eval.kit.eval.metrics import BrierScoreEvaluator
 
 # From xrtm-forecast (Internal)
 from xrtm.forecast.core.orchestrator import Orchestrator
 from xrtm.forecast.core.schemas.graph import BaseGraphState, TemporalContext
 
+from xrtm.train.simulation.aggregation import BacktestReport, ReportAggregator
 from xrtm.train.simulation.artifacts import (
     normalize_binary_outcome,
     prediction_value_and_payload,
     resolution_payload,
     validate_resolution_for_question,
 )
+from xrtm.train.simulation.bootstrap import Bootstrap
+from xrtm.train.simulation.budget import BudgetExhausted, RunBudget
+from xrtm.train.simulation.cache import PredictionCache, config_fingerprint
+from xrtm.train.simulation.concurrency import AdaptiveConcurrency
+from xrtm.train.simulation.execution import BoundedExecutor
+from xrtm.train.simulation.export import ArrowResultWriter
+from xrtm.train.simulation.journal import ResultJournal, item_fingerprint
+from xrtm.train.simulation.memo import NodeMemo, is_wrapped
+from xrtm.train.simulation.moments import RunningMoments
+from xrtm.train.simulation.payloads import PayloadStore
+from xrtm.train.simulation.progress import ProgressMonitor
+from xrtm.train.simulation.retry import RetryPolicy
+from xrtm.train.simulation.scheduling import SCHEDULES, LatencyHistory, longest_expected_first
+from xrtm.train.simulation.scoring import evaluator_metric, rescore_results
+from xrtm.train.simulation.sharding import Shard
+from xrtm.train.simulation.stopping import EarlyStopping
+from xrtm.train.simulation.tracing import Tracer
 
 logger = logging.getLogger(__name__)
 
 class BacktestInstance(BaseModel):
-    """Represents a single forecast-request / resolution pair in a backtest dataset."""
+    """Represents a single forecast-request / resolution pair in a backtest dataset.
+
+    ``sample_weight`` and ``sample_stratum`` are set by ``StratifiedSampler`` and
+    copied into the result metadata for weighted aggregation.
+    """
 
     question: ForecastQuestion
     resolution: ForecastResolution
     reference_time: datetime
     tags: Optional[List[str]] = None
+    sample_weight: Optional[float] = None
+    sample_stratum: Optional[str] = None
 
     @model_validator(mode="after")
     def validate_resolution_matches_question(self) -> Self:
@@ -71,47 +107,275 @@ class BacktestDataset(BaseModel):
     items: List[BacktestInstance]
 
 
+BacktestSource = Union[
+    BacktestDataset,
+    Iterable[Union[BacktestInstance, Mapping[str, Any]]],
+    AsyncIterable[Union[BacktestInstance, Mapping[str, Any]]],
+]
+r"""A materialized dataset or a lazy (sync or async) iterable of instances or raw instance mappings."""
+
+
+class BacktestProgress(BaseModel):
+    """A single streamed backtest result together with running aggregates over completed items.
+
+    ``stop_reason`` is set once the runner has stopped dispatching new items.
+    """
+
+    index: int
+    result: EvaluationResult
+    completed: int
+    total: Optional[int] = None
+    error_count: int
+    mean_score: float
+    stop_reason: Optional[str] = None
+
+
 class BacktestRunner:
-    """Executes backtests on a dataset using a provided orchestrator."""
+    """Executes backtests on a dataset using a provided orchestrator.
+
+    When a ``journal`` is supplied, every scored result is appended to it as it
+    completes, and a restarted run skips items already present in the journal.
+    When a ``prediction_cache`` is supplied, orchestrator outputs are looked up by
+    question id, reference time, and ``cache_fingerprint`` before running the
+    graph. The fingerprint must describe the model and prompt configuration of
+    the arm, since the orchestrator object does not expose it. When
+    ``adaptive_concurrency`` is supplied, it replaces the fixed ``concurrency``
+    and adjusts the number of active workers from observed latency and errors.
+
+    ``item_timeout`` bounds each orchestrator run; a timed-out item is scored as
+    a failure. With ``hedge_percentile`` set, once the source has drained, any
+    item still running longer than that percentile of completed item latencies
+    gets one speculative duplicate run, and the first successful run wins.
+
+    With a ``retry_policy``, transient orchestrator failures are retried with
+    backoff before an item is scored as a failure; results then record the
+    number of ``attempts`` and failed results whether the error was ``retryable``.
+
+    ``schedule="longest_first"`` dispatches a materialized dataset in order of
+    descending expected latency from ``latency_history`` (results are still
+    reported in input order). When a ``latency_history`` is supplied, observed
+    latencies are recorded into it and it is saved at the end of the run.
+
+    With ``early_stopping``, dispatching stops once the confidence interval on the
+    running mean score meets the rule; in-flight items complete and the report
+    is flagged with ``metadata["early_stopped"]``.
+
+    ``columnar_results=True`` keeps per-item results in a memory-compact
+    ``ColumnarResults`` container exposed as ``report.columns`` instead of
+    ``report.results``, for runs too large to hold as Pydantic models. A
+    ``result_writer`` receives every result as it completes, for Parquet/Arrow
+    export during the run; the caller closes it afterwards.
+
+    With a ``bootstrap``, ``run`` adds bootstrap confidence intervals for the
+    mean score and ECE to the report's and each slice's ``summary_statistics``.
+
+    ``deduplicate=True`` coalesces items with the same question id, reference
+    time and question content into one orchestrator call per run. Every copy is
+    still scored against its own resolution, and copies that reused another
+    item's forecast are marked with ``metadata["deduplicated"]``.
+
+    ``evaluator`` may be a list of evaluators. The first one produces each
+    result's ``score`` and the report's ``mean_score``; every evaluator's score
+    is recorded in ``metadata["scores"]`` keyed by metric name, and the report
+    carries one entry per metric in ``metric_reports``, all from a single run.
+    Failed items score 1.0 under every metric, as they do for ``score``.
+
+    A ``node_memo`` is installed on the orchestrator so deterministic nodes
+    (ingestion, retrieval) reuse their outputs across arms and runs for the
+    same subject and reference time; ``run`` reports the hits and misses of
+    that run.
+
+    A ``tracer`` records a span per item and per stage (instance validation,
+    cache I/O, orchestrator run, resolution validation, scoring, payload
+    serialization, journal writes); the caller closes it afterwards.
+
+    A ``progress`` monitor reports completed and in-flight items, queue depth,
+    throughput, error rate and ETA to its sinks at a fixed interval while the
+    run is in progress, and once more when it ends.
+
+    With a ``payload_store``, each result's resolution and prediction payloads
+    are spilled to the store as soon as the result completes (before it is
+    journaled) and replaced by ``metadata["payload_ref"]``, so the report holds
+    only scalars; ``payload_store.restore(result)`` brings them back. The
+    caller closes the store afterwards.
+
+    A ``budget`` bounds ``run`` by wall-clock time and by orchestrator calls or
+    tokens. Once it is exhausted, dispatching stops; calls already started
+    finish when the call or token limit is hit, and are cancelled at the
+    deadline. ``run`` then returns a report over the completed items with
+    ``metadata["partial"]``, the ``budget_exhausted`` reason and, for
+    materialized datasets, the ids and positions of the skipped items.
+
+    With a ``shard``, only the items whose question id hashes to that shard are
+    run. Results keep their positions in the full dataset, and ``run`` attaches
+    the aggregate state (``BacktestReport.aggregate``) and
+    ``metadata["shard"]`` to the report, so the reports of all shards can be
+    combined with ``merge_reports``.
+    """
 
     def __init__(
         self,
         orchestrator: Orchestrator,
-        evaluator: Optional[Evaluator] = None,
+        evaluator: Optional[Union[Evaluator, Sequence[Evaluator]]] = None,
         entry_node: str = "ingestion",
         concurrency: int = 5,
+        queue_size: Optional[int] = None,
+        journal: Optional[ResultJournal] = None,
+        prediction_cache: Optional[PredictionCache] = None,
+        cache_fingerprint: Optional[str] = None,
+        adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
+        item_timeout: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_samples: int = 10,
+        retry_policy: Optional[RetryPolicy] = None,
+        schedule: str = "dataset",
+        latency_history: Optional[LatencyHistory] = None,
+        early_stopping: Optional[EarlyStopping] = None,
+        columnar_results: bool = False,
+        result_writer: Optional[ArrowResultWriter] = None,
+        bootstrap: Optional[Bootstrap] = None,
+        deduplicate: bool = False,
+        node_memo: Optional[NodeMemo] = None,
+        tracer: Optional[Tracer] = None,
+        progress: Optional[ProgressMonitor] = None,
+        payload_store: Optional[PayloadStore] = None,
+        budget: Optional[RunBudget] = None,
+        shard: Optional[Shard] = None,
     ):
         if concurrency < 1:
             raise ValueError("concurrency must be >= 1")
+        if schedule not in SCHEDULES:
+            raise ValueError(f"schedule must be one of {SCHEDULES}")
+        if item_timeout is not None and item_timeout <= 0:
+            raise ValueError("item_timeout must be > 0")
+        if hedge_percentile is not None and not 0.0 < hedge_percentile < 1.0:
+            raise ValueError("hedge_percentile must be in (0, 1)")
+        if prediction_cache is not None and not cache_fingerprint:
+            raise ValueError("prediction_cache requires a cache_fingerprint describing the model and prompts")
         self.orchestrator = orchestrator
-        self.evaluator = evaluator or BrierScoreEvaluator()
+        if isinstance(evaluator, Sequence):
+            self.evaluators: list[Evaluator] = list(evaluator) or [BrierScoreEvaluator()]
+        else:
+            self.evaluators = [evaluator or BrierScoreEvaluator()]
+        self.evaluator = self.evaluators[0]
         self.entry_node = entry_node
         self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.journal = journal
+        self.prediction_cache = prediction_cache
+        self.cache_fingerprint = cache_fingerprint or ""
+        self.adaptive_concurrency = adaptive_concurrency
+        self.item_timeout = item_timeout
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.retry_policy = retry_policy
+        self.schedule = schedule
+        self.latency_history = latency_history
+        self.early_stopping = early_stopping
+        self.columnar_results = columnar_results
+        self.result_writer = result_writer
+        self.bootstrap = bootstrap
+        self.deduplicate = deduplicate
+        self.node_memo = node_memo
+        if node_memo is not None:
+            node_memo.install(orchestrator)
+        self.tracer = tracer or Tracer()
+        self.progress = progress
+        self.payload_store = payload_store
+        self.budget = budget
+        self.shard = shard
 
-    async def _run_single(self, instance: BacktestInstance) -> EvaluationResult:
-        state = BaseGraphState(
-            subject_id=instance.question.id,
-            temporal_context=TemporalContext(reference_time=instance.reference_time, is_backtest=True),
-        )
-        state.context["question_title"] = instance.question.title
-        if instance.question.content:
-            state.context["question_content"] = instance.question.content
+    async def _run_single(
+        self, instance: BacktestInstance, context: Optional["_RunContext"] = None
+    ) -> EvaluationResult:
+        attempts = 0
+        shared = False
+
+        async def forecast() -> tuple[BaseGraphState, bool]:
+            nonlocal attempts, shared
+            attempts += 1
+            if not self.deduplicate or context is None:
+                return await self._forecast(instance)
+            state, cache_hit, shared = await context.single_flight(instance, self._forecast)
+            return state, cache_hit
 
         try:
-            await self.orchestrator.run(state, entry_node=self.entry_node)
-            return self.evaluate_state(
+            if self.retry_policy is None:
+                state, cache_hit = await forecast()
+            else:
+                state, cache_hit = await self.retry_policy.call(forecast)
+            result = self.evaluate_state(
                 state, instance.resolution, instance.question.id, instance.reference_time, instance.tags
             )
+            if cache_hit:
+                result.metadata["prediction_cache_hit"] = True
+            if shared:
+                result.metadata["deduplicated"] = True
+            if self.retry_policy is not None:
+                result.metadata["attempts"] = attempts
+            return result
+        except BudgetExhausted:
+            raise
         except Exception as e:
             logger.error("Backtest error on %s: %s", instance.question.id, e)
+            metadata: dict[str, Any] = {"error": str(e), "resolution_payload": resolution_payload(instance.resolution)}
+            if self.retry_policy is not None:
+                metadata["attempts"] = attempts
+                metadata["retryable"] = self.retry_policy.is_retryable(e)
+            if len(self.evaluators) > 1:
+                # Failures count against every metric, so per-metric reports cover the same items.
+                metadata["scores"] = {evaluator_metric(evaluator): _FAILURE_SCORE for evaluator in self.evaluators}
             return EvaluationResult(
                 subject_id=instance.question.id,
-                score=1.0,
+                score=_FAILURE_SCORE,
                 ground_truth=instance.resolution.outcome,
                 prediction=0.5,
-                metadata={"error": str(e), "resolution_payload": resolution_payload(instance.resolution)},
+                metadata=metadata,
             )
 
+    async def _forecast(self, instance: BacktestInstance) -> tuple[BaseGraphState, bool]:
+        r"""Return the post-run graph state for an instance and whether it came from the cache."""
+        cache = self.prediction_cache
+        if cache is not None:
+            with self.tracer.span("cache_lookup") as span:
+                cached = await asyncio.to_thread(
+                    cache.get, self.cache_fingerprint, instance.question.id, instance.reference_time
+                )
+                if span is not None:
+                    span.attributes["hit"] = cached is not None
+            if cached is not None:
+                return BaseGraphState.model_validate(cached), True
+
+        state = BaseGraphState(
+            subject_id=instance.question.id,
+            temporal_context=TemporalContext(reference_time=instance.reference_time, is_backtest=True),
+        )
+        state.context["question_title"] = instance.question.title
+        if instance.question.content:
+            state.context["question_content"] = instance.question.content
+        if self.budget is not None:
+            self.budget.reserve_call()
+        with self.tracer.span("orchestrator_run", entry_node=self.entry_node):
+            try:
+                await asyncio.wait_for(
+                    self.orchestrator.run(state, entry_node=self.entry_node), timeout=self.item_timeout
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"orchestrator run exceeded item_timeout of {self.item_timeout}s") from None
+        if self.budget is not None:
+            self.budget.charge(state.usage)
+
+        if cache is not None:
+            with self.tracer.span("cache_store"):
+                await asyncio.to_thread(
+                    cache.put,
+                    self.cache_fingerprint,
+                    instance.question.id,
+                    state.model_dump(mode="json"),
+                    instance.reference_time,
+                )
+        return state, False
+
     def evaluate_state(
         self,
         state: BaseGraphState,
@@ -120,83 +384,529 @@ class BacktestRunner:
         reference_time: Optional[datetime] = None,
         tags: Optional[List[str]] = None,
     ) -> EvaluationResult:
-        validated_resolution = validate_resolution_for_question(resolution, subject_id)
+        with self.tracer.span("validate_resolution", subject_id):
+            validated_resolution = validate_resolution_for_question(resolution, subject_id)
         prediction_val = 0.5
         prediction_payload = None
         prediction_node = None
-        for node_name, report in reversed(state.node_reports.items()):
-            if isinstance(report, ForecastOutput):
-                prediction_val, prediction_payload = prediction_value_and_payload(report)
-                prediction_node = node_name
-                break
-            elif isinstance(report, dict) and "probability" in report:
-                prediction_val, prediction_payload = prediction_value_and_payload(report)
-                prediction_node = node_name
-                break
-            elif isinstance(report, dict) and "confidence" in report:
-                prediction_val, prediction_payload = prediction_value_and_payload(report)
-                prediction_node = node_name
-                break
-            elif isinstance(report, (int, float)):
-                prediction_val, prediction_payload = prediction_value_and_payload(report)
-                prediction_node = node_name
-                break
-
-        gt_val = normalize_binary_outcome(validated_resolution.outcome)
-
-        eval_res = self.evaluator.evaluate(prediction=prediction_val, ground_truth=gt_val, subject_id=subject_id)
-        eval_res.metadata["resolution_payload"] = resolution_payload(validated_resolution)
+        with self.tracer.span("serialize_payloads", subject_id):
+            for node_name, report in reversed(state.node_reports.items()):
+                if isinstance(report, ForecastOutput):
+                    prediction_val, prediction_payload = prediction_value_and_payload(report)
+                    prediction_node = node_name
+                    break
+                elif isinstance(report, dict) and "probability" in report:
+                    prediction_val, prediction_payload = prediction_value_and_payload(report)
+                    prediction_node = node_name
+                    break
+                elif isinstance(report, dict) and "confidence" in report:
+                    prediction_val, prediction_payload = prediction_value_and_payload(report)
+                    prediction_node = node_name
+                    break
+                elif isinstance(report, (int, float)):
+                    prediction_val, prediction_payload = prediction_value_and_payload(report)
+                    prediction_node = node_name
+                    break
+            validated_payload = resolution_payload(validated_resolution)
+
+        with self.tracer.span("score", subject_id, metrics=len(self.evaluators)):
+            gt_val = normalize_binary_outcome(validated_resolution.outcome)
+
+            eval_res = self.evaluator.evaluate(prediction=prediction_val, ground_truth=gt_val, subject_id=subject_id)
+            if len(self.evaluators) > 1:
+                scores = {evaluator_metric(self.evaluator, eval_res): eval_res.score}
+                for evaluator in self.evaluators[1:]:
+                    extra = evaluator.evaluate(prediction=prediction_val, ground_truth=gt_val, subject_id=subject_id)
+                    scores[evaluator_metric(evaluator, extra)] = extra.score
+                eval_res.metadata["scores"] = scores
+        eval_res.metadata["resolution_payload"] = validated_payload
         if prediction_payload is not None:
             eval_res.metadata["prediction_payload"] = prediction_payload
         if prediction_node is not None:
             eval_res.metadata["prediction_node"] = prediction_node
         if reference_time:
             eval_res.metadata["reference_time"] = reference_time.isoformat()
-        eval_res.metadata["total_latency"] = sum(state.latencies.values())
+        # Node timings sit next to the orchestrator's own ``total_graph`` entry,
+        # which already covers them.
+        latencies = state.latencies
+        eval_res.metadata["total_latency"] = latencies.get("total_graph", sum(latencies.values()))
+        if state.latencies:
+            eval_res.metadata["node_latencies"] = dict(state.latencies)
         if tags:
             eval_res.metadata["tags"] = tags
         return eval_res
 
-    async def run(self, dataset: BacktestDataset) -> EvaluationReport:
-        results: list[EvaluationResult] = []
-        if dataset.items:
-            queue: asyncio.Queue[tuple[int, BacktestInstance]] = asyncio.Queue()
-            ordered_results: list[Optional[EvaluationResult]] = [None] * len(dataset.items)
-            for idx, item in enumerate(dataset.items):
-                queue.put_nowait((idx, item))
-
-            async def worker() -> None:
-                while True:
-                    try:
-                        idx, item = queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        return
-                    try:
-                        ordered_results[idx] = await self._run_single(item)
-                    finally:
-                        queue.task_done()
-
-            worker_count = min(self.concurrency, len(dataset.items))
-            workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
-            await queue.join()
-            await asyncio.gather(*workers)
-            results = [result for result in ordered_results if result is not None]
-
-        total_score = sum(r.score for r in results)
-        count = len(results)
-        mean_score = total_score / count if count > 0 else 0.0
-        ece_evaluator = ExpectedCalibrationErrorEvaluator()
-        ece_score, ece_bins = ece_evaluator.compute_calibration_data(results)
-        slices = SliceAnalytics.compute_slices(results)
-        return EvaluationReport(
-            metric_name=getattr(self.evaluator, "name", "Brier Score"),
-            mean_score=mean_score,
-            total_evaluations=count,
-            results=results,
-            reliability_bins=ece_bins,
-            summary_statistics={"ece": ece_score},
-            slices=slices,
-        )
+    async def stream(
+        self, dataset: BacktestSource, aggregator: Optional[ReportAggregator] = None
+    ) -> AsyncIterator[BacktestProgress]:
+        r"""Run the backtest and yield each result as soon as it completes.
+
+        ``dataset`` may be a ``BacktestDataset`` or a sync/async iterable of
+        ``BacktestInstance`` objects (or mappings validated one item at a time).
+        Lazy sources are pulled through a bounded queue, so memory stays
+        constant regardless of corpus size.
+
+        Results are yielded in completion order; ``BacktestProgress.index`` is the
+        position of the instance in the source. Breaking out of the iteration
+        cancels the remaining work. Items already recorded in the journal are
+        yielded from it without re-running the orchestrator. When an
+        ``aggregator`` is supplied, each result is folded into it (under its
+        source index) before being yielded, so ``aggregator.report()`` gives an
+        interim report at any point. With a ``budget``, dispatching stops once no
+        orchestrator call or token is left, and ``BudgetExhausted`` is raised
+        after the in-flight items finish; call ``budget.start()`` first, since
+        only ``run`` starts the budget and enforces its deadline.
+        """
+        source = dataset.items if isinstance(dataset, BacktestDataset) else dataset
+        positions: Optional[list[int]] = None
+        if self.shard is not None:
+            source, positions = _select_shard(source, self.shard)
+        total = len(source) if isinstance(source, Sized) else None
+        order: Optional[list[int]] = None
+        if self.schedule == "longest_first":
+            if isinstance(source, Sequence):
+                instances = [_as_instance(item) for item in source]
+                order = longest_expected_first(
+                    [instance.question for instance in instances],
+                    self.latency_history or LatencyHistory(),
+                    [instance.tags for instance in instances],
+                )
+                source = [instances[idx] for idx in order]
+            else:
+                logger.warning("longest_first scheduling needs a materialized dataset; using source order")
+        journaled = self.journal.load() if self.journal is not None else {}
+        if journaled:
+            logger.info("Resuming backtest with %d journaled results", len(journaled))
+
+        worker_count = self.adaptive_concurrency.max_concurrency if self.adaptive_concurrency else self.concurrency
+        executor: BoundedExecutor[Any, Optional[EvaluationResult]] = BoundedExecutor(worker_count, self.queue_size)
+        context = _RunContext(journaled, executor.drained)
+        if self.deduplicate and isinstance(source, Sequence):
+            context.expect(_as_instance(item) for item in source)
+
+        exhausted: Optional[BudgetExhausted] = None
+
+        async def run_item(item: Union[BacktestInstance, Mapping[str, Any]]) -> Optional[EvaluationResult]:
+            nonlocal exhausted
+            try:
+                return await self._run_item(item, context)
+            except BudgetExhausted as e:
+                if e.reason == "deadline":
+                    raise
+                # Calls already reserved were paid for; let them finish.
+                exhausted = exhausted or e
+                executor.stop()
+                return None
+
+        moments = RunningMoments()
+        error_count = 0
+        stop_reason: Optional[str] = None
+        timed_nodes = _install_node_timing(self.orchestrator)
+        if self.progress is not None:
+            self.progress.start(executor, total)
+        try:
+            async for idx, result in executor.map(source, run_item):
+                if result is None:
+                    continue
+                index = order[idx] if order is not None else idx
+                if positions is not None:
+                    index = positions[index]
+                if aggregator is not None:
+                    aggregator.update(result, index)
+                if self.result_writer is not None:
+                    self.result_writer.write(result, index)
+                moments.update(result.score)
+                if "error" in result.metadata:
+                    error_count += 1
+                if self.progress is not None:
+                    self.progress.update(error="error" in result.metadata)
+                if stop_reason is None and self.early_stopping is not None:
+                    stop_reason = self.early_stopping.check(moments)
+                    if stop_reason is not None:
+                        logger.info("Early stopping after %d items: %s", moments.count, stop_reason)
+                        executor.stop()
+                yield BacktestProgress(
+                    index=index,
+                    result=result,
+                    completed=moments.count,
+                    total=total,
+                    error_count=error_count,
+                    mean_score=moments.mean,
+                    stop_reason=stop_reason,
+                )
+            if exhausted is not None:
+                raise exhausted
+        finally:
+            _remove_node_timing(self.orchestrator, timed_nodes)
+            if self.progress is not None:
+                await self.progress.stop()
+            if self.latency_history is not None:
+                self.latency_history.save()
+
+    async def _run_item(
+        self, item: Union[BacktestInstance, Mapping[str, Any]], context: "_RunContext"
+    ) -> EvaluationResult:
+        with self.tracer.span("item") as span:
+            with self.tracer.span("validate_instance"):
+                instance = _as_instance(item)
+            if span is not None:
+                span.subject_id = instance.question.id
+            content = item_fingerprint(
+                instance.question, instance.resolution, instance.tags, instance.sample_weight, instance.sample_stratum
+            )
+            key = ResultJournal.key(instance.question.id, instance.reference_time, content)
+            if key in context.journaled:
+                context.release(instance)
+                return self._spill(context.journaled[key])
+            try:
+                result = await self._run_controlled(instance, context)
+            finally:
+                context.release(instance)
+            if instance.sample_weight is not None:
+                result.metadata["sample_weight"] = instance.sample_weight
+            if instance.sample_stratum is not None:
+                result.metadata["sample_stratum"] = instance.sample_stratum
+            result = self._spill(result)
+            if self.journal is not None:
+                with self.tracer.span("journal_write"):
+                    self.journal.append(key, result)
+        latency = result.metadata.get("total_latency")
+        reused = "prediction_cache_hit" in result.metadata or "deduplicated" in result.metadata
+        if self.latency_history is not None and latency and not reused:
+            self.latency_history.record(instance.question, latency, instance.tags)
+        return result
+
+    def _spill(self, result: EvaluationResult) -> EvaluationResult:
+        if self.payload_store is None:
+            return result
+        with self.tracer.span("spill_payloads"):
+            return self.payload_store.spill(result)
+
+    async def _run_controlled(self, instance: BacktestInstance, context: "_RunContext") -> EvaluationResult:
+        controller = self.adaptive_concurrency
+        if controller is None:
+            return await self._run_hedged(instance, context)
+        async with controller.slot():
+            started = time.perf_counter()
+            result = await self._run_hedged(instance, context)
+            if "prediction_cache_hit" not in result.metadata and "deduplicated" not in result.metadata:
+                latency = result.metadata.get("total_latency") or time.perf_counter() - started
+                controller.observe(latency, error="error" in result.metadata)
+        return result
+
+    async def _run_hedged(self, instance: BacktestInstance, context: "_RunContext") -> EvaluationResult:
+        started = time.perf_counter()
+        if self.hedge_percentile is None:
+            result = await self._run_single(instance, context)
+            context.record_latency(time.perf_counter() - started)
+            return result
+
+        primary = asyncio.create_task(self._run_single(instance, context))
+        pending = {primary}
+        hedge: Optional[asyncio.Task[EvaluationResult]] = None
+        try:
+            while True:
+                timeout = _HEDGE_CHECK_INTERVAL if hedge is None else None
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if "error" in result.metadata and pending:
+                        continue
+                    if hedge is not None:
+                        result.metadata["hedged"] = True
+                        result.metadata["hedge_won"] = task is hedge
+                    context.record_latency(time.perf_counter() - started)
+                    return result
+                if hedge is None and context.drained.is_set():
+                    threshold = context.latency_percentile(self.hedge_percentile, self.hedge_min_samples)
+                    if threshold is not None and time.perf_counter() - started > threshold:
+                        logger.info("Hedging straggler %s after %.2fs", instance.question.id, threshold)
+                        hedge = asyncio.create_task(self._run_single(instance))
+                        pending.add(hedge)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def run(self, dataset: BacktestSource) -> BacktestReport:
+        aggregator = self.aggregator()
+        stop_reason: Optional[str] = None
+        budget_reason: Optional[str] = None
+        completed: set[int] = set()
+        memo_before = self.node_memo.metrics() if self.node_memo is not None else {}
+        if self.budget is not None:
+            self.budget.start()
+        deadline = asyncio.timeout(self.budget.remaining_time() if self.budget is not None else None)
+        try:
+            async with deadline:
+                async for progress in self.stream(dataset, aggregator):
+                    stop_reason = progress.stop_reason
+                    completed.add(progress.index)
+        except BudgetExhausted as e:
+            budget_reason = e.reason
+        except TimeoutError:
+            if not deadline.expired():
+                raise
+            budget_reason = "deadline"
+        report = aggregator.report(include_state=self.shard is not None)
+        if self.shard is not None:
+            report.metadata["shard"] = str(self.shard)
+        if self.budget is not None:
+            report.summary_statistics.update(self.budget.metrics())
+            report.metadata["partial"] = budget_reason is not None
+            if budget_reason is not None:
+                logger.warning("Run budget exhausted (%s) after %d items", budget_reason, len(completed))
+                report.metadata["budget_exhausted"] = budget_reason
+                source = dataset.items if isinstance(dataset, BacktestDataset) else dataset
+                if isinstance(source, Sequence):
+                    skipped = [
+                        idx
+                        for idx in range(len(source))
+                        if idx not in completed
+                        and (self.shard is None or self.shard.contains(_subject_id(source[idx]) or ""))
+                    ]
+                    report.metadata["skipped_indices"] = skipped
+                    report.metadata["skipped"] = [_subject_id(source[idx]) for idx in skipped]
+        if self.adaptive_concurrency is not None:
+            report.summary_statistics.update(self.adaptive_concurrency.metrics())
+        if self.node_memo is not None:
+            report.summary_statistics.update(
+                {name: value - memo_before[name] for name, value in self.node_memo.metrics().items()}
+            )
+        if self.bootstrap is not None:
+            self.bootstrap.apply(report, report.columns)
+        if self.early_stopping is not None:
+            report.summary_statistics["mean_score_ci_half_width"] = self.early_stopping.half_width(aggregator.moments)
+            report.metadata["early_stopped"] = stop_reason is not None
+            if stop_reason is not None:
+                report.metadata["stop_reason"] = stop_reason
+        return report
+
+    def aggregator(self) -> ReportAggregator:
+        r"""Return an empty ``ReportAggregator`` for this runner's metric."""
+        return ReportAggregator(metric_name=evaluator_metric(self.evaluator), columnar=self.columnar_results)
+
+    def build_report(self, results: List[EvaluationResult]) -> BacktestReport:
+        r"""Aggregate per-item results into an ``EvaluationReport``."""
+        scored = next((result for result in results if "error" not in result.metadata), None)
+        return build_evaluation_report(results, metric_name=evaluator_metric(self.evaluator, scored))
+
+    def rescore(self, results: List[EvaluationResult], evaluator: Optional[Evaluator] = None) -> BacktestReport:
+        r"""Re-score existing results in one batch and aggregate them into a report.
+
+        Args:
+            results: Results from a previous run, e.g. loaded from a ``ResultJournal``.
+            evaluator: Scoring backend to apply; defaults to this runner's evaluator.
+        """
+        evaluator = evaluator or self.evaluator
+        rescored = rescore_results(results, evaluator)
+        scored = next((result for result in rescored if "error" not in result.metadata), None)
+        return build_evaluation_report(rescored, metric_name=evaluator_metric(evaluator, scored))
+
+
+_HEDGE_CHECK_INTERVAL = 0.05
+_FAILURE_SCORE = 1.0
+
+
+def _as_instance(item: Union[BacktestInstance, Mapping[str, Any]]) -> BacktestInstance:
+    return item if isinstance(item, BacktestInstance) else BacktestInstance.model_validate(item)
+
+
+def _node_clock() -> float:
+    # Nodes run under ``freeze_time``, which stops ``time.perf_counter`` and
+    # ``time.monotonic``; the raw monotonic clock keeps running.
+    if hasattr(time, "clock_gettime"):
+        return time.clock_gettime(time.CLOCK_MONOTONIC)
+    return time.perf_counter()
+
+
+def _install_node_timing(orchestrator: Any) -> dict[str, Callable[..., Any]]:
+    r"""Wrap every node of ``orchestrator`` so its run time accumulates in ``state.latencies[name]``.
+
+    Nodes that are already timed (by a concurrent run) are left alone. Returns the
+    wrappers installed by this call, for ``_remove_node_timing``.
+    """
+    nodes = getattr(orchestrator, "nodes", None)
+    if not isinstance(nodes, dict):
+        return {}
+    installed: dict[str, Callable[..., Any]] = {}
+    for name, func in list(nodes.items()):
+        if func is not None and not is_wrapped(func, "__node_timer__"):
+            nodes[name] = installed[name] = _timed_node(name, func)
+    return installed
+
+
+def _remove_node_timing(orchestrator: Any, installed: dict[str, Callable[..., Any]]) -> None:
+    r"""Put back the nodes wrapped by ``_install_node_timing``, unless they were replaced since."""
+    nodes = getattr(orchestrator, "nodes", None)
+    if not isinstance(nodes, dict):
+        return
+    for name, timed in installed.items():
+        if nodes.get(name) is timed:
+            nodes[name] = timed.__wrapped__  # type: ignore[attr-defined]
+
+
+def _timed_node(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    async def timed(state: BaseGraphState, *args: Any, **kwargs: Any) -> Any:
+        started = _node_clock()
+        try:
+            return await func(state, *args, **kwargs)
+        finally:
+            state.latencies[name] = state.latencies.get(name, 0.0) + _node_clock() - started
+
+    timed.__node_timer__ = True  # type: ignore[attr-defined]
+    timed.__wrapped__ = func  # type: ignore[attr-defined]
+    return timed
+
+
+def _select_shard(source: Any, shard: Shard) -> tuple[Any, list[int]]:
+    r"""Filter a source to one shard; the returned positions fill in as lazy sources are consumed."""
+    positions: list[int] = []
+    if isinstance(source, Sequence):
+        positions.extend(idx for idx, item in enumerate(source) if shard.contains(_subject_id(item) or ""))
+        return [source[idx] for idx in positions], positions
+    if isinstance(source, AsyncIterable):
+
+        async def select_async() -> AsyncIterator[Any]:
+            idx = 0
+            async for item in source:
+                if shard.contains(_subject_id(item) or ""):
+                    positions.append(idx)
+                    yield item
+                idx += 1
+
+        return select_async(), positions
+
+    def select() -> Iterator[Any]:
+        for idx, item in enumerate(source):
+            if shard.contains(_subject_id(item) or ""):
+                positions.append(idx)
+                yield item
+
+    return select(), positions
+
+
+def _subject_id(item: Union[BacktestInstance, Mapping[str, Any]]) -> Optional[str]:
+    if isinstance(item, BacktestInstance):
+        return item.question.id
+    question = item.get("question")
+    if isinstance(question, ForecastQuestion):
+        return question.id
+    return question.get("id") if isinstance(question, Mapping) else None
+
+
+_SETTLED_FLIGHTS = 128
+
+
+def _flight_key(instance: BacktestInstance) -> tuple[str, str, str]:
+    # Only the question fields the orchestrator sees; generated metadata differs between copies.
+    question = instance.question
+    return question.id, instance.reference_time.isoformat(), config_fingerprint(question.title, question.content)
+
+
+class _Flight:
+    r"""An orchestrator call shared by identical work items."""
+
+    def __init__(self, task: "asyncio.Future[tuple[BaseGraphState, bool]]"):
+        self.task = task
+        self.waiters = 0
+
+
+class _RunContext:
+    r"""Mutable state shared by the workers of a single ``stream`` call."""
+
+    def __init__(self, journaled: Mapping[str, EvaluationResult], drained: asyncio.Event):
+        self.journaled = journaled
+        self.drained = drained
+        self._latencies: list[float] = []
+        self._sorted_latencies: list[float] = []
+        self._flights: dict[tuple[str, str, str], _Flight] = {}
+        self._remaining: Optional[Counter[tuple[str, str, str]]] = None
+        self._settled: OrderedDict[tuple[str, str, str], None] = OrderedDict()
+
+    def expect(self, instances: Iterable[BacktestInstance]) -> None:
+        r"""Count the copies of each work item in a materialized source, so a shared flight is dropped after its last copy."""
+        self._remaining = Counter(_flight_key(instance) for instance in instances)
+
+    def release(self, instance: BacktestInstance) -> None:
+        r"""Mark one copy of a work item as finished."""
+        if self._remaining is None:
+            return
+        key = _flight_key(instance)
+        self._remaining[key] -= 1
+        if self._remaining[key] <= 0:
+            del self._remaining[key]
+            self._flights.pop(key, None)
+
+    async def single_flight(
+        self,
+        instance: BacktestInstance,
+        forecast: Callable[[BacktestInstance], Awaitable[tuple[BaseGraphState, bool]]],
+    ) -> tuple[BaseGraphState, bool, bool]:
+        r"""Run ``forecast`` once per identical work item and share its outcome.
+
+        Returns ``(state, cache_hit, shared)``, where ``shared`` tells whether the
+        state came from another item's call. Failed calls are forgotten, so a
+        retry starts a fresh call; a call nobody waits for any more is cancelled.
+        Successful calls are kept until the last copy of a materialized source
+        finishes; for lazy sources, only the most recent ``_SETTLED_FLIGHTS`` are kept.
+        """
+        key = _flight_key(instance)
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(forecast(instance)))
+        flight.waiters += 1
+        try:
+            state, cache_hit = await asyncio.shield(flight.task)
+        except Exception:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            raise
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+        if self._remaining is None:
+            self._settle(key)
+        return state, cache_hit, shared
+
+    def _settle(self, key: tuple[str, str, str]) -> None:
+        self._settled[key] = None
+        self._settled.move_to_end(key)
+        while len(self._settled) > _SETTLED_FLIGHTS:
+            oldest, _ = self._settled.popitem(last=False)
+            flight = self._flights.get(oldest)
+            if flight is not None and flight.task.done():
+                del self._flights[oldest]
+
+    def record_latency(self, latency: float) -> None:
+        self._latencies.append(latency)
+
+    def latency_percentile(self, percentile: float, min_samples: int) -> Optional[float]:
+        if len(self._latencies) < max(1, min_samples):
+            return None
+        if len(self._sorted_latencies) != len(self._latencies):
+            self._sorted_latencies = sorted(self._latencies)
+        position = min(len(self._sorted_latencies) - 1, int(percentile * len(self._sorted_latencies)))
+        return self._sorted_latencies[position]
+
+
+def build_evaluation_report(results: List[EvaluationResult], metric_name: str = "Brier Score") -> BacktestReport:
+    r"""Aggregate ordered results into a report with calibration bins and tag slices."""
+    aggregator = ReportAggregator(metric_name)
+    for result in results:
+        aggregator.update(result)
+    return aggregator.report()
 
 
-__all__ = ["BacktestInstance", "BacktestDataset", "BacktestRunner"]
+__all__ = [
+    "BacktestInstance",
+    "BacktestDataset",
+    "BacktestProgress",
+    "BacktestReport",
+    "BacktestRunner",
+    "BacktestSource",
+    "build_evaluation_report",
+]
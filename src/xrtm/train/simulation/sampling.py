@@ -0,0 +1,143 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Stratified subsampling of backtest datasets.
+
+Scoring every item of a large corpus is often more than a comparison needs.
+``StratifiedSampler`` groups the items of a ``BacktestDataset`` into strata by
+their tag set (and optionally their resolution outcome), picks a sample size
+that reaches a target standard error on the mean score, and draws from each
+stratum in proportion to its size. Each sampled instance carries its stratum
+and its inverse inclusion probability in ``sample_stratum`` and
+``sample_weight``. The runner copies both into the result metadata, and
+``ReportAggregator`` uses them for weighted means and a stratified standard
+error, so the report and its tag slices estimate the full-corpus values.
+"""
+
+import math
+import random
+from collections import defaultdict
+from typing import Optional
+
+from xrtm.train.simulation.artifacts import normalize_binary_outcome
+from xrtm.train.simulation.runner import BacktestDataset, BacktestInstance
+
+__all__ = ["StratifiedSampler", "stratum_key"]
+
+
+def stratum_key(instance: BacktestInstance, by_outcome: bool = False) -> str:
+    r"""Return the stratum of an instance: its sorted tags, plus the outcome when ``by_outcome``."""
+    key = ",".join(sorted(set(instance.tags or ()))) or "untagged"
+    if by_outcome:
+        try:
+            outcome = f"{normalize_binary_outcome(instance.resolution.outcome):g}"
+        except (TypeError, ValueError):
+            outcome = str(instance.resolution.outcome)
+        key = f"{key}|{outcome}"
+    return key
+
+
+class StratifiedSampler:
+    r"""Draws a stratified, weighted subset of a ``BacktestDataset``.
+
+    The sample size ``n`` for a corpus of ``N`` items is the one at which
+    proportional allocation reaches ``target_std_error`` when every stratum has
+    score standard deviation ``score_std``:
+    ``n = n0 / (1 + n0 / N)`` with ``n0 = (score_std / target_std_error) ** 2``.
+
+    Args:
+        target_std_error: Target standard error of the mean score.
+        fraction: Sample this fraction of the corpus instead of targeting a
+            standard error.
+        score_std: Assumed per-item score standard deviation, e.g. the
+            ``summary_statistics["score_std"]`` of an earlier report.
+        by_outcome: Also stratify by the normalized resolution outcome.
+        min_per_stratum: Minimum items drawn from each stratum (capped at its
+            size). Two or more lets the report estimate every stratum's variance.
+        seed: Seed for the random draw within each stratum.
+    """
+
+    def __init__(
+        self,
+        target_std_error: Optional[float] = None,
+        fraction: Optional[float] = None,
+        score_std: float = 0.25,
+        by_outcome: bool = False,
+        min_per_stratum: int = 2,
+        seed: int = 0,
+    ):
+        if (target_std_error is None) == (fraction is None):
+            raise ValueError("StratifiedSampler requires exactly one of target_std_error or fraction")
+        if target_std_error is not None and target_std_error <= 0:
+            raise ValueError("target_std_error must be > 0")
+        if fraction is not None and not 0 < fraction <= 1:
+            raise ValueError("fraction must be in (0, 1]")
+        if score_std < 0:
+            raise ValueError("score_std must be >= 0")
+        if min_per_stratum < 1:
+            raise ValueError("min_per_stratum must be >= 1")
+        self.target_std_error = target_std_error
+        self.fraction = fraction
+        self.score_std = score_std
+        self.by_outcome = by_outcome
+        self.min_per_stratum = min_per_stratum
+        self.seed = seed
+
+    def strata(self, dataset: BacktestDataset) -> dict[str, list[int]]:
+        r"""Return the dataset indices in each stratum."""
+        strata: dict[str, list[int]] = defaultdict(list)
+        for idx, instance in enumerate(dataset.items):
+            strata[stratum_key(instance, self.by_outcome)].append(idx)
+        return dict(strata)
+
+    def sample_size(self, population: int) -> int:
+        r"""Return the total sample size for a corpus of ``population`` items, before per-stratum minimums."""
+        if population == 0:
+            return 0
+        if self.fraction is not None:
+            return max(math.ceil(self.fraction * population), 1)
+        assert self.target_std_error is not None
+        n0 = (self.score_std / self.target_std_error) ** 2
+        return min(max(math.ceil(n0 / (1 + n0 / population)), 1), population)
+
+    def allocate(self, dataset: BacktestDataset) -> dict[str, int]:
+        r"""Return the number of items to draw from each stratum.
+
+        The sample size is split in proportion to stratum sizes, with the
+        largest remainders rounded up, then raised to ``min_per_stratum``.
+        """
+        sizes = {key: len(indices) for key, indices in self.strata(dataset).items()}
+        population = sum(sizes.values())
+        total = self.sample_size(population)
+        quotas = {key: total * size / population for key, size in sizes.items()}
+        counts = {key: math.floor(quota) for key, quota in quotas.items()}
+        leftover = total - sum(counts.values())
+        for key in sorted(quotas, key=lambda key: (counts[key] - quotas[key], key))[:leftover]:
+            counts[key] += 1
+        return {key: min(max(count, self.min_per_stratum), sizes[key]) for key, count in counts.items()}
+
+    def sample(self, dataset: BacktestDataset) -> BacktestDataset:
+        r"""Return the sampled instances, in dataset order, with their stratum and weight set."""
+        rng = random.Random(self.seed)
+        counts = self.allocate(dataset)
+        chosen: dict[int, BacktestInstance] = {}
+        for key, indices in sorted(self.strata(dataset).items()):
+            count = counts[key]
+            weight = len(indices) / count
+            for idx in rng.sample(indices, count):
+                instance = dataset.items[idx]
+                prior = instance.sample_weight if instance.sample_weight is not None else 1.0
+                chosen[idx] = instance.model_copy(update={"sample_weight": prior * weight, "sample_stratum": key})
+        return BacktestDataset(name=dataset.name, items=[chosen[idx] for idx in sorted(chosen)])
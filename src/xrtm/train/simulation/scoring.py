@@ -0,0 +1,154 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Batched, vectorized scoring of prediction/outcome arrays.
+
+Scoring results one at a time pays Python and Pydantic overhead per item, which
+dominates when re-scoring cached predictions from large runs. ``evaluate_batch``
+scores a whole batch in a single NumPy pass for the built-in Brier and log
+score evaluators, delegates to an evaluator's own ``evaluate_batch`` when it
+provides one, and falls back to per-item ``evaluate`` otherwise. Rows that are
+not valid probabilities or binary outcomes also take the per-item path, so
+validation errors match the unbatched behaviour exactly.
+"""
+
+import math
+from collections.abc import Sequence
+from typing import Any, Optional
+
+import numpy as np
+
+# From xrtm-eval
+from xrtm.eval.core.eval.definitions import EvaluationResult, Evaluator
+from xrtm.eval.kit.eval.metrics import FALSE_VALUES, TRUE_VALUES, BrierScoreEvaluator, LogScoreEvaluator
+
+__all__ = ["evaluate_batch", "evaluator_metric", "rescore_results", "vectorized_scores"]
+
+
+def _as_float(value: Any) -> float:
+    if isinstance(value, bool):
+        return 1.0 if value else 0.0
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized in TRUE_VALUES:
+            return 1.0
+        if normalized in FALSE_VALUES:
+            return 0.0
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def vectorized_scores(
+    evaluator: Evaluator, predictions: np.ndarray, outcomes: np.ndarray
+) -> Optional[tuple[np.ndarray, str]]:
+    r"""Score float arrays in one pass for evaluators with a known closed form.
+
+    Returns ``(scores, metric_name)``, or ``None`` when the evaluator has no
+    vectorized implementation (including subclasses overriding ``score``).
+    """
+    if type(evaluator).score is BrierScoreEvaluator.score and isinstance(evaluator, BrierScoreEvaluator):
+        return (predictions - outcomes) ** 2, "Brier Score"
+    if type(evaluator).score is LogScoreEvaluator.score and isinstance(evaluator, LogScoreEvaluator):
+        clamped = np.clip(predictions, evaluator.epsilon, 1.0 - evaluator.epsilon)
+        likelihood = np.where(outcomes == 1.0, clamped, 1.0 - clamped)
+        return -np.log(likelihood), "Log Score"
+    return None
+
+
+def evaluator_metric(evaluator: Evaluator, result: Optional[EvaluationResult] = None) -> str:
+    r"""Return the metric an evaluator reports.
+
+    Uses the evaluator's ``name`` when it has one, else the ``metric`` recorded
+    on one of its results, else the label of the built-in closed forms, and
+    finally the evaluator's class name.
+    """
+    name = getattr(evaluator, "name", None) or (result.metadata.get("metric") if result is not None else None)
+    if name:
+        return name
+    vectorized = vectorized_scores(evaluator, np.empty(0), np.empty(0))
+    return vectorized[1] if vectorized is not None else type(evaluator).__name__
+
+
+def evaluate_batch(
+    evaluator: Evaluator,
+    predictions: Sequence[Any],
+    ground_truths: Sequence[Any],
+    subject_ids: Sequence[str],
+) -> list[EvaluationResult]:
+    r"""Evaluate aligned prediction/outcome sequences, vectorizing where possible.
+
+    Raises the same errors as ``evaluator.evaluate`` for invalid rows.
+    """
+    if not len(predictions) == len(ground_truths) == len(subject_ids):
+        raise ValueError("predictions, ground_truths and subject_ids must have the same length")
+    batch_evaluate = getattr(evaluator, "evaluate_batch", None)
+    if callable(batch_evaluate):
+        return list(batch_evaluate(predictions, ground_truths, subject_ids))
+
+    p = np.fromiter((_as_float(value) for value in predictions), dtype=float, count=len(predictions))
+    o = np.fromiter((_as_float(value) for value in ground_truths), dtype=float, count=len(ground_truths))
+    vectorized = vectorized_scores(evaluator, p, o)
+    if vectorized is None:
+        return [
+            evaluator.evaluate(prediction=prediction, ground_truth=ground_truth, subject_id=subject_id)
+            for prediction, ground_truth, subject_id in zip(predictions, ground_truths, subject_ids, strict=True)
+        ]
+
+    scores, metric_name = vectorized
+    valid = np.isfinite(p) & (p >= 0.0) & (p <= 1.0) & ((o == 0.0) | (o == 1.0))
+    results: list[EvaluationResult] = []
+    for idx, (score, is_valid) in enumerate(zip(scores.tolist(), valid.tolist(), strict=True)):
+        if not is_valid:
+            results.append(
+                evaluator.evaluate(
+                    prediction=predictions[idx], ground_truth=ground_truths[idx], subject_id=subject_ids[idx]
+                )
+            )
+            continue
+        results.append(
+            EvaluationResult.model_construct(
+                subject_id=subject_ids[idx],
+                score=score,
+                ground_truth=ground_truths[idx],
+                prediction=predictions[idx],
+                metadata={"metric": metric_name},
+            )
+        )
+    return results
+
+
+def rescore_results(results: Sequence[EvaluationResult], evaluator: Evaluator) -> list[EvaluationResult]:
+    r"""Re-score existing results with another evaluator in one batch.
+
+    Results carrying an ``error`` are returned unchanged. Other results keep
+    their metadata (payloads, tags, latencies) with the new score and metric;
+    multi-metric ``scores`` from the original run are dropped.
+    """
+    scorable = [idx for idx, result in enumerate(results) if "error" not in result.metadata]
+    scored = evaluate_batch(
+        evaluator,
+        [results[idx].prediction for idx in scorable],
+        [results[idx].ground_truth for idx in scorable],
+        [results[idx].subject_id for idx in scorable],
+    )
+    rescored = list(results)
+    for idx, new in zip(scorable, scored, strict=True):
+        metadata = {key: value for key, value in results[idx].metadata.items() if key != "scores"}
+        metadata.update(new.metadata)
+        rescored[idx] = results[idx].model_copy(update={"score": new.score, "metadata": metadata})
+    return rescored
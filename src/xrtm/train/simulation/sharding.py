@@ -0,0 +1,75 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Deterministic hash sharding of backtests across machines.
+
+A ``Shard`` assigns each question to one of ``count`` shards by a stable hash
+of its id, so independent nodes agree on the split without a coordinator and
+without exchanging the dataset order. ``BacktestRunner(shard=...)`` runs only
+the items of its shard, keeps their positions in the full dataset and attaches
+the aggregate state to the report. ``merge_reports`` combines the shard reports
+into the report of a single-node run.
+"""
+
+import hashlib
+
+__all__ = ["Shard", "shard_of"]
+
+
+def shard_of(question_id: str, count: int) -> int:
+    r"""Return the shard (``0 <= shard < count``) of a question id; stable across processes and machines."""
+    digest = hashlib.blake2b(question_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count
+
+
+class Shard:
+    r"""One of ``count`` hash shards of a dataset.
+
+    Args:
+        index: Zero-based shard index, ``0 <= index < count``.
+        count: Total number of shards.
+    """
+
+    def __init__(self, index: int, count: int):
+        if count < 1:
+            raise ValueError("count must be >= 1")
+        if not 0 <= index < count:
+            raise ValueError("index must be in [0, count)")
+        self.index = index
+        self.count = count
+
+    @classmethod
+    def parse(cls, spec: str) -> "Shard":
+        r"""Parse an ``"i/N"`` shard spec, e.g. the value of a ``--shard`` option."""
+        index, _, count = (part.strip() for part in spec.partition("/"))
+        if not (index.isdigit() and count.isdigit()):
+            raise ValueError(f"Invalid shard spec {spec!r}; expected 'i/N'")
+        return cls(int(index), int(count))
+
+    def contains(self, question_id: str) -> bool:
+        r"""Return whether the question belongs to this shard."""
+        return shard_of(question_id, self.count) == self.index
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Shard) and (self.index, self.count) == (other.index, other.count)
+
+    def __hash__(self) -> int:
+        return hash((self.index, self.count))
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def __repr__(self) -> str:
+        return f"Shard({self.index}, {self.count})"
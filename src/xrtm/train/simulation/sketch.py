@@ -0,0 +1,147 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Mergeable latency histograms with bounded relative error.
+
+``LatencySketch`` counts observations in logarithmically spaced buckets (as in
+DDSketch), so every quantile it returns is within ``relative_accuracy`` of the
+true value. Memory grows with the logarithm of the latency range, not with the
+number of observations. Sketches from shards or processes merge by adding their
+bucket counts. ``state`` gives a serializable ``SketchState`` for merging
+across machines.
+"""
+
+import math
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+__all__ = ["LatencySketch", "SketchState"]
+
+_SUMMARY_QUANTILES = (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))
+
+
+class SketchState(BaseModel):
+    """Serializable contents of a ``LatencySketch``."""
+
+    relative_accuracy: float
+    min_value: float
+    count: int
+    total: float
+    max: float
+    zero_count: int
+    buckets: dict[int, int] = Field(default_factory=dict)
+
+
+class LatencySketch:
+    r"""Log-bucketed histogram of non-negative latencies.
+
+    Args:
+        relative_accuracy: Maximum relative error of the reported quantiles.
+        min_value: Latencies at or below this value (seconds) share one bucket
+            and are reported as 0.
+
+    Attributes:
+        count: Number of observations.
+        total: Sum of the observations.
+        max: Largest observation.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-6):
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.zero_count = 0
+        self.buckets: dict[int, int] = {}
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+    def update(self, value: float) -> None:
+        r"""Record one latency; negative and non-finite values are ignored."""
+        if not math.isfinite(value) or value < 0.0:
+            return
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        if value <= self.min_value:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def merge(self, other: "LatencySketch") -> None:
+        r"""Add the observations of another sketch with the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy or other.min_value != self.min_value:
+            raise ValueError("cannot merge sketches with different relative_accuracy or min_value")
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.zero_count += other.zero_count
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def state(self) -> SketchState:
+        r"""Return the sketch contents in serializable form."""
+        return SketchState(
+            relative_accuracy=self.relative_accuracy,
+            min_value=self.min_value,
+            count=self.count,
+            total=self.total,
+            max=self.max,
+            zero_count=self.zero_count,
+            buckets=dict(self.buckets),
+        )
+
+    @classmethod
+    def from_state(cls, state: SketchState) -> "LatencySketch":
+        r"""Rebuild a sketch from ``state()``."""
+        sketch = cls(state.relative_accuracy, state.min_value)
+        sketch.count = state.count
+        sketch.total = state.total
+        sketch.max = state.max
+        sketch.zero_count = state.zero_count
+        sketch.buckets = dict(state.buckets)
+        return sketch
+
+    def quantile(self, q: float) -> Optional[float]:
+        r"""Return the ``q``-quantile (``0 <= q <= 1``), or ``None`` for an empty sketch."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be in [0, 1]")
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                # Midpoint of the bucket in relative terms, capped by the exact maximum.
+                return min(2.0 * self._gamma**key / (self._gamma + 1.0), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        r"""Return ``count``, ``mean``, ``p50``, ``p90``, ``p99`` and ``max`` (empty for an empty sketch)."""
+        if self.count == 0:
+            return {}
+        stats = {"count": float(self.count), "mean": self.total / self.count}
+        for name, q in _SUMMARY_QUANTILES:
+            stats[name] = self.quantile(q) or 0.0
+        stats["max"] = self.max
+        return stats
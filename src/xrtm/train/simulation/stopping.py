@@ -0,0 +1,82 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Sequential early stopping for backtests.
+
+Most exploratory arms are clearly good or bad after a fraction of the corpus.
+``EarlyStopping`` tracks a normal-approximation confidence interval on the
+running mean score and signals the runner to stop dispatching once the
+interval is narrower than a target precision, or once it excludes a supplied
+baseline score. Checking after every item inflates the error rate of the
+baseline test relative to a single fixed-size test; use a stricter
+``confidence`` and a larger ``min_items`` when that matters.
+"""
+
+from statistics import NormalDist
+from typing import Optional
+
+from xrtm.train.simulation.moments import RunningMoments
+
+__all__ = ["EarlyStopping"]
+
+
+class EarlyStopping:
+    r"""Stopping rule on the confidence interval of the running mean score.
+
+    Args:
+        precision: Stop once the interval half-width is at most this value.
+        baseline: Stop once the interval lies entirely above or below this score.
+        confidence: Two-sided confidence level of the interval.
+        min_items: Minimum number of scored items before stopping is considered.
+    """
+
+    def __init__(
+        self,
+        precision: Optional[float] = None,
+        baseline: Optional[float] = None,
+        confidence: float = 0.95,
+        min_items: int = 30,
+    ):
+        if precision is None and baseline is None:
+            raise ValueError("EarlyStopping requires a precision target or a baseline score")
+        if precision is not None and precision <= 0:
+            raise ValueError("precision must be > 0")
+        if not 0.0 < confidence < 1.0:
+            raise ValueError("confidence must be in (0, 1)")
+        if min_items < 2:
+            raise ValueError("min_items must be >= 2")
+        self.precision = precision
+        self.baseline = baseline
+        self.confidence = confidence
+        self.min_items = min_items
+        self._z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+
+    def half_width(self, moments: RunningMoments) -> float:
+        r"""Return the confidence interval half-width for the running mean."""
+        return self._z * moments.std_error
+
+    def check(self, moments: RunningMoments) -> Optional[str]:
+        r"""Return a stop reason once the rule is satisfied, otherwise ``None``."""
+        if moments.count < self.min_items:
+            return None
+        half_width = self.half_width(moments)
+        if self.precision is not None and half_width <= self.precision:
+            return "precision_reached"
+        if self.baseline is not None:
+            if moments.mean + half_width < self.baseline:
+                return "below_baseline"
+            if moments.mean - half_width > self.baseline:
+                return "above_baseline"
+        return None
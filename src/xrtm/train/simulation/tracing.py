@@ -0,0 +1,200 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Lightweight tracing spans around the stages of a backtest.
+
+A ``Tracer`` times named stages (instance validation, orchestrator or agent
+run, cache and trace I/O, resolution validation, scoring, payload
+serialization) and hands each finished ``Span`` to its exporters. Spans nest
+through a context variable, so the stages of one item share a ``trace_id`` even
+across tasks and threads. ``JsonlSpanExporter`` writes one span per line, and
+``ChromeTraceExporter`` writes a file for ``chrome://tracing`` or Perfetto with
+one row per item. Any object with ``export(span)`` and ``close()`` methods can
+act as an exporter, e.g. a bridge to OpenTelemetry.
+
+A tracer without exporters does not record anything.
+"""
+
+import contextvars
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional, Protocol, Union
+
+from pydantic import BaseModel, Field
+
+__all__ = ["ChromeTraceExporter", "JsonlSpanExporter", "Span", "SpanExporter", "Tracer"]
+logger = logging.getLogger(__name__)
+
+_CURRENT_SPAN: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("xrtm_train_span", default=None)
+
+
+class Span(BaseModel):
+    """One timed stage of a backtest item."""
+
+    name: str
+    span_id: int
+    trace_id: int
+    parent_id: Optional[int] = None
+    subject_id: Optional[str] = None
+    start: float = Field(description="Wall-clock start time (seconds since the epoch)")
+    duration: float = 0.0
+    attributes: dict[str, Any] = Field(default_factory=dict)
+    error: Optional[str] = None
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class Tracer:
+    r"""Creates spans and passes finished ones to the exporters.
+
+    Args:
+        exporters: Destinations for finished spans.
+    """
+
+    def __init__(self, exporters: Sequence[SpanExporter] = ()):
+        self.exporters = list(exporters)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        r"""Whether spans are recorded at all."""
+        return bool(self.exporters)
+
+    @contextmanager
+    def span(self, name: str, subject_id: Optional[str] = None, **attributes: Any) -> Iterator[Optional[Span]]:
+        r"""Time the enclosed block as a span.
+
+        Yields the ``Span`` so the block can add attributes, or ``None`` when
+        the tracer has no exporters. The subject id defaults to the parent's.
+        An exception leaving the block is recorded in ``error`` and re-raised.
+        """
+        if not self.exporters:
+            yield None
+            return
+        parent = _CURRENT_SPAN.get()
+        span_id = next(self._ids)
+        span = Span(
+            name=name,
+            span_id=span_id,
+            trace_id=parent.trace_id if parent is not None else span_id,
+            parent_id=parent.span_id if parent is not None else None,
+            subject_id=subject_id if subject_id is not None or parent is None else parent.subject_id,
+            start=time.time(),
+            attributes=attributes,
+        )
+        token = _CURRENT_SPAN.set(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration = time.perf_counter() - started
+            _CURRENT_SPAN.reset(token)
+            self._export(span)
+
+    def _export(self, span: Span) -> None:
+        with self._lock:
+            for exporter in self.exporters:
+                try:
+                    exporter.export(span)
+                except Exception as e:
+                    logger.warning("Span exporter %s failed: %s", type(exporter).__name__, e)
+
+    def close(self) -> None:
+        r"""Flush and close every exporter."""
+        with self._lock:
+            for exporter in self.exporters:
+                exporter.close()
+
+
+class JsonlSpanExporter:
+    r"""Appends finished spans to a JSONL file, one JSON object per line.
+
+    Args:
+        path: Output file. Parent directories are created on first write.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file: Any = None
+
+    def export(self, span: Span) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(span.model_dump_json() + "\n")
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ChromeTraceExporter:
+    r"""Writes spans as Chrome trace-event "complete" events (JSON array format).
+
+    Each item (trace) is drawn on its own row. The file is valid JSON once
+    ``close`` has been called.
+
+    Args:
+        path: Output file, e.g. ``trace.json``.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file: Any = None
+        self._pid = os.getpid()
+
+    def export(self, span: Span) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")
+            self._file.write("[\n")
+        else:
+            self._file.write(",\n")
+        args: dict[str, Any] = {"subject_id": span.subject_id, **span.attributes}
+        if span.error is not None:
+            args["error"] = span.error
+        event = {
+            "name": span.name,
+            "ph": "X",
+            "ts": span.start * 1e6,
+            "dur": span.duration * 1e6,
+            "pid": self._pid,
+            "tid": span.trace_id,
+            "args": args,
+        }
+        self._file.write(json.dumps(event, default=str))
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self._file.write("\n]\n")
+        self._file.close()
+        self._file = None
@@ -13,7 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from typing import Optional
+
 import pytest
+from xrtm.data import ForecastOutput, ForecastQuestion
+from xrtm.eval.core.schemas import ForecastResolution
+
+from xrtm.train.simulation.runner import BacktestDataset, BacktestInstance
+
+REFERENCE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
 
 
 def pytest_addoption(parser):
@@ -31,3 +42,69 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "local_llm" in item.keywords:
             item.add_marker(skip_local_llm)
+
+
+class StubOrchestrator:
+    r"""Orchestrator stand-in that records its calls and forecasts a fixed probability."""
+
+    def __init__(
+        self,
+        probability: float = 0.8,
+        reasoning: Optional[str] = None,
+        latency: Optional[float] = None,
+        delay: float = 0.0,
+        fail_ids: Sequence[str] = (),
+    ) -> None:
+        self.probability = probability
+        self.reasoning = reasoning
+        self.latency = latency
+        self.delay = delay
+        self.fail_ids = fail_ids
+        self.calls: list[str] = []
+
+    async def run(self, state, entry_node="ingestion", **kwargs):
+        self.calls.append(state.subject_id)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if state.subject_id in self.fail_ids:
+            raise RuntimeError("boom")
+        if self.reasoning is None:
+            state.node_reports["final"] = {"probability": self.probability}
+        else:
+            state.node_reports["final"] = ForecastOutput(
+                question_id=state.subject_id, probability=self.probability, reasoning=self.reasoning
+            )
+        if self.latency is not None:
+            state.latencies["final"] = self.latency
+        return state
+
+
+def _make_dataset(
+    size: int,
+    prefix: str = "q",
+    outcome: Callable[[int], str] = lambda i: "yes",
+    tags: Optional[Callable[[int], list[str]]] = None,
+) -> BacktestDataset:
+    return BacktestDataset(
+        items=[
+            BacktestInstance(
+                question=ForecastQuestion(id=f"{prefix}{i}", title=f"Question {i}"),
+                resolution=ForecastResolution(question_id=f"{prefix}{i}", outcome=outcome(i)),
+                reference_time=REFERENCE_TIME,
+                tags=tags(i) if tags is not None else None,
+            )
+            for i in range(size)
+        ]
+    )
+
+
+@pytest.fixture
+def make_dataset():
+    r"""Factory for datasets of ``size`` questions ``{prefix}0..`` resolved by ``outcome(i)`` and tagged ``tags(i)``."""
+    return _make_dataset
+
+
+@pytest.fixture
+def stub_orchestrator():
+    r"""The ``StubOrchestrator`` class, called with its keyword options."""
+    return StubOrchestrator
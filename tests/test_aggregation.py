@@ -0,0 +1,91 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import statistics
+
+import pytest
+from xrtm.eval import EvaluationResult
+from xrtm.eval.kit.eval.metrics import ExpectedCalibrationErrorEvaluator
+
+from xrtm.train.simulation.aggregation import ReportAggregator
+
+
+def _results(count: int, seed: int = 0) -> list[EvaluationResult]:
+    rng = random.Random(seed)
+    results = []
+    for idx in range(count):
+        prediction = round(rng.random(), 1)
+        outcome = rng.randint(0, 1)
+        results.append(
+            EvaluationResult(
+                subject_id=f"q{idx}",
+                score=(prediction - outcome) ** 2,
+                ground_truth=outcome,
+                prediction=prediction,
+                metadata={
+                    "tags": ["even" if idx % 2 == 0 else "odd"],
+                    "node_latencies": {"ingestion": rng.expovariate(20.0), "forecast": rng.uniform(0.5, 2.0)},
+                },
+            )
+        )
+    return results
+
+
+def test_aggregator_matches_batch_statistics() -> None:
+    results = _results(200)
+    aggregator = ReportAggregator()
+    for result in reversed(results):
+        aggregator.update(result, int(result.subject_id[1:]))
+
+    report = aggregator.report()
+    expected_ece, expected_bins = ExpectedCalibrationErrorEvaluator().compute_calibration_data(results)
+
+    assert report.results == results
+    assert report.mean_score == pytest.approx(statistics.fmean(r.score for r in results))
+    assert report.summary_statistics["score_std"] == pytest.approx(statistics.stdev(r.score for r in results))
+    assert report.summary_statistics["ece"] == pytest.approx(expected_ece)
+    assert [b.count for b in report.reliability_bins] == [b.count for b in expected_bins]
+    assert set(report.slices) == {"even", "odd"}
+    assert report.slices["even"].total_evaluations == 100
+
+
+def test_merged_shards_match_single_aggregator() -> None:
+    results = _results(90, seed=3)
+    whole = ReportAggregator()
+    shards = [ReportAggregator(), ReportAggregator(), ReportAggregator()]
+    for idx, result in enumerate(results):
+        whole.update(result, idx)
+        shards[idx % 3].update(result, idx)
+    merged = ReportAggregator()
+    for shard in shards:
+        merged.merge(shard)
+
+    expected, actual = whole.report(), merged.report()
+    assert actual.results == expected.results
+    assert actual.mean_score == pytest.approx(expected.mean_score)
+    assert actual.summary_statistics == pytest.approx(expected.summary_statistics)
+    assert actual.slices["odd"].mean_score == pytest.approx(expected.slices["odd"].mean_score)
+    assert set(actual.latency) == {"forecast", "ingestion"}
+    for node, stats in expected.latency.items():
+        assert actual.latency[node] == pytest.approx(stats)
+
+
+def test_empty_aggregator_reports_zero() -> None:
+    report = ReportAggregator().report()
+    assert report.total_evaluations == 0
+    assert report.mean_score == 0.0
+    assert report.summary_statistics["ece"] == 0.0
+    assert report.latency == {}
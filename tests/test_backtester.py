@@ -152,3 +152,29 @@ async def test_backtester_validates_resolution_schema() -> None:
     assert report.results[0].metadata["resolution_payload"]["forecast_request_id"] == "other"
     assert report.results[0].metadata["resolution_payload"]["outcome"] == "yes"
     evaluator.evaluate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_backtester_accepts_lazy_iterable():
+    class Agent:
+        async def run(self, question):
+            return 0.8
+
+    evaluator = MagicMock()
+    evaluator.evaluate.side_effect = lambda prediction, ground_truth, subject_id: EvaluationResult(
+        subject_id=subject_id,
+        score=0.04,
+        ground_truth=ground_truth,
+        prediction=prediction,
+    )
+
+    def pairs():
+        for i in range(5):
+            yield (
+                ForecastQuestion(id=f"q{i}", title=f"Question {i}"),
+                ForecastResolution(question_id=f"q{i}", outcome="yes"),
+            )
+
+    report = await Backtester(agent=Agent(), evaluator=evaluator, concurrency=2, queue_size=1).run(pairs())
+
+    assert [result.subject_id for result in report.results] == [f"q{i}" for i in range(5)]
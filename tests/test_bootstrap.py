@@ -0,0 +1,81 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import numpy as np
+import pytest
+from xrtm.eval import EvaluationResult
+from xrtm.eval.kit.eval.metrics import ExpectedCalibrationErrorEvaluator
+
+from xrtm.train.simulation.aggregation import ReportAggregator
+from xrtm.train.simulation.bootstrap import Bootstrap
+
+
+def _results(count: int) -> list[EvaluationResult]:
+    rng = random.Random(7)
+    results = []
+    for idx in range(count):
+        prediction = rng.random()
+        outcome = int(rng.random() < prediction)
+        results.append(
+            EvaluationResult(
+                subject_id=f"q{idx}",
+                score=(prediction - outcome) ** 2,
+                ground_truth=outcome,
+                prediction=prediction,
+                metadata={"tags": ["even" if idx % 2 == 0 else "odd"]},
+            )
+        )
+    return results
+
+
+def test_resamples_match_scalar_statistics_and_block_size() -> None:
+    results = _results(300)
+    scores = np.array([r.score for r in results])
+    probabilities = np.array([r.prediction for r in results])
+    outcomes = np.array([float(r.ground_truth) for r in results])
+
+    means, eces = Bootstrap(resamples=3, seed=5).resample(scores, probabilities, outcomes)
+    idx = np.random.default_rng(5).integers(0, len(results), size=(3, len(results)))
+    for row in range(3):
+        resampled = [results[i] for i in idx[row]]
+        expected_ece, _ = ExpectedCalibrationErrorEvaluator().compute_calibration_data(resampled)
+        assert means[row] == pytest.approx(np.mean([r.score for r in resampled]))
+        assert eces[row] == pytest.approx(expected_ece)
+
+    blocked = Bootstrap(resamples=3, seed=5, max_block_elements=1).resample(scores, probabilities, outcomes)
+    np.testing.assert_allclose(blocked[0], means)
+    np.testing.assert_allclose(blocked[1], eces)
+
+
+def test_intervals_cover_point_estimates_and_are_reproducible() -> None:
+    aggregator = ReportAggregator()
+    for result in _results(2000):
+        aggregator.update(result)
+    report = aggregator.report()
+
+    Bootstrap(resamples=500, seed=1, max_block_elements=10_000).apply(report)
+    stats = report.summary_statistics
+    assert stats["mean_score_ci_lower"] < report.mean_score < stats["mean_score_ci_upper"]
+    assert stats["ece_ci_lower"] <= stats["ece_ci_upper"]
+    assert report.slices["odd"].summary_statistics["mean_score_ci_lower"] < report.slices["odd"].mean_score
+
+    again = Bootstrap(resamples=500, seed=1).intervals(report.results)
+    assert again["mean_score_ci_lower"] == stats["mean_score_ci_lower"]
+
+
+def test_intervals_empty_results() -> None:
+    assert Bootstrap().intervals([]) == {}
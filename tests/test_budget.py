@@ -0,0 +1,112 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from xrtm.train.simulation.budget import RunBudget
+from xrtm.train.simulation.runner import BacktestRunner
+
+
+class MeteredOrchestrator:
+    def __init__(self, delays: dict[str, float] | None = None, tokens: int = 100) -> None:
+        self.delays = delays or {}
+        self.tokens = tokens
+        self.calls = 0
+        self.cancelled = 0
+
+    async def run(self, state, entry_node="ingestion", **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delays.get(state.subject_id, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        state.usage["total_tokens"] = self.tokens
+        state.node_reports["final"] = {"probability": 0.8}
+        return state
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_in_flight_work_and_returns_partial_report(make_dataset):
+    orchestrator = MeteredOrchestrator(delays={f"q{i}": 10.0 for i in range(2, 6)})
+    runner = BacktestRunner(orchestrator=orchestrator, concurrency=2, budget=RunBudget(time_limit=0.2))
+
+    started = time.perf_counter()
+    report = await runner.run(make_dataset(6))
+
+    assert time.perf_counter() - started < 2.0
+    assert orchestrator.cancelled == 2
+    assert report.total_evaluations == 2
+    assert report.mean_score == pytest.approx(0.04)
+    assert report.metadata["partial"] is True
+    assert report.metadata["budget_exhausted"] == "deadline"
+    assert report.metadata["skipped"] == ["q2", "q3", "q4", "q5"]
+    assert report.metadata["skipped_indices"] == [2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_call_and_token_budgets_stop_dispatching(make_dataset):
+    orchestrator = MeteredOrchestrator()
+    report = await BacktestRunner(orchestrator=orchestrator, concurrency=1, budget=RunBudget(max_calls=3)).run(
+        make_dataset(5)
+    )
+    assert orchestrator.calls == 3
+    assert report.total_evaluations == 3
+    assert report.metadata["budget_exhausted"] == "max_calls"
+    assert report.metadata["skipped"] == ["q3", "q4"]
+
+    orchestrator = MeteredOrchestrator(tokens=100)
+    report = await BacktestRunner(orchestrator=orchestrator, concurrency=1, budget=RunBudget(max_tokens=250)).run(
+        make_dataset(5)
+    )
+    assert orchestrator.calls == 3
+    assert report.metadata["budget_exhausted"] == "max_tokens"
+    assert report.summary_statistics["budget_tokens"] == 300
+
+
+@pytest.mark.asyncio
+async def test_call_limit_lets_reserved_calls_finish(make_dataset):
+    orchestrator = MeteredOrchestrator(delays={f"q{i}": 0.05 for i in range(8)})
+    report = await BacktestRunner(orchestrator=orchestrator, concurrency=3, budget=RunBudget(max_calls=5)).run(
+        make_dataset(8)
+    )
+
+    assert orchestrator.calls == 5
+    assert orchestrator.cancelled == 0
+    assert report.total_evaluations == 5
+    assert report.metadata["budget_exhausted"] == "max_calls"
+    assert report.metadata["skipped_indices"] == [5, 6, 7]
+
+
+@pytest.mark.asyncio
+async def test_unexhausted_budget_reports_complete_run(make_dataset):
+    budget = RunBudget(deadline=datetime.now(timezone.utc) + timedelta(minutes=5), max_calls=10)
+    report = await BacktestRunner(orchestrator=MeteredOrchestrator(), concurrency=2, budget=budget).run(make_dataset(4))
+
+    assert report.total_evaluations == 4
+    assert report.metadata["partial"] is False
+    assert "skipped" not in report.metadata
+    assert report.summary_statistics["budget_calls"] == 4
+
+
+def test_run_budget_validates_limits():
+    with pytest.raises(ValueError):
+        RunBudget()
+    with pytest.raises(ValueError):
+        RunBudget(deadline=datetime(2026, 1, 1))
@@ -0,0 +1,139 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from xrtm.data import ForecastQuestion
+from xrtm.eval import EvaluationResult
+from xrtm.eval.core.schemas import ForecastResolution
+from xrtm.eval.kit.eval.metrics import LogScoreEvaluator
+
+from xrtm.train import Backtester, BacktestRunner
+from xrtm.train.simulation.cache import PredictionCache
+
+
+@pytest.mark.asyncio
+async def test_runner_reuses_cached_orchestrator_outputs_when_only_evaluator_changes(
+    tmp_path, make_dataset, stub_orchestrator
+):
+    cache = PredictionCache(tmp_path)
+    orchestrator = stub_orchestrator(probability=0.7, reasoning="cached", latency=0.5)
+    first = await BacktestRunner(orchestrator=orchestrator, prediction_cache=cache, cache_fingerprint="arm-a").run(
+        make_dataset(3)
+    )
+    second = await BacktestRunner(
+        orchestrator=orchestrator,
+        evaluator=LogScoreEvaluator(),
+        prediction_cache=cache,
+        cache_fingerprint="arm-a",
+    ).run(make_dataset(3))
+
+    assert len(orchestrator.calls) == 3
+    assert "prediction_cache_hit" not in first.results[0].metadata
+    assert second.results[0].metadata["prediction_cache_hit"] is True
+    assert second.results[0].prediction == pytest.approx(0.7)
+    assert second.results[0].metadata["prediction_payload"]["reasoning_trace"]["narrative"] == "cached"
+    assert second.results[0].metadata["total_latency"] == pytest.approx(0.5)
+
+    assert cache.invalidate("arm-a") == 3
+    await BacktestRunner(orchestrator=orchestrator, prediction_cache=cache, cache_fingerprint="arm-a").run(
+        make_dataset(1)
+    )
+    assert len(orchestrator.calls) == 4
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = PredictionCache(tmp_path, max_bytes=300)
+    for i in range(3):
+        cache.put("fp", f"q{i}", {"probability": 0.5, "padding": "x" * 60})
+        path = cache.directory / "fp" / f"{PredictionCache.key(f'q{i}')}.json"
+        os.utime(path, (1000 + i, 1000 + i))
+    os.utime(cache.directory / "fp" / f"{PredictionCache.key('q0')}.json", (2000, 2000))
+
+    cache.put("fp", "q3", {"probability": 0.5, "padding": "x" * 60})
+
+    assert cache.size_bytes() <= 300 * cache.low_water
+    assert cache.get("fp", "q1") is None
+    assert cache.get("fp", "q2") is None
+    assert cache.get("fp", "q0") is not None
+    assert cache.get("fp", "q3") is not None
+
+
+def test_cache_treats_entries_evicted_mid_access_as_hits_or_misses(tmp_path):
+    cache = PredictionCache(tmp_path, max_bytes=200)
+    value = {"probability": 0.5, "padding": "x" * 30}
+
+    def churn(worker: int) -> None:
+        for i in range(50):
+            subject = f"q{(worker + i) % 8}"
+            cache.put("fp", subject, value)
+            assert cache.get("fp", subject) in (None, value)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(churn, range(4)))
+
+    assert cache.size_bytes() == sum(p.stat().st_size for p in cache.directory.glob("*/*.json"))
+
+
+@pytest.mark.asyncio
+async def test_backtester_caches_agent_predictions(tmp_path):
+    asked: list[str] = []
+
+    class Agent:
+        async def run(self, question):
+            asked.append(question.id)
+            return {"probability": 0.8, "reasoning": "agent"}
+
+    class Evaluator:
+        def evaluate(self, prediction, ground_truth, subject_id):
+            return EvaluationResult(subject_id=subject_id, score=0.04, ground_truth=ground_truth, prediction=prediction)
+
+    dataset = [(ForecastQuestion(id="q1", title="Question 1"), ForecastResolution(question_id="q1", outcome="yes"))]
+    cache = PredictionCache(tmp_path)
+
+    await Backtester(agent=Agent(), evaluator=Evaluator(), prediction_cache=cache, cache_fingerprint="agent-a").run(
+        dataset
+    )
+    report = await Backtester(
+        agent=Agent(), evaluator=Evaluator(), prediction_cache=cache, cache_fingerprint="agent-a"
+    ).run(dataset)
+
+    assert asked == ["q1"]
+    assert report.results[0].metadata["prediction_cache_hit"] is True
+    assert report.results[0].prediction == pytest.approx(0.8)
+    assert report.results[0].metadata["prediction_payload"]["reasoning"] == "agent"
+
+
+def test_prediction_cache_requires_a_fingerprint(tmp_path, stub_orchestrator):
+    cache = PredictionCache(tmp_path)
+
+    with pytest.raises(ValueError, match="cache_fingerprint"):
+        BacktestRunner(orchestrator=stub_orchestrator(), prediction_cache=cache)
+    with pytest.raises(ValueError, match="cache_fingerprint"):
+        Backtester(agent=object(), evaluator=object(), prediction_cache=cache)
+
+
+def test_cache_survives_pickling_for_worker_processes(tmp_path):
+    cache = PredictionCache(tmp_path, max_bytes=1000)
+    cache.put("fp", "q1", {"probability": 0.5})
+
+    copy = pickle.loads(pickle.dumps(cache))
+
+    assert copy.get("fp", "q1") == {"probability": 0.5}
+    copy.put("fp", "q2", {"probability": 0.6})
+    assert copy.size_bytes() == cache.size_bytes() + len(b'{"probability": 0.6}')
@@ -0,0 +1,78 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+import pytest
+from xrtm.eval import EvaluationResult
+
+from xrtm.train.simulation.aggregation import ReportAggregator
+from xrtm.train.simulation.columnar import ColumnarResults
+
+
+def _result(idx: int) -> EvaluationResult:
+    return EvaluationResult(
+        subject_id=f"q{idx}",
+        score=0.01 * idx,
+        ground_truth=1.0 if idx % 2 else "no",
+        prediction=0.1 * (idx % 10),
+        metadata={
+            "total_latency": 0.5 * idx,
+            "resolution_payload": {"question_id": f"q{idx}", "outcome": "yes"},
+            "tags": ["a"],
+        },
+    )
+
+
+def test_columnar_results_round_trip_rows_lazily() -> None:
+    originals = [_result(idx) for idx in range(2500)]
+    columns = ColumnarResults(originals)
+
+    assert len(columns) == 2500
+    assert columns[7] == originals[7]
+    assert columns[-1] == originals[-1]
+    assert columns[10:12] == originals[10:12]
+    assert list(columns) == originals
+    assert columns.scores[3] == pytest.approx(0.03)
+    assert math.isnan(columns.ground_truths[0])
+    assert columns.latencies[4] == 2.0
+    assert columns.subject_ids[:2] == ["q0", "q1"]
+    with pytest.raises(IndexError):
+        columns[2500]
+    with pytest.raises(ValueError):
+        columns.scores[0] = 1.0
+
+
+def test_columnar_take_reorders_without_materializing() -> None:
+    columns = ColumnarResults(_result(idx) for idx in range(5))
+    taken = columns.take([4, 0, 2])
+    assert [result.subject_id for result in taken] == ["q4", "q0", "q2"]
+    assert taken[0] == columns[4]
+
+
+def test_columnar_aggregator_orders_results_by_index() -> None:
+    shards = [ReportAggregator(columnar=True), ReportAggregator(columnar=True)]
+    for idx in reversed(range(10)):
+        shards[idx % 2].update(_result(idx), idx)
+    merged = ReportAggregator(columnar=True)
+    for shard in shards:
+        merged.merge(shard)
+
+    report = merged.report()
+    assert report.results == []
+    assert report.columns is not None
+    assert [result.subject_id for result in report.columns] == [f"q{idx}" for idx in range(10)]
+    assert report.slices["a"].total_evaluations == 10
+    assert report.slices["a"].results == []
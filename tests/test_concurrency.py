@@ -0,0 +1,96 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from xrtm.data import ForecastQuestion
+from xrtm.eval.core.schemas import ForecastResolution
+
+from xrtm.train.simulation.concurrency import AdaptiveConcurrency
+from xrtm.train.simulation.runner import BacktestDataset, BacktestInstance, BacktestRunner
+
+
+def test_adaptive_concurrency_increases_additively_and_decreases_multiplicatively():
+    controller = AdaptiveConcurrency(initial=4, max_concurrency=8, window=2, target_latency=1.0)
+
+    controller.observe(0.1)
+    decision = controller.observe(0.1)
+    assert decision is not None and decision.reason == "healthy"
+    assert controller.limit == 5
+
+    controller.observe(2.0)
+    decision = controller.observe(2.0)
+    assert decision is not None and decision.reason == "latency_above_target"
+    assert controller.limit == 2
+
+    controller.observe(0.1, error=True)
+    controller.observe(0.1, error=True)
+    assert controller.limit == 1
+    assert controller.decisions[-1].reason == "error_rate"
+    assert controller.metrics() == {
+        "concurrency_limit": 1.0,
+        "concurrency_increases": 1.0,
+        "concurrency_decreases": 2.0,
+    }
+
+
+def test_adaptive_concurrency_backs_off_relative_to_baseline_latency():
+    controller = AdaptiveConcurrency(initial=4, window=1, latency_tolerance=2.0)
+
+    controller.observe(0.1)
+    controller.observe(0.15)
+    controller.observe(0.5)
+
+    assert [d.reason for d in controller.decisions] == ["healthy", "healthy", "latency_above_baseline"]
+    assert controller.limit == 3
+
+
+class TrackingOrchestrator:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+    async def run(self, state, entry_node="ingestion", **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+        state.node_reports["final"] = {"probability": 0.6}
+        return state
+
+
+@pytest.mark.asyncio
+async def test_runner_gates_workers_through_adaptive_limit():
+    dataset = BacktestDataset(
+        items=[
+            BacktestInstance(
+                question=ForecastQuestion(id=f"q{i}", title=f"Question {i}"),
+                resolution=ForecastResolution(question_id=f"q{i}", outcome="no"),
+                reference_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            )
+            for i in range(20)
+        ]
+    )
+    orchestrator = TrackingOrchestrator()
+    controller = AdaptiveConcurrency(initial=2, max_concurrency=3, window=5, target_latency=10.0)
+
+    report = await BacktestRunner(orchestrator=orchestrator, adaptive_concurrency=controller).run(dataset)
+
+    assert report.total_evaluations == 20
+    assert orchestrator.max_active <= 3
+    assert controller.limit == 3
+    assert report.summary_statistics["concurrency_limit"] == 3.0
@@ -0,0 +1,72 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from xrtm.train.simulation.execution import BoundedExecutor
+
+
+async def _double(value: int) -> int:
+    await asyncio.sleep(0.001 * (5 - value % 5))
+    return value * 2
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_buffers_at_most_queue_size_items_ahead():
+    pulled = 0
+    processed = 0
+
+    def source():
+        nonlocal pulled
+        for i in range(100):
+            pulled += 1
+            yield i
+
+    async def handler(value: int) -> int:
+        nonlocal processed
+        processed += 1
+        await asyncio.sleep(0)
+        return value
+
+    executor: BoundedExecutor[int, int] = BoundedExecutor(concurrency=2, queue_size=3)
+    results = {}
+    async for idx, value in executor.map(source(), handler):
+        results[idx] = value
+        assert pulled - processed <= 2 + 3 + 1
+
+    assert results == {i: i for i in range(100)}
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_propagates_source_errors():
+    def source():
+        yield 1
+        raise RuntimeError("bad row")
+
+    executor: BoundedExecutor[int, int] = BoundedExecutor(concurrency=2)
+
+    with pytest.raises(RuntimeError, match="bad row"):
+        async for _ in executor.map(source(), _double):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_handles_empty_sources():
+    executor: BoundedExecutor[int, int] = BoundedExecutor(concurrency=2)
+
+    assert [item async for item in executor.map([], _double)] == []
+    assert [item async for item in executor.map(iter([]), _double)] == []
@@ -0,0 +1,101 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+
+import pytest
+from xrtm.data import ForecastQuestion
+from xrtm.eval import EvaluationResult
+from xrtm.eval.core.schemas import ForecastResolution
+
+from xrtm.train.simulation.export import ArrowResultWriter, read_results
+from xrtm.train.simulation.runner import BacktestDataset, BacktestInstance, BacktestRunner
+
+pa = pytest.importorskip("pyarrow")
+
+
+class ConstantOrchestrator:
+    async def run(self, state, entry_node="ingestion", **kwargs):
+        state.node_reports["final"] = {"probability": 0.8, "reasoning": f"because {state.subject_id}"}
+        return state
+
+
+def _result(idx: int) -> EvaluationResult:
+    metadata = {
+        "total_latency": 0.1 * idx,
+        "tags": ["a", "b"],
+        "resolution_payload": {"question_id": f"q{idx}", "outcome": "yes"},
+        "prediction_payload": {"probability": 0.5, "trace": {"steps": idx}},
+    }
+    if idx == 3:
+        metadata["total_latency"] = "n/a"
+        metadata["error"] = "boom"
+    return EvaluationResult(subject_id=f"q{idx}", score=0.25, ground_truth=1.0, prediction=0.5, metadata=metadata)
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_round_trip_in_row_groups(tmp_path, suffix) -> None:
+    path = tmp_path / f"results{suffix}"
+    originals = [_result(idx) for idx in range(7)]
+    with ArrowResultWriter(path, row_group_size=2) as writer:
+        for idx in reversed(range(7)):
+            writer.write(originals[idx], idx)
+
+    report = read_results(path, include_payloads=True)
+    assert report.results == originals
+    assert report.total_evaluations == 7
+
+    slim = read_results(path)
+    assert "resolution_payload" not in slim.results[0].metadata
+    assert slim.results[3].metadata["error"] == "boom"
+    assert slim.results[2].metadata["tags"] == ["a", "b"]
+
+
+def test_flattened_columns_are_typed(tmp_path) -> None:
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "results.parquet"
+    with ArrowResultWriter(path, row_group_size=3) as writer:
+        for idx in range(7):
+            writer.write(_result(idx))
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    schema = parquet.schema_arrow
+    assert schema.field("total_latency").type == pa.float64()
+    assert schema.field("resolution_payload.outcome").type == pa.string()
+    assert schema.field("tags").type == pa.list_(pa.string())
+
+
+@pytest.mark.asyncio
+async def test_runner_streams_results_to_writer(tmp_path) -> None:
+    reference_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    dataset = BacktestDataset(
+        items=[
+            BacktestInstance(
+                question=ForecastQuestion(id=f"q{i}", title=f"Question {i}"),
+                resolution=ForecastResolution(question_id=f"q{i}", outcome="yes"),
+                reference_time=reference_time,
+            )
+            for i in range(5)
+        ]
+    )
+    path = tmp_path / "run.parquet"
+    with ArrowResultWriter(path, row_group_size=2) as writer:
+        report = await BacktestRunner(orchestrator=ConstantOrchestrator(), result_writer=writer).run(dataset)
+
+    loaded = read_results(path)
+    assert [r.subject_id for r in loaded.results] == [r.subject_id for r in report.results]
+    assert loaded.mean_score == pytest.approx(report.mean_score)
@@ -0,0 +1,102 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+
+import pytest
+from xrtm.data import ForecastQuestion
+from xrtm.eval import EvaluationResult
+from xrtm.eval.core.schemas import ForecastResolution
+
+from xrtm.train import Backtester, BacktestRunner, ResultJournal
+from xrtm.train.simulation.journal import item_fingerprint
+from xrtm.train.simulation.runner import BacktestDataset, BacktestInstance
+
+
+@pytest.mark.asyncio
+async def test_runner_resumes_from_journal_and_retries_failed_items(tmp_path, make_dataset, stub_orchestrator):
+    journal = ResultJournal(tmp_path / "run" / "journal.jsonl")
+    first = stub_orchestrator(probability=0.7, fail_ids=("q2",))
+    first_report = await BacktestRunner(orchestrator=first, journal=journal).run(make_dataset(4))
+    assert first_report.results[2].metadata["error"] == "boom"
+
+    second = stub_orchestrator(probability=0.7)
+    report = await BacktestRunner(orchestrator=second, journal=journal).run(make_dataset(4))
+
+    assert second.calls == ["q2"]
+    assert [result.subject_id for result in report.results] == ["q0", "q1", "q2", "q3"]
+    assert report.mean_score == pytest.approx(0.09)
+    assert sorted(key.split("#")[0] for key in journal.load()) == [f"q{i}@2026-01-01T00:00:00+00:00" for i in range(4)]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_items_with_different_resolutions_resume_separately(tmp_path, stub_orchestrator):
+    journal = ResultJournal(tmp_path / "journal.jsonl")
+    reference_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    dataset = BacktestDataset(
+        items=[
+            BacktestInstance(
+                question=ForecastQuestion(id="q1", title="Question 1"),
+                resolution=ForecastResolution(question_id="q1", outcome=outcome),
+                reference_time=reference_time,
+            )
+            for outcome in ("yes", "no")
+        ]
+    )
+    first = await BacktestRunner(orchestrator=stub_orchestrator(probability=0.7), journal=journal).run(dataset)
+
+    orchestrator = stub_orchestrator(probability=0.7)
+    resumed = await BacktestRunner(orchestrator=orchestrator, journal=journal).run(dataset)
+
+    assert orchestrator.calls == []
+    assert [result.score for result in resumed.results] == pytest.approx([0.09, 0.49])
+    assert [result.score for result in resumed.results] == [result.score for result in first.results]
+    assert [result.ground_truth for result in resumed.results] == [1.0, 0.0]
+
+
+def test_journal_skips_truncated_trailing_entry(tmp_path):
+    journal = ResultJournal(tmp_path / "journal.jsonl")
+    journal.append("q1", EvaluationResult(subject_id="q1", score=0.1, ground_truth=1.0, prediction=0.7))
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"key": "q2", "result": {"subj')
+
+    assert list(journal.load()) == ["q1"]
+
+
+@pytest.mark.asyncio
+async def test_backtester_skips_journaled_questions(tmp_path):
+    journal = ResultJournal(tmp_path / "journal.jsonl")
+    dataset = [
+        (ForecastQuestion(id=f"q{i}", title=f"Question {i}"), ForecastResolution(question_id=f"q{i}", outcome="yes"))
+        for i in range(2)
+    ]
+    key = ResultJournal.key("q0", content=item_fingerprint(*dataset[0]))
+    journal.append(key, EvaluationResult(subject_id="q0", score=0.25, ground_truth="yes", prediction=0.5))
+    asked: list[str] = []
+
+    class Agent:
+        async def run(self, question):
+            asked.append(question.id)
+            return 0.8
+
+    class Evaluator:
+        def evaluate(self, prediction, ground_truth, subject_id):
+            return EvaluationResult(subject_id=subject_id, score=0.04, ground_truth=ground_truth, prediction=prediction)
+
+    report = await Backtester(agent=Agent(), evaluator=Evaluator(), journal=journal).run(dataset)
+
+    assert asked == ["q1"]
+    assert [result.score for result in report.results] == [0.25, 0.04]
+    assert len(journal.load()) == 2
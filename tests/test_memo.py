@@ -0,0 +1,111 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+
+import pytest
+from xrtm.data import ForecastQuestion
+from xrtm.eval.core.schemas import ForecastResolution
+from xrtm.forecast.core.orchestrator import Orchestrator
+
+from xrtm.train.simulation.cache import PredictionCache
+from xrtm.train.simulation.memo import NodeMemo
+from xrtm.train.simulation.runner import BacktestDataset, BacktestInstance, BacktestRunner
+
+
+def _orchestrator(probability: float, ingestion_calls: list[str], reason_calls: list[str]) -> Orchestrator:
+    async def ingestion(state, on_progress=None):
+        ingestion_calls.append(state.subject_id)
+        state.context["documents"] = [f"news about {state.subject_id}"]
+        return "reason"
+
+    async def reason(state, on_progress=None):
+        reason_calls.append(state.subject_id)
+        assert state.context["documents"] == [f"news about {state.subject_id}"]
+        state.node_reports["final"] = {"probability": probability}
+        return None
+
+    orchestrator = Orchestrator()
+    orchestrator.add_node("ingestion", ingestion)
+    orchestrator.add_node("reason", reason)
+    return orchestrator
+
+
+def _dataset() -> BacktestDataset:
+    return BacktestDataset(
+        items=[
+            BacktestInstance(
+                question=ForecastQuestion(id=f"q{i}", title=f"Question {i}"),
+                resolution=ForecastResolution(question_id=f"q{i}", outcome="yes"),
+                reference_time=datetime(2026, month, 1, tzinfo=timezone.utc),
+            )
+            for i in range(2)
+            for month in (1, 2)
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_node_memo_shares_ingestion_across_arms():
+    memo = NodeMemo(["ingestion"], fingerprint="news-index-v1")
+    ingestion_calls: list[str] = []
+    reason_calls: list[str] = []
+
+    reports = []
+    for probability in (0.8, 0.6):
+        orchestrator = _orchestrator(probability, ingestion_calls, reason_calls)
+        runner = BacktestRunner(orchestrator=orchestrator, node_memo=memo)
+        reports.append(await runner.run(_dataset()))
+
+    assert len(ingestion_calls) == 4
+    assert len(reason_calls) == 8
+    assert [report.mean_score for report in reports] == pytest.approx([0.04, 0.16])
+    assert reports[0].summary_statistics["node_memo_hits"] == 0
+    assert reports[0].summary_statistics["node_memo_misses"] == 4
+    assert reports[1].summary_statistics["node_memo_hits"] == 4
+    assert reports[1].summary_statistics["node_memo_misses"] == 0
+    assert memo.metrics() == {"node_memo_hits": 4.0, "node_memo_misses": 4.0}
+
+
+@pytest.mark.asyncio
+async def test_node_memo_persists_in_prediction_cache(tmp_path):
+    ingestion_calls: list[str] = []
+    reason_calls: list[str] = []
+    for _ in range(2):
+        memo = NodeMemo(["ingestion"], cache=PredictionCache(tmp_path))
+        runner = BacktestRunner(orchestrator=_orchestrator(0.8, ingestion_calls, reason_calls), node_memo=memo)
+        report = await runner.run(_dataset())
+        assert report.mean_score == pytest.approx(0.04)
+
+    assert len(ingestion_calls) == 4
+    assert memo.metrics() == {"node_memo_hits": 4.0, "node_memo_misses": 0.0}
+
+    changed = NodeMemo(["ingestion"], fingerprint="news-index-v2", cache=PredictionCache(tmp_path))
+    await BacktestRunner(orchestrator=_orchestrator(0.8, ingestion_calls, reason_calls), node_memo=changed).run(
+        _dataset()
+    )
+    assert len(ingestion_calls) == 8
+
+
+def test_node_memo_install_is_idempotent_and_checks_node_names():
+    orchestrator = _orchestrator(0.8, [], [])
+    memo = NodeMemo(["ingestion"])
+    memo.install(orchestrator)
+    wrapped = orchestrator.nodes["ingestion"]
+    memo.install(orchestrator)
+    assert orchestrator.nodes["ingestion"] is wrapped
+
+    with pytest.raises(ValueError, match="retrieval"):
+        NodeMemo(["retrieval"]).install(orchestrator)
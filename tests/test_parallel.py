@@ -0,0 +1,108 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+from xrtm.train.simulation.bootstrap import Bootstrap
+from xrtm.train.simulation.concurrency import AdaptiveConcurrency
+from xrtm.train.simulation.export import ArrowResultWriter, read_results
+from xrtm.train.simulation.parallel import ProcessPoolBacktestRunner
+from xrtm.train.simulation.payloads import PayloadStore
+from xrtm.train.simulation.runner import BacktestDataset, BacktestRunner
+from xrtm.train.simulation.scheduling import LatencyHistory
+from xrtm.train.simulation.stopping import EarlyStopping
+from xrtm.train.simulation.tracing import Tracer
+
+
+class PidOrchestrator:
+    async def run(self, state, entry_node="ingestion", **kwargs):
+        index = int(state.subject_id[1:])
+        state.node_reports["final"] = {"probability": (index % 10) / 10, "pid": os.getpid()}
+        return state
+
+
+def make_orchestrator() -> PidOrchestrator:
+    return PidOrchestrator()
+
+
+def _outcome(i: int) -> str:
+    return "yes" if i % 3 else "no"
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runner_matches_single_process_report_in_input_order(make_dataset):
+    dataset = make_dataset(25, outcome=_outcome)
+
+    report = await ProcessPoolBacktestRunner(make_orchestrator, processes=2, chunk_size=4, concurrency=3).run(dataset)
+    expected = await BacktestRunner(orchestrator=make_orchestrator()).run(dataset)
+
+    assert [result.subject_id for result in report.results] == [f"q{i}" for i in range(25)]
+    assert report.mean_score == pytest.approx(expected.mean_score)
+    assert report.summary_statistics["ece"] == pytest.approx(expected.summary_statistics["ece"])
+    assert [b.count for b in report.reliability_bins] == [b.count for b in expected.reliability_bins]
+    assert os.getpid() not in {result.metadata["prediction_payload"]["pid"] for result in report.results}
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runner_handles_empty_dataset():
+    report = await ProcessPoolBacktestRunner(make_orchestrator, processes=2).run(BacktestDataset(items=[]))
+
+    assert report.total_evaluations == 0
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runner_applies_run_level_options_to_the_merged_report(make_dataset):
+    dataset = make_dataset(12, outcome=_outcome)
+    bootstrap = Bootstrap(resamples=100)
+
+    report = await ProcessPoolBacktestRunner(
+        make_orchestrator, processes=2, chunk_size=4, bootstrap=bootstrap, adaptive_concurrency=AdaptiveConcurrency()
+    ).run(dataset)
+    expected = await BacktestRunner(orchestrator=make_orchestrator(), bootstrap=bootstrap).run(dataset)
+
+    assert report.summary_statistics["mean_score_ci_lower"] == pytest.approx(
+        expected.summary_statistics["mean_score_ci_lower"]
+    )
+    assert report.summary_statistics["concurrency_limit"] == 5
+
+
+@pytest.mark.parametrize(
+    "name, make_option",
+    [
+        ("early_stopping", lambda tmp_path: EarlyStopping(precision=0.01)),
+        ("latency_history", lambda tmp_path: LatencyHistory(tmp_path / "latency.json")),
+        ("payload_store", lambda tmp_path: PayloadStore(tmp_path / "payloads.jsonl")),
+        ("tracer", lambda tmp_path: Tracer()),
+    ],
+)
+def test_process_pool_runner_rejects_options_that_need_shared_state(tmp_path, name, make_option):
+    with pytest.raises(ValueError, match=name):
+        ProcessPoolBacktestRunner(make_orchestrator, **{name: make_option(tmp_path)})
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runner_writes_merged_results_from_the_parent(tmp_path, make_dataset):
+    pytest.importorskip("pyarrow")
+    dataset = make_dataset(10, outcome=_outcome)
+    path = tmp_path / "results.parquet"
+
+    with ArrowResultWriter(path, row_group_size=3) as writer:
+        report = await ProcessPoolBacktestRunner(make_orchestrator, processes=2, result_writer=writer).run(dataset)
+
+    loaded = read_results(path)
+    assert [result.subject_id for result in loaded.results] == [f"q{i}" for i in range(10)]
+    assert loaded.mean_score == pytest.approx(report.mean_score)
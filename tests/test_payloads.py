@@ -0,0 +1,87 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+from xrtm.data import ForecastOutput, ForecastQuestion
+from xrtm.eval.core.schemas import ForecastResolution
+from xrtm.eval.kit.eval.metrics import BrierScoreEvaluator
+
+from xrtm.train import Backtester
+from xrtm.train.simulation.journal import ResultJournal
+from xrtm.train.simulation.payloads import PayloadStore
+from xrtm.train.simulation.runner import BacktestRunner
+
+LONG_REASONING = "long reasoning " * 100
+
+
+@pytest.mark.asyncio
+async def test_runner_spills_payloads_and_restores_them(tmp_path, make_dataset, stub_orchestrator):
+    expected = await BacktestRunner(orchestrator=stub_orchestrator(reasoning=LONG_REASONING)).run(make_dataset(4))
+    with PayloadStore(tmp_path / "payloads.jsonl") as store:
+        report = await BacktestRunner(
+            orchestrator=stub_orchestrator(reasoning=LONG_REASONING), payload_store=store
+        ).run(make_dataset(4))
+
+        assert store.spilled == 4
+        for result, original in zip(report.results, expected.results):
+            assert set(result.metadata) == set(original.metadata) - {"prediction_payload", "resolution_payload"} | {
+                "payload_ref"
+            }
+            assert result.score == original.score
+            restored = store.restore(result)
+            assert restored.metadata["prediction_payload"]["reasoning_trace"]["narrative"].startswith("long reasoning")
+            assert restored.metadata["resolution_payload"]["forecast_request_id"] == result.subject_id
+            assert "payload_ref" in result.metadata
+
+        original = expected.results[0]
+        spilled = store.spill(original.model_copy(deep=True))
+        assert store.restore(spilled).model_dump(mode="json") == original.model_dump(mode="json")
+
+
+@pytest.mark.asyncio
+async def test_spilled_references_survive_resumed_runs(tmp_path, make_dataset, stub_orchestrator):
+    journal = ResultJournal(tmp_path / "journal.jsonl")
+    with PayloadStore(tmp_path / "payloads.jsonl") as store:
+        await BacktestRunner(
+            orchestrator=stub_orchestrator(reasoning=LONG_REASONING), journal=journal, payload_store=store
+        ).run(make_dataset(2))
+    assert "payload_ref" in next(iter(journal.load().values())).metadata
+
+    orchestrator = stub_orchestrator(reasoning=LONG_REASONING)
+    with PayloadStore(tmp_path / "payloads.jsonl") as store:
+        report = await BacktestRunner(orchestrator=orchestrator, journal=journal, payload_store=store).run(
+            make_dataset(4)
+        )
+        restored = [store.restore(result) for result in report.results]
+
+    assert len(orchestrator.calls) == 2
+    assert [result.metadata["prediction_payload"]["question_id"] for result in restored] == ["q0", "q1", "q2", "q3"]
+
+
+@pytest.mark.asyncio
+async def test_backtester_spills_payloads(tmp_path):
+    class Agent:
+        async def run(self, question):
+            return ForecastOutput(question_id=question.id, probability=0.8, reasoning="trace")
+
+    pairs = [(ForecastQuestion(id="q0", title="Question 0"), ForecastResolution(question_id="q0", outcome="yes"))]
+    store = PayloadStore(tmp_path / "payloads.jsonl")
+    report = await Backtester(agent=Agent(), evaluator=BrierScoreEvaluator(), payload_store=store).run(pairs)
+    store.close()
+
+    result = report.results[0]
+    assert "prediction_payload" not in result.metadata
+    assert store.load(result.metadata["payload_ref"])["prediction_payload"]["question_id"] == "q0"
@@ -0,0 +1,81 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+
+import pytest
+from xrtm.data import ForecastQuestion
+from xrtm.eval.core.schemas import ForecastResolution
+from xrtm.eval.kit.eval.metrics import BrierScoreEvaluator
+
+from xrtm.train import Backtester
+from xrtm.train.simulation.progress import (
+    ProgressMonitor,
+    ProgressSnapshot,
+    PrometheusTextfileSink,
+    StderrProgressReporter,
+)
+from xrtm.train.simulation.runner import BacktestRunner
+
+
+@pytest.mark.asyncio
+async def test_runner_reports_progress_periodically_and_at_the_end(make_dataset, stub_orchestrator):
+    snapshots: list[ProgressSnapshot] = []
+    monitor = ProgressMonitor([snapshots.append], interval=0.01)
+
+    await BacktestRunner(
+        orchestrator=stub_orchestrator(delay=0.02, fail_ids=("q3",)), concurrency=2, progress=monitor
+    ).run(make_dataset(8))
+
+    assert len(snapshots) > 2
+    assert any(snapshot.in_flight == 2 for snapshot in snapshots[:-1])
+    assert all(not snapshot.finished for snapshot in snapshots[:-1])
+    final = snapshots[-1]
+    assert final.finished
+    assert (final.completed, final.total, final.errors, final.in_flight) == (8, 8, 1, 0)
+    assert final.error_rate == pytest.approx(1 / 8)
+    assert final.eta_seconds == 0.0
+    assert final.items_per_second > 0
+
+
+@pytest.mark.asyncio
+async def test_backtester_reports_progress_to_stderr_and_prometheus(tmp_path):
+    class Agent:
+        async def run(self, question):
+            return 0.8
+
+    stream = io.StringIO()
+    path = tmp_path / "metrics" / "backtest.prom"
+    monitor = ProgressMonitor(
+        [StderrProgressReporter(stream), PrometheusTextfileSink(path, labels={"arm": 'gpt "mini"'})], interval=60
+    )
+    pairs = [
+        (ForecastQuestion(id=f"q{i}", title=f"Question {i}"), ForecastResolution(question_id=f"q{i}", outcome="yes"))
+        for i in range(3)
+    ]
+
+    await Backtester(agent=Agent(), evaluator=BrierScoreEvaluator(), progress=monitor).run(pairs)
+
+    assert stream.getvalue().startswith("[backtest] 3/3 done, 0 in flight, ")
+    assert stream.getvalue().rstrip().endswith("(finished)")
+    metrics = path.read_text()
+    assert 'xrtm_backtest_items_completed{arm="gpt \\"mini\\""} 3.0' in metrics
+    assert "# TYPE xrtm_backtest_error_rate gauge" in metrics
+    assert not path.with_name("backtest.prom.tmp").exists()
+
+
+def test_progress_monitor_rejects_non_positive_interval():
+    with pytest.raises(ValueError):
+        ProgressMonitor([], interval=0)
@@ -0,0 +1,103 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from xrtm.data import ForecastQuestion
+from xrtm.eval import EvaluationResult
+from xrtm.eval.core.schemas import ForecastResolution
+
+from xrtm.train import Backtester
+from xrtm.train.simulation.retry import RetryPolicy, is_transient_error
+from xrtm.train.simulation.runner import BacktestRunner
+
+
+class FlakyOrchestrator:
+    def __init__(self, failures: dict[str, list[Exception]]) -> None:
+        self.failures = failures
+        self.calls: dict[str, int] = {}
+
+    async def run(self, state, entry_node="ingestion", **kwargs):
+        self.calls[state.subject_id] = self.calls.get(state.subject_id, 0) + 1
+        pending = self.failures.get(state.subject_id)
+        if pending:
+            raise pending.pop(0)
+        state.node_reports["final"] = {"probability": 0.9}
+        return state
+
+
+def test_retry_policy_backoff_grows_exponentially_within_bounds():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.5, seed=7)
+
+    delays = [policy.delay(attempt) for attempt in range(1, 6)]
+
+    assert 0.5 <= delays[0] <= 1.0
+    assert 1.0 <= delays[1] <= 2.0
+    assert all(2.5 <= delay <= 5.0 for delay in delays[3:])
+
+
+def test_default_classification_separates_transient_and_fatal_errors():
+    class RateLimited(Exception):
+        status_code = 429
+
+    assert is_transient_error(TimeoutError())
+    assert is_transient_error(RateLimited())
+    assert not is_transient_error(ValueError("bad schema"))
+
+
+@pytest.mark.asyncio
+async def test_runner_retries_transient_failures_and_records_attempts(make_dataset):
+    orchestrator = FlakyOrchestrator(
+        {
+            "q0": [TimeoutError("slow"), ConnectionError("reset")],
+            "q1": [ValueError("fatal")],
+            "q2": [TimeoutError("slow")] * 3,
+        }
+    )
+    runner = BacktestRunner(orchestrator=orchestrator, retry_policy=RetryPolicy(max_attempts=3, base_delay=0.0))
+
+    report = await runner.run(make_dataset(3))
+
+    ok, fatal, exhausted = report.results
+    assert "error" not in ok.metadata
+    assert ok.metadata["attempts"] == 3
+    assert ok.score == pytest.approx(0.01)
+    assert fatal.metadata["attempts"] == 1
+    assert fatal.metadata["retryable"] is False
+    assert exhausted.metadata["attempts"] == 3
+    assert exhausted.metadata["retryable"] is True
+    assert orchestrator.calls == {"q0": 3, "q1": 1, "q2": 3}
+
+
+@pytest.mark.asyncio
+async def test_backtester_retries_transient_agent_failures():
+    failures = [ConnectionError("reset")]
+
+    class Agent:
+        async def run(self, question):
+            if failures:
+                raise failures.pop()
+            return 0.8
+
+    class Evaluator:
+        def evaluate(self, prediction, ground_truth, subject_id):
+            return EvaluationResult(subject_id=subject_id, score=0.04, ground_truth=ground_truth, prediction=prediction)
+
+    dataset = [(ForecastQuestion(id="q1", title="Question 1"), ForecastResolution(question_id="q1", outcome="yes"))]
+    backtester = Backtester(agent=Agent(), evaluator=Evaluator(), retry_policy=RetryPolicy(base_delay=0.0))
+
+    report = await backtester.run(dataset)
+
+    assert report.results[0].score == 0.04
+    assert report.results[0].metadata["attempts"] == 2
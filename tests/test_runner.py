@@ -14,14 +14,19 @@
 # limitations under the License.
 
 import asyncio
+import gc
+import weakref
 from datetime import datetime, timezone
 
 import pytest
 from pydantic import ValidationError
 from xrtm.data import ForecastOutput, ForecastQuestion
+from xrtm.eval import EvaluationResult
 from xrtm.eval.core.schemas import ForecastResolution
+from xrtm.eval.kit.eval.metrics import BrierScoreEvaluator, LogScoreEvaluator
 from xrtm.forecast.core.schemas.graph import BaseGraphState
 
+from xrtm.train.simulation import runner as runner_module
 from xrtm.train.simulation.runner import BacktestDataset, BacktestInstance, BacktestRunner
 
 
@@ -102,6 +107,78 @@ async def test_backtest_runner_failed_items_do_not_leak_none_into_report():
     assert report.reliability_bins is not None
 
 
+@pytest.mark.asyncio
+async def test_backtest_runner_stream_yields_results_with_running_aggregates():
+    delays = {"q0": 0.03, "q1": 0.001, "q2": 0.01}
+    runner = BacktestRunner(orchestrator=TrackingOrchestrator(fail_id="q2", delays=delays), concurrency=3)
+
+    events = [progress async for progress in runner.stream(_dataset(3))]
+
+    assert [event.index for event in events] == [1, 2, 0]
+    assert [event.completed for event in events] == [1, 2, 3]
+    assert events[-1].total == 3
+    assert events[-1].error_count == 1
+    assert events[-1].mean_score == pytest.approx((0.04 + 1.0 + 0.04) / 3)
+
+
+@pytest.mark.asyncio
+async def test_backtest_runner_accepts_lazy_async_source_of_mappings():
+    pulled = 0
+
+    async def source():
+        nonlocal pulled
+        for item in _dataset(6).items:
+            pulled += 1
+            yield item.model_dump()
+
+    runner = BacktestRunner(orchestrator=TrackingOrchestrator(), concurrency=2, queue_size=1)
+    stream = runner.stream(source())
+    first = await anext(stream)
+    await stream.aclose()
+
+    assert first.total is None
+    assert pulled < 6
+
+    report = await runner.run(source())
+
+    assert [result.subject_id for result in report.results] == [f"q{i}" for i in range(6)]
+
+
+@pytest.mark.asyncio
+async def test_backtest_runner_scores_timed_out_items_as_failures():
+    orchestrator = TrackingOrchestrator(delays={"q1": 1.0})
+    runner = BacktestRunner(orchestrator=orchestrator, concurrency=3, item_timeout=0.05)
+
+    report = await runner.run(_dataset(3))
+
+    assert "exceeded item_timeout" in report.results[1].metadata["error"]
+    assert "error" not in report.results[0].metadata
+
+
+@pytest.mark.asyncio
+async def test_backtest_runner_hedges_stragglers_after_queue_drains():
+    class StragglerOrchestrator(TrackingOrchestrator):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls: dict[str, int] = {}
+
+        async def run(self, state, entry_node="ingestion", **kwargs):
+            attempt = self.calls.get(state.subject_id, 0)
+            self.calls[state.subject_id] = attempt + 1
+            self.delays = {"q5": 5.0 if attempt == 0 else 0.01}
+            return await super().run(state, entry_node, **kwargs)
+
+    orchestrator = StragglerOrchestrator()
+    runner = BacktestRunner(orchestrator=orchestrator, concurrency=2, hedge_percentile=0.9, hedge_min_samples=3)
+
+    report = await asyncio.wait_for(runner.run(_dataset(6)), timeout=2.0)
+
+    assert orchestrator.calls["q5"] == 2
+    assert report.results[5].metadata["hedged"] is True
+    assert report.results[5].metadata["hedge_won"] is True
+    assert "hedged" not in report.results[0].metadata
+
+
 def test_backtest_instance_validates_resolution_question_id() -> None:
     with pytest.raises(ValidationError, match="does not match forecast request"):
         BacktestInstance(
@@ -151,3 +228,103 @@ def test_backtest_runner_rejects_unrecognized_outcome_strings() -> None:
             ForecastResolution(question_id="q1", outcome="pending"),
             "q1",
         )
+
+
+@pytest.mark.asyncio
+async def test_backtest_runner_deduplicates_identical_work_items():
+    class CountingOrchestrator:
+        def __init__(self) -> None:
+            self.calls: dict[str, int] = {}
+
+        async def run(self, state, entry_node="ingestion", **kwargs):
+            self.calls[state.subject_id] = self.calls.get(state.subject_id, 0) + 1
+            await asyncio.sleep(0.01)
+            state.node_reports["final"] = {"probability": 0.8}
+            return state
+
+    reference_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    question = ForecastQuestion(id="q1", title="Question 1")
+    items = [
+        BacktestInstance(
+            question=question,
+            resolution=ForecastResolution(question_id="q1", outcome=outcome),
+            reference_time=reference_time,
+        )
+        for outcome in ("yes", "no", "yes")
+    ]
+    items.append(
+        BacktestInstance(
+            question=ForecastQuestion(id="q1", title="Question 1 (edited)"),
+            resolution=ForecastResolution(question_id="q1", outcome="yes"),
+            reference_time=reference_time,
+        )
+    )
+    orchestrator = CountingOrchestrator()
+
+    report = await BacktestRunner(orchestrator=orchestrator, concurrency=4, deduplicate=True).run(
+        BacktestDataset(items=items)
+    )
+
+    assert orchestrator.calls == {"q1": 2}
+    assert [r.score for r in report.results] == pytest.approx([0.04, 0.64, 0.04, 0.04])
+    assert sum(1 for r in report.results if r.metadata.get("deduplicated")) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lazy", [False, True])
+async def test_deduplication_releases_finished_states(lazy, monkeypatch):
+    monkeypatch.setattr(runner_module, "_SETTLED_FLIGHTS", 8)
+    states: list[weakref.ref[BaseGraphState]] = []
+
+    class RecordingOrchestrator:
+        async def run(self, state, entry_node="ingestion", **kwargs):
+            states.append(weakref.ref(state))
+            state.node_reports["final"] = {"probability": 0.8}
+            return state
+
+    items = [item for pair in zip(_dataset(50).items, _dataset(50).items) for item in pair]
+    runner = BacktestRunner(orchestrator=RecordingOrchestrator(), concurrency=4, deduplicate=True)
+    held = []
+    async for progress in runner.stream(iter(items) if lazy else items):
+        if progress.completed % 10 == 0:
+            gc.collect()
+            held.append(sum(1 for ref in states if ref() is not None))
+
+    assert len(states) == 50
+    # Materialized sources drop a flight after its last copy; lazy ones keep a bounded window.
+    assert max(held) <= (8 + 4 if lazy else 8)
+
+
+@pytest.mark.asyncio
+async def test_backtest_runner_scores_every_metric_in_one_pass():
+    class AbsoluteError:
+        name = "Absolute Error"
+
+        def score(self, prediction, ground_truth):
+            return abs(prediction - ground_truth)
+
+        def evaluate(self, prediction, ground_truth, subject_id):
+            return EvaluationResult(
+                subject_id=subject_id,
+                score=self.score(prediction, ground_truth),
+                ground_truth=ground_truth,
+                prediction=prediction,
+            )
+
+    orchestrator = TrackingOrchestrator(fail_id="q2")
+    runner = BacktestRunner(
+        orchestrator=orchestrator, evaluator=[BrierScoreEvaluator(), LogScoreEvaluator(), AbsoluteError()]
+    )
+
+    report = await runner.run(_dataset(4))
+
+    assert report.mean_score == pytest.approx((3 * 0.04 + 1.0) / 4)
+    assert report.results[0].metadata["scores"] == pytest.approx(
+        {"Brier Score": 0.04, "Log Score": 0.2231435513, "Absolute Error": 0.2}
+    )
+    assert set(report.metric_reports) == {"Brier Score", "Log Score", "Absolute Error"}
+    assert report.metric_reports["Absolute Error"].mean_score == pytest.approx((3 * 0.2 + 1.0) / 4)
+    assert report.results[2].metadata["scores"] == {"Brier Score": 1.0, "Log Score": 1.0, "Absolute Error": 1.0}
+    for metric_report in report.metric_reports.values():
+        assert metric_report.total_evaluations == report.total_evaluations == 4
+    assert report.metric_reports["Brier Score"].mean_score == pytest.approx(report.mean_score)
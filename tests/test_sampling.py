@@ -0,0 +1,101 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import Counter
+
+import pytest
+from xrtm.eval.kit.eval.metrics import BrierScoreEvaluator, LogScoreEvaluator
+
+from xrtm.train.simulation.bootstrap import Bootstrap
+from xrtm.train.simulation.runner import BacktestDataset, BacktestRunner
+from xrtm.train.simulation.sampling import StratifiedSampler, stratum_key
+
+
+class TagOrchestrator:
+    async def run(self, state, entry_node="ingestion", **kwargs):
+        probability = 0.9 if state.subject_id.startswith("econ") else 0.4
+        state.node_reports["final"] = {"probability": probability}
+        return state
+
+
+def _corpus(make_dataset) -> BacktestDataset:
+    strata = [
+        make_dataset(size, prefix=tag, outcome=lambda i: "yes" if i % 2 else "no", tags=lambda i, tag=tag: [tag])
+        for tag, size in (("econ", 80), ("sports", 20))
+    ]
+    return BacktestDataset(items=[item for dataset in strata for item in dataset.items])
+
+
+def test_sampler_allocates_proportionally_and_weights_by_inverse_inclusion(make_dataset):
+    sample = StratifiedSampler(fraction=0.1, by_outcome=True, seed=3).sample(_corpus(make_dataset))
+
+    strata = Counter(instance.sample_stratum for instance in sample.items)
+    assert strata == {"econ|0": 4, "econ|1": 4, "sports|0": 2, "sports|1": 2}
+    assert {instance.sample_weight for instance in sample.items if instance.tags == ["econ"]} == {10.0}
+    assert {instance.sample_weight for instance in sample.items if instance.tags == ["sports"]} == {5.0}
+    assert sum(instance.sample_weight or 0 for instance in sample.items) == 100
+    assert stratum_key(sample.items[0], by_outcome=True) == sample.items[0].sample_stratum
+    again = StratifiedSampler(fraction=0.1, by_outcome=True, seed=3).sample(_corpus(make_dataset))
+    assert [instance.question.id for instance in again.items] == [instance.question.id for instance in sample.items]
+
+
+def test_sample_size_targets_standard_error():
+    sampler = StratifiedSampler(target_std_error=0.05, score_std=0.25)
+    assert sampler.sample_size(10_000) == 25
+    assert sampler.sample_size(25) < 25
+    assert StratifiedSampler(target_std_error=0.001).sample_size(40) == 40
+    with pytest.raises(ValueError):
+        StratifiedSampler()
+    with pytest.raises(ValueError):
+        StratifiedSampler(target_std_error=0.05, fraction=0.1)
+
+
+@pytest.mark.asyncio
+async def test_weighted_report_estimates_full_corpus_means(make_dataset):
+    dataset = _corpus(make_dataset)
+    full = await BacktestRunner(orchestrator=TagOrchestrator()).run(dataset)
+    # The per-stratum minimum oversamples the sports strata, so the sample is not self-weighting.
+    sample = StratifiedSampler(fraction=0.1, by_outcome=True, min_per_stratum=5, seed=1).sample(dataset)
+    report = await BacktestRunner(orchestrator=TagOrchestrator()).run(sample)
+
+    assert report.total_evaluations == 20
+    assert report.results[0].metadata["sample_weight"] == pytest.approx(8.0)
+    # Scores are constant within each (tag, outcome) stratum, so the weighted
+    # estimates match the full run exactly while the unweighted mean does not.
+    assert report.mean_score == pytest.approx(full.mean_score)
+    assert report.summary_statistics["weight_total"] == pytest.approx(100)
+    assert report.summary_statistics["mean_score_se"] == pytest.approx(0.0)
+    assert report.summary_statistics["unweighted_mean_score"] != pytest.approx(full.mean_score)
+    for tag in ("econ", "sports"):
+        assert report.slices[tag].mean_score == pytest.approx(full.slices[tag].mean_score)
+
+
+@pytest.mark.asyncio
+async def test_weighted_report_weights_metric_reports_and_bootstrap(make_dataset):
+    dataset = _corpus(make_dataset)
+    evaluators = [BrierScoreEvaluator(), LogScoreEvaluator()]
+    full = await BacktestRunner(orchestrator=TagOrchestrator(), evaluator=evaluators).run(dataset)
+    sample = StratifiedSampler(fraction=0.1, by_outcome=True, min_per_stratum=5, seed=1).sample(dataset)
+    runner = BacktestRunner(orchestrator=TagOrchestrator(), evaluator=evaluators, bootstrap=Bootstrap(resamples=200))
+    report = await runner.run(sample)
+
+    assert set(report.metric_reports) == {"Brier Score", "Log Score"}
+    for metric, metric_report in report.metric_reports.items():
+        assert metric_report.mean_score == pytest.approx(full.metric_reports[metric].mean_score)
+        assert metric_report.summary_statistics["weight_total"] == pytest.approx(100)
+    stats = report.summary_statistics
+    assert stats["mean_score_ci_lower"] <= full.mean_score <= stats["mean_score_ci_upper"]
+    midpoint = (stats["mean_score_ci_lower"] + stats["mean_score_ci_upper"]) / 2
+    assert abs(midpoint - full.mean_score) < abs(midpoint - stats["unweighted_mean_score"])
@@ -0,0 +1,79 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+
+import pytest
+from xrtm.data import ForecastQuestion
+from xrtm.eval.core.schemas import ForecastResolution
+
+from xrtm.train.simulation.runner import BacktestDataset, BacktestInstance, BacktestRunner
+from xrtm.train.simulation.scheduling import LatencyHistory, longest_expected_first
+
+
+def test_latency_history_estimates_fall_back_from_question_to_tags_to_length(tmp_path):
+    history = LatencyHistory(tmp_path / "history.json", smoothing=0.5)
+    known = ForecastQuestion(id="known", title="x" * 10)
+    history.record(known, 4.0, tags=["politics"])
+    history.record(known, 2.0, tags=["politics"])
+    history.save()
+
+    reloaded = LatencyHistory(tmp_path / "history.json")
+
+    assert reloaded.estimate(known) == pytest.approx(3.0)
+    assert reloaded.estimate(ForecastQuestion(id="new", title="y"), tags=["politics"]) == pytest.approx(3.0)
+    assert reloaded.estimate(ForecastQuestion(id="new", title="y" * 20)) == pytest.approx(20 * 0.3)
+    assert LatencyHistory().estimate(ForecastQuestion(id="new", title="abc", content="de")) == 5.0
+
+
+def test_longest_expected_first_orders_by_descending_cost_and_is_stable():
+    questions = [ForecastQuestion(id=f"q{i}", title="t" * length) for i, length in enumerate([3, 9, 3, 5])]
+
+    assert longest_expected_first(questions, LatencyHistory()) == [1, 3, 0, 2]
+
+
+class RecordingOrchestrator:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def run(self, state, entry_node="ingestion", **kwargs):
+        self.calls.append(state.subject_id)
+        state.node_reports["final"] = {"probability": 0.5}
+        state.latencies["final"] = float(state.subject_id[1:])
+        return state
+
+
+@pytest.mark.asyncio
+async def test_runner_dispatches_longest_expected_first_and_reports_in_input_order(tmp_path):
+    history = LatencyHistory(tmp_path / "history.json")
+    history.questions = {"q0": 1.0, "q1": 9.0, "q2": 5.0}
+    dataset = BacktestDataset(
+        items=[
+            BacktestInstance(
+                question=ForecastQuestion(id=f"q{i}", title=f"Question {i}"),
+                resolution=ForecastResolution(question_id=f"q{i}", outcome="yes"),
+                reference_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            )
+            for i in range(3)
+        ]
+    )
+    orchestrator = RecordingOrchestrator()
+    runner = BacktestRunner(orchestrator=orchestrator, concurrency=1, schedule="longest_first", latency_history=history)
+
+    report = await runner.run(dataset)
+
+    assert orchestrator.calls == ["q1", "q2", "q0"]
+    assert [result.subject_id for result in report.results] == ["q0", "q1", "q2"]
+    assert LatencyHistory(tmp_path / "history.json").questions["q1"] == pytest.approx(0.7 * 9.0 + 0.3 * 1.0)
@@ -0,0 +1,86 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from xrtm.eval import EvaluationResult
+from xrtm.eval.kit.eval.metrics import BrierScoreEvaluator, LogScoreEvaluator
+from xrtm.forecast.core.orchestrator import Orchestrator
+
+from xrtm.train.simulation.runner import BacktestRunner
+from xrtm.train.simulation.scoring import evaluate_batch, rescore_results
+
+
+@pytest.mark.parametrize("evaluator", [BrierScoreEvaluator(), LogScoreEvaluator()])
+def test_evaluate_batch_matches_per_item(evaluator) -> None:
+    predictions = [0.0, 0.25, 0.5, 0.9, 1.0, "0.3"]
+    outcomes = [0, 1, True, "yes", 1.0, "no"]
+    ids = [f"q{i}" for i in range(len(predictions))]
+
+    batched = evaluate_batch(evaluator, predictions, outcomes, ids)
+    expected = [evaluator.evaluate(p, o, s) for p, o, s in zip(predictions, outcomes, ids)]
+
+    assert [r.score for r in batched] == pytest.approx([r.score for r in expected])
+    assert [r.metadata for r in batched] == [r.metadata for r in expected]
+    assert [r.prediction for r in batched] == predictions
+
+
+def test_evaluate_batch_raises_like_per_item_for_invalid_rows() -> None:
+    with pytest.raises(ValueError, match="finite probability"):
+        evaluate_batch(BrierScoreEvaluator(), [0.5, 1.5], [1, 0], ["a", "b"])
+
+
+def test_evaluate_batch_falls_back_for_custom_evaluators() -> None:
+    class AbsoluteError:
+        def score(self, prediction, ground_truth):
+            return abs(prediction - ground_truth)
+
+        def evaluate(self, prediction, ground_truth, subject_id):
+            return EvaluationResult(
+                subject_id=subject_id,
+                score=self.score(prediction, ground_truth),
+                ground_truth=ground_truth,
+                prediction=prediction,
+            )
+
+    results = evaluate_batch(AbsoluteError(), [0.2, 0.7], [1, 0], ["a", "b"])
+    assert [r.score for r in results] == pytest.approx([0.8, 0.7])
+
+
+def test_rescore_keeps_errors_and_metadata() -> None:
+    results = [
+        EvaluationResult(subject_id="a", score=0.01, ground_truth=1, prediction=0.9, metadata={"tags": ["x"]}),
+        EvaluationResult(subject_id="b", score=1.0, ground_truth=None, prediction=None, metadata={"error": "boom"}),
+    ]
+
+    rescored = rescore_results(results, LogScoreEvaluator())
+    assert rescored[0].metadata == {"tags": ["x"], "metric": "Log Score"}
+    assert rescored[1] is results[1]
+
+    report = BacktestRunner(orchestrator=Orchestrator()).rescore(results)
+    assert report.total_evaluations == 2
+    assert report.metric_name == "Brier Score"
+    assert report.results[0].score == pytest.approx(0.01)
+    assert BacktestRunner(orchestrator=Orchestrator()).rescore(results, LogScoreEvaluator()).metric_name == "Log Score"
+
+
+@pytest.mark.asyncio
+async def test_report_is_labelled_with_the_primary_evaluator_metric(make_dataset, stub_orchestrator) -> None:
+    runner = BacktestRunner(orchestrator=stub_orchestrator(), evaluator=[LogScoreEvaluator(), BrierScoreEvaluator()])
+
+    report = await runner.run(make_dataset(3))
+
+    assert report.metric_name == "Log Score"
+    assert report.mean_score == pytest.approx(report.metric_reports["Log Score"].mean_score)
+    assert runner.build_report(report.results).metric_name == "Log Score"
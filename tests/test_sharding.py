@@ -0,0 +1,127 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from xrtm.train.simulation.aggregation import BacktestReport, merge_reports
+from xrtm.train.simulation.runner import BacktestRunner
+from xrtm.train.simulation.sharding import Shard, shard_of
+
+
+class TagOrchestrator:
+    async def run(self, state, entry_node="ingestion", **kwargs):
+        number = int(state.subject_id[1:])
+        state.latencies["forecast"] = 0.01 * (number % 7 + 1)
+        state.node_reports["final"] = {"probability": (number % 10) / 10 + 0.05}
+        return state
+
+
+def _outcome(i: int) -> str:
+    return "yes" if i % 3 else "no"
+
+
+def _tags(i: int) -> list[str]:
+    return ["econ" if i % 2 else "sports"]
+
+
+def test_shard_assignment_is_stable_and_partitions_ids():
+    ids = [f"q{i}" for i in range(200)]
+    shards = [Shard(i, 4) for i in range(4)]
+    assert all(sum(shard.contains(qid) for shard in shards) == 1 for qid in ids)
+    assert all(sum(shard.contains(qid) for qid in ids) > 20 for shard in shards)
+    # Pinned so that a change of hash function, which would reshuffle running jobs, is noticed.
+    assert [shard_of(qid, 4) for qid in ids[:8]] == [1, 0, 2, 1, 0, 0, 3, 2]
+    assert Shard.parse("2/4") == shards[2]
+    assert str(shards[2]) == "2/4"
+    for spec in ("4/4", "1", "a/b", "-1/4"):
+        with pytest.raises(ValueError):
+            Shard.parse(spec)
+
+
+@pytest.mark.asyncio
+async def test_merged_shard_reports_match_single_node_run(make_dataset):
+    dataset = make_dataset(60, outcome=_outcome, tags=_tags)
+    single = await BacktestRunner(orchestrator=TagOrchestrator()).run(dataset)
+
+    shard_reports = []
+    for index in range(3):
+        report = await BacktestRunner(orchestrator=TagOrchestrator(), shard=Shard(index, 3)).run(dataset)
+        assert report.metadata["shard"] == f"{index}/3"
+        # Shard reports travel between machines as JSON.
+        shard_reports.append(BacktestReport.model_validate_json(report.model_dump_json()))
+    assert sum(report.total_evaluations for report in shard_reports) == 60
+
+    merged = merge_reports(shard_reports)
+
+    assert merged.metadata["shards"] == ["0/3", "1/3", "2/3"]
+    assert merged.total_evaluations == single.total_evaluations
+    assert merged.mean_score == pytest.approx(single.mean_score)
+    assert merged.summary_statistics == pytest.approx(single.summary_statistics)
+    assert [b.count for b in merged.reliability_bins] == [b.count for b in single.reliability_bins]
+    for merged_bin, single_bin in zip(merged.reliability_bins, single.reliability_bins):
+        assert merged_bin.mean_prediction == pytest.approx(single_bin.mean_prediction)
+        assert merged_bin.mean_ground_truth == pytest.approx(single_bin.mean_ground_truth)
+    assert [result.subject_id for result in merged.results] == [result.subject_id for result in single.results]
+    assert merged.slices.keys() == single.slices.keys()
+    for tag, merged_slice in merged.slices.items():
+        assert merged_slice.mean_score == pytest.approx(single.slices[tag].mean_score)
+        assert [result.subject_id for result in merged_slice.results] == [
+            result.subject_id for result in single.slices[tag].results
+        ]
+    assert merged.latency["forecast"] == pytest.approx(single.latency["forecast"])
+
+
+@pytest.mark.asyncio
+async def test_columnar_shard_reports_survive_json_and_merge(make_dataset):
+    dataset = make_dataset(30, outcome=_outcome, tags=_tags)
+    single = await BacktestRunner(orchestrator=TagOrchestrator(), columnar_results=True).run(dataset)
+
+    shard_reports = []
+    for index in range(2):
+        runner = BacktestRunner(orchestrator=TagOrchestrator(), columnar_results=True, shard=Shard(index, 2))
+        report = await runner.run(dataset)
+        assert report.results == []
+        shard_reports.append(BacktestReport.model_validate_json(report.model_dump_json()))
+
+    merged = merge_reports(shard_reports)
+
+    assert merged.total_evaluations == 30
+    assert merged.mean_score == pytest.approx(single.mean_score)
+    assert merged.columns is not None
+    assert [result.subject_id for result in merged.columns] == [result.subject_id for result in single.columns]
+    assert merged.columns[3].metadata == single.columns[3].metadata
+
+
+@pytest.mark.asyncio
+async def test_lazy_sources_keep_dataset_positions(make_dataset):
+    dataset = make_dataset(20, outcome=_outcome, tags=_tags)
+    shard = Shard(1, 2)
+    runner = BacktestRunner(orchestrator=TagOrchestrator(), shard=shard)
+
+    indices = {progress.index: progress.result.subject_id async for progress in runner.stream(iter(dataset.items))}
+
+    assert indices == {i: f"q{i}" for i in range(20) if shard.contains(f"q{i}")}
+
+
+@pytest.mark.asyncio
+async def test_merge_reports_rejects_overlapping_or_stateless_reports(make_dataset):
+    dataset = make_dataset(10, outcome=_outcome, tags=_tags)
+    report = await BacktestRunner(orchestrator=TagOrchestrator(), shard=Shard(0, 2)).run(dataset)
+    with pytest.raises(ValueError, match="overlapping"):
+        merge_reports([report, report])
+    with pytest.raises(ValueError, match="aggregate state"):
+        merge_reports([await BacktestRunner(orchestrator=TagOrchestrator()).run(dataset)])
+    with pytest.raises(ValueError):
+        merge_reports([])
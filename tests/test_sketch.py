@@ -0,0 +1,120 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+from datetime import datetime, timezone
+
+import pytest
+from xrtm.data import ForecastQuestion
+from xrtm.eval.core.schemas import ForecastResolution
+from xrtm.forecast.core.orchestrator import Orchestrator
+
+from xrtm.train.simulation.runner import BacktestDataset, BacktestInstance, BacktestRunner
+from xrtm.train.simulation.sketch import LatencySketch
+
+
+def _exact_quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_sketch_quantiles_are_within_relative_accuracy() -> None:
+    rng = random.Random(7)
+    values = [rng.lognormvariate(0.0, 1.5) for _ in range(5000)]
+    sketch = LatencySketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.update(value)
+
+    for q in (0.0, 0.5, 0.9, 0.99, 1.0):
+        assert sketch.quantile(q) == pytest.approx(_exact_quantile(values, q), rel=0.01)
+    summary = sketch.summary()
+    assert summary["count"] == 5000
+    assert summary["max"] == max(values)
+    assert summary["mean"] == pytest.approx(sum(values) / len(values))
+    assert len(sketch.buckets) < 2000
+
+
+def test_merged_sketches_match_single_sketch() -> None:
+    rng = random.Random(11)
+    values = [rng.expovariate(5.0) for _ in range(1000)] + [0.0, 0.0]
+    whole = LatencySketch()
+    shards = [LatencySketch(), LatencySketch()]
+    for idx, value in enumerate(values):
+        whole.update(value)
+        shards[idx % 2].update(value)
+    merged = LatencySketch()
+    for shard in shards:
+        merged.merge(shard)
+
+    assert merged.buckets == whole.buckets
+    assert merged.summary() == pytest.approx(whole.summary())
+    assert merged.quantile(0.0) == 0.0
+
+    with pytest.raises(ValueError):
+        merged.merge(LatencySketch(relative_accuracy=0.05))
+
+
+def test_empty_sketch_and_invalid_values() -> None:
+    sketch = LatencySketch()
+    sketch.update(float("nan"))
+    sketch.update(-1.0)
+    assert sketch.count == 0
+    assert sketch.quantile(0.5) is None
+    assert sketch.summary() == {}
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+
+
+@pytest.mark.asyncio
+async def test_runner_times_each_node_of_a_real_orchestrator() -> None:
+    # Nodes run under ``freeze_time``, which also freezes the event loop clock, so they block instead of sleeping.
+    async def ingestion(state, report_progress):
+        time.sleep(0.02)
+        return "forecast"
+
+    async def forecast(state, report_progress):
+        time.sleep(0.06)
+        return {"probability": 0.7}
+
+    orchestrator = Orchestrator()
+    orchestrator.add_node("ingestion", ingestion)
+    orchestrator.add_node("forecast", forecast)
+    orchestrator.set_entry_point("ingestion")
+    dataset = BacktestDataset(
+        items=[
+            BacktestInstance(
+                question=ForecastQuestion(id=f"q{i}", title=f"Question {i}"),
+                resolution=ForecastResolution(question_id=f"q{i}", outcome="yes"),
+                reference_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            )
+            for i in range(2)
+        ]
+    )
+    runner = BacktestRunner(orchestrator=orchestrator, concurrency=1)
+
+    report = await runner.run(dataset)
+    rerun = await runner.run(dataset)
+
+    assert set(report.latency) == {"ingestion", "forecast", "total_graph"}
+    assert report.latency["ingestion"]["count"] == 2
+    assert 0.02 <= report.latency["ingestion"]["p50"] < report.latency["forecast"]["p50"]
+    assert report.latency["forecast"]["mean"] == pytest.approx(0.06, rel=0.5)
+    result = report.results[0]
+    assert result.metadata["total_latency"] == result.metadata["node_latencies"]["total_graph"]
+    # Each run times the nodes afresh and hands the orchestrator back untouched.
+    assert rerun.latency["forecast"]["count"] == 2
+    assert orchestrator.nodes["ingestion"] is ingestion
+    assert orchestrator.nodes["forecast"] is forecast
@@ -0,0 +1,95 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import statistics
+from datetime import datetime, timezone
+
+import pytest
+from xrtm.data import ForecastQuestion
+from xrtm.eval.core.schemas import ForecastResolution
+
+from xrtm.train.simulation.moments import RunningMoments
+from xrtm.train.simulation.runner import BacktestDataset, BacktestInstance, BacktestRunner
+from xrtm.train.simulation.stopping import EarlyStopping
+
+
+def test_running_moments_match_batch_statistics_and_merge_exactly():
+    rng = random.Random(3)
+    values = [rng.random() for _ in range(50)]
+    left, right, full = RunningMoments(), RunningMoments(), RunningMoments()
+    for value in values[:20]:
+        left.update(value)
+    for value in values[20:]:
+        right.update(value)
+    for value in values:
+        full.update(value)
+    left.merge(right)
+
+    assert full.mean == pytest.approx(statistics.fmean(values))
+    assert full.variance == pytest.approx(statistics.variance(values))
+    assert left.count == 50
+    assert left.mean == pytest.approx(full.mean)
+    assert left.variance == pytest.approx(full.variance)
+
+
+def test_early_stopping_rules():
+    moments = RunningMoments()
+    for value in [0.01, 0.04] * 10:
+        moments.update(value)
+
+    assert EarlyStopping(precision=0.1, min_items=30).check(moments) is None
+    assert EarlyStopping(precision=0.1, min_items=10).check(moments) == "precision_reached"
+    assert EarlyStopping(baseline=0.25, min_items=10).check(moments) == "below_baseline"
+    assert EarlyStopping(baseline=0.0, min_items=10).check(moments) == "above_baseline"
+    assert EarlyStopping(baseline=0.025, min_items=10).check(moments) is None
+
+
+class AlternatingOrchestrator:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def run(self, state, entry_node="ingestion", **kwargs):
+        self.calls += 1
+        state.node_reports["final"] = {"probability": 0.9 if int(state.subject_id[1:]) % 2 else 0.8}
+        return state
+
+
+@pytest.mark.asyncio
+async def test_runner_stops_dispatching_once_rule_is_met_and_flags_report():
+    dataset = BacktestDataset(
+        items=[
+            BacktestInstance(
+                question=ForecastQuestion(id=f"q{i}", title=f"Question {i}"),
+                resolution=ForecastResolution(question_id=f"q{i}", outcome="yes"),
+                reference_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            )
+            for i in range(200)
+        ]
+    )
+    orchestrator = AlternatingOrchestrator()
+    runner = BacktestRunner(
+        orchestrator=orchestrator,
+        concurrency=2,
+        early_stopping=EarlyStopping(baseline=0.25, min_items=10),
+    )
+
+    report = await runner.run(dataset)
+
+    assert 10 <= report.total_evaluations <= 12
+    assert orchestrator.calls == report.total_evaluations
+    assert report.metadata == {"early_stopped": True, "stop_reason": "below_baseline"}
+    assert report.summary_statistics["mean_score_ci_half_width"] > 0
+    assert [result.subject_id for result in report.results] == [f"q{i}" for i in range(report.total_evaluations)]
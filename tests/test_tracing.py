@@ -0,0 +1,138 @@
+# coding=utf-8
+# Copyright 2026 XRTM Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from xrtm.data import ForecastOutput, ForecastQuestion
+from xrtm.eval.core.schemas import ForecastResolution
+from xrtm.eval.kit.eval.metrics import BrierScoreEvaluator
+from xrtm.forecast.core.schemas.graph import BaseGraphState, TemporalContext
+
+from xrtm.train import Backtester
+from xrtm.train.simulation.replayer import TraceReplayer
+from xrtm.train.simulation.runner import BacktestRunner
+from xrtm.train.simulation.tracing import ChromeTraceExporter, JsonlSpanExporter, Span, Tracer
+
+
+class ListExporter:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_runner_spans_nest_per_item_and_record_errors(make_dataset, stub_orchestrator):
+    exporter = ListExporter()
+    await BacktestRunner(
+        orchestrator=stub_orchestrator(delay=0.01, fail_ids=("q1",)), concurrency=3, tracer=Tracer([exporter])
+    ).run(make_dataset(3))
+
+    items = {span.subject_id: span for span in exporter.spans if span.name == "item"}
+    assert set(items) == {"q0", "q1", "q2"}
+    for subject_id, item in items.items():
+        children = [span for span in exporter.spans if span.parent_id == item.span_id]
+        assert all(span.trace_id == item.trace_id for span in children)
+        assert all(span.duration <= item.duration for span in children)
+        names = [span.name for span in children]
+        assert names[:2] == ["validate_instance", "orchestrator_run"]
+        if subject_id == "q1":
+            assert "score" not in names
+            assert children[1].error == "RuntimeError: boom"
+        else:
+            assert names[2:] == ["validate_resolution", "serialize_payloads", "score"]
+            assert children[1].duration >= 0.01
+            assert all(span.subject_id == subject_id for span in children[1:])
+
+
+@pytest.mark.asyncio
+async def test_exporters_write_jsonl_and_chrome_trace(tmp_path):
+    class Agent:
+        async def run(self, question):
+            return 0.8
+
+    tracer = Tracer([JsonlSpanExporter(tmp_path / "spans.jsonl"), ChromeTraceExporter(tmp_path / "trace.json")])
+    pairs = [
+        (ForecastQuestion(id=f"q{i}", title=f"Question {i}"), ForecastResolution(question_id=f"q{i}", outcome="yes"))
+        for i in range(2)
+    ]
+    await Backtester(agent=Agent(), evaluator=BrierScoreEvaluator(), tracer=tracer).run(pairs)
+    tracer.close()
+
+    spans = [Span.model_validate_json(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+    assert sorted(span.name for span in spans if span.subject_id == "q0") == [
+        "agent_run",
+        "item",
+        "score",
+        "serialize_payloads",
+        "validate_resolution",
+    ]
+    events = json.loads((tmp_path / "trace.json").read_text())
+    assert len(events) == len(spans)
+    assert {event["ph"] for event in events} == {"X"}
+    assert len({event["tid"] for event in events}) == 2
+
+
+def test_replayer_spans_cover_trace_loading_and_scoring(tmp_path):
+    path = tmp_path / "trace.json"
+    TraceReplayer.save_execution_trace(
+        BaseGraphState(
+            subject_id="q1",
+            temporal_context=TemporalContext(reference_time=datetime(2026, 1, 1, tzinfo=timezone.utc)),
+            node_reports={"final": ForecastOutput(question_id="q1", probability=0.8, reasoning="test")},
+        ),
+        str(path),
+    )
+    exporter = ListExporter()
+    TraceReplayer(tracer=Tracer([exporter])).replay_evaluation(str(path), "yes")
+
+    assert [span.name for span in exporter.spans] == [
+        "load_trace",
+        "validate_resolution",
+        "serialize_payloads",
+        "score",
+        "replay",
+    ]
+    assert all(span.subject_id == "q1" for span in exporter.spans[1:])
+    assert len({span.trace_id for span in exporter.spans}) == 1
+
+
+def test_saving_a_trace_records_a_span(tmp_path):
+    path = tmp_path / "trace.json"
+    exporter = ListExporter()
+    state = BaseGraphState(
+        subject_id="q1", node_reports={"final": ForecastOutput(question_id="q1", probability=0.8, reasoning="test")}
+    )
+
+    TraceReplayer.save_execution_trace(state, str(path), tracer=Tracer([exporter]))
+
+    (span,) = exporter.spans
+    assert span.name == "save_trace"
+    assert span.subject_id == "q1"
+    assert span.attributes == {"trace_path": str(path)}
+    assert TraceReplayer.load_execution_trace(str(path)).subject_id == "q1"
+
+
+def test_tracer_without_exporters_records_nothing():
+    tracer = Tracer()
+    with tracer.span("item", "q1") as span:
+        assert span is None
+    assert not tracer.enabled